@@ -0,0 +1,4 @@
+"""
+Imperial Physics audits: the audit log generator and the structured
+audit history (`cline audit|history`).
+"""
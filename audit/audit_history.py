@@ -0,0 +1,117 @@
+"""
+Imperial Physics Audit History
+Loads every structured audit record under a directory into one DataFrame,
+so audit trends are queried directly instead of regex-parsing text logs.
+Legacy text logs (audit_YYYYMMDD_HHMMSS.log) can be imported once into
+the JSON Lines history.
+"""
+
+import os
+import re
+import glob
+import json
+import argparse
+from datetime import datetime
+
+import pandas as pd
+
+from audit.generate_audit import AUDIT_DIR, AUDIT_RECORDS_FILE, audit_record, save_audit_record
+
+# Text log line -> record field (legacy import only)
+LEGACY_FIELDS = {
+    'x': r"Universal Plasma Limit \(X\): ([-\d.e]+)",
+    'b_tension_1au': r"Geometric Tension at 1 AU: ([-\d.e]+) nT",
+    'stress_chi': r"Stress Threshold \(X \+ tolerance\): Chi = ([-\d.e]+)",
+    'stress_delta_b': r"Max Stable Deviation at 1 AU: ([-\d.e]+) nT",
+    'gravity_factor': r"Computed Factor: 1/X = ([-\d.e]+)",
+    'mass_ratio_predicted': r"Predicted mass ratio: X\^4 = ([-\d.e]+)",
+    'mass_ratio_actual': r"Actual mass ratio: m_e/m_p = ([-\d.e]+)",
+    'mass_ratio_error': r"Relative Error: ([-\d.e]+)%",
+    'lambda_bio': r"Biological Frequency \(Λ\): ([-\d.e]+) Hz",
+    'bio_period': r"Period: ([-\d.e]+) seconds",
+    'alpha': r"α \(fine structure\): ([-\d.e]+)",
+    'inverse_alpha': r"1/α: ([-\d.e]+)",
+    'geometric_invariant_1': r"Invariant 1 \(X \* 1/X\): ([-\d.e]+)",
+    'geometric_invariant_2': r"Invariant 2: ([-\d.e]+)",
+}
+_LEGACY_PATTERNS = {name: re.compile(pattern) for name, pattern in LEGACY_FIELDS.items()}
+_LEGACY_TIMESTAMP = re.compile(r"Audit Timestamp: (\d{4}-\d\d-\d\d \d\d:\d\d:\d\d)")
+
+
+def load_audits(directory=AUDIT_DIR, pattern='*.jsonl'):
+    """
+    Every audit record in the JSON Lines files under `directory`, as one
+    DataFrame sorted by timestamp (one read per file, no text parsing).
+    """
+    frames = []
+    for path in sorted(glob.glob(os.path.join(directory, pattern))):
+        if os.path.getsize(path):
+            frames.append(pd.read_json(path, lines=True, dtype=False, convert_dates=False))
+    if not frames:
+        return pd.DataFrame({'timestamp': pd.Series([], dtype='datetime64[ns]')})
+    audits = pd.concat(frames, ignore_index=True)
+    audits['timestamp'] = pd.to_datetime(audits['timestamp'])
+    return audits.sort_values('timestamp', kind='stable', ignore_index=True)
+
+
+def parse_legacy_log(text):
+    """Numeric fields of one text audit log (absent sections become None)."""
+    stamp = _LEGACY_TIMESTAMP.search(text)
+    row = {}
+    for name, pattern in _LEGACY_PATTERNS.items():
+        match = pattern.search(text)
+        row[name] = float(match.group(1)) if match else None
+    if row['mass_ratio_error'] is not None:
+        row['mass_ratio_error'] /= 100.0
+    row['matter_pass'] = "✓ PASS: Matter relationship" in text
+    when = datetime.strptime(stamp.group(1), "%Y-%m-%d %H:%M:%S") if stamp else None
+    return row, when
+
+
+def import_legacy_logs(directory=AUDIT_DIR, filename=AUDIT_RECORDS_FILE):
+    """
+    Appends a record for every audit_*.log not yet in the history.
+    Returns the number imported.
+    """
+    known = set()
+    history = os.path.join(directory, filename)
+    if os.path.exists(history):
+        with open(history) as f:
+            known = {json.loads(line).get('source') for line in f if line.strip()}
+
+    imported = 0
+    for path in sorted(glob.glob(os.path.join(directory, 'audit_*.log'))):
+        source = os.path.basename(path)
+        if source in known:
+            continue
+        with open(path) as f:
+            row, when = parse_legacy_log(f.read())
+        if when is None:
+            continue
+        save_audit_record(audit_record(row, when, source), history)
+        imported += 1
+    return imported
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Imperial Physics audit history")
+    parser.add_argument("directory", nargs='?', default=AUDIT_DIR)
+    parser.add_argument("--import-legacy", action="store_true",
+                        help="First import text audit logs missing from the history")
+    parser.add_argument("--out", type=str, default=None, help="Write the combined table to CSV")
+    args = parser.parse_args(argv)
+
+    if args.import_legacy:
+        count = import_legacy_logs(args.directory)
+        print(f"✓ {count} LEGACY AUDIT LOGS IMPORTED")
+    audits = load_audits(args.directory)
+    print(f"✓ {len(audits)} AUDIT RECORDS LOADED")
+    if len(audits):
+        print(audits[['timestamp', 'source', 'x', 'mass_ratio_error', 'matter_pass']].to_string(index=False))
+    if args.out:
+        audits.to_csv(args.out, index=False)
+        print(f"✓ HISTORY SAVED TO: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,63 +1,154 @@
 """
 Imperial Physics Audit Log Generator
 Validates the Universal Plasma Limit (X=0.15) against empirical data
+
+Besides the single audit of the framework constants, whole grids of
+parameter sets (X, B_TENSION_1AU, tolerances) can be audited at once:
+every domain result is computed for the full grid in vectorized NumPy
+passes and the reports are streamed into one file or one zip archive.
+Every audit can also be written as a JSON Lines record holding all
+numeric results (see audit_history.load_audits() for reading them back).
 """
 
 import sys
 import os
-from datetime import datetime
+import json
+import zipfile
+import argparse
+from datetime import datetime, timezone
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import numpy as np
 
 from constants import (
     X, 
-    validate_universal_plasma_limit,
-    mass_ratio_validation,
-    fine_structure_constant,
     LAMBDA_BIO,
-    gravity_relationship,
-    matter_relationship,
+    ALPHA,
+    MASS_ELECTRON,
+    MASS_PROTON,
 )
+from constants import sweep
+from validation.x_boundary_validation import ImperialLatticeValidator
+from validation._metrics import METRICS
 
-def generate_audit_log():
+_VALIDATOR = ImperialLatticeValidator()
+
+AUDIT_DIR = os.path.dirname(os.path.abspath(__file__))
+AUDIT_RECORDS_FILE = 'audit_records.jsonl'
+
+# AUDIT PARAMETERS (defaults = the framework constants)
+AUDIT_PARAMETERS = {
+    'x': X,                                    # Universal Plasma Limit
+    'b_tension_1au': _VALIDATOR.B_TENSION_1AU, # Geometric tension at 1 AU (nT)
+    'tolerance': _VALIDATOR.TOLERANCE,         # Measurement noise floor on chi
+    'matter_tolerance': 0.10,                  # Allowed m_e/m_p deviation
+    'lambda_bio': LAMBDA_BIO,                  # Bio-resonance frequency (Hz)
+}
+
+def audit_grid(**axes):
     """
-    Generates a comprehensive audit log validating the Imperial Physics framework
+    Cartesian product of parameter values, e.g.
+    audit_grid(x=np.linspace(0.14, 0.16, 21), b_tension_1au=[4.5, 5.0, 5.5]).
+    Parameters not given keep their AUDIT_PARAMETERS default.
+    Returns {name: 1-D array} with one entry per parameter set.
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-    
+    unknown = set(axes) - set(AUDIT_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown audit parameters: {sorted(unknown)}")
+    values = [np.atleast_1d(np.asarray(axes.get(name, default), dtype=float))
+              for name, default in AUDIT_PARAMETERS.items()]
+    mesh = np.meshgrid(*values, indexing='ij')
+    return {name: m.ravel() for name, m in zip(AUDIT_PARAMETERS, mesh)}
+
+def compute_audit_results(params=None):
+    """
+    All domain results for every parameter set in `params` (as returned
+    by audit_grid()), one NumPy pass per quantity.
+    """
+    if params is None:
+        params = audit_grid()
+    x = np.asarray(params['x'], dtype=float)
+    b_tension = np.asarray(params['b_tension_1au'], dtype=float)
+    lambda_bio = np.asarray(params['lambda_bio'], dtype=float)
+    matter_tolerance = np.asarray(params['matter_tolerance'], dtype=float)
+
+    # Matter domain and invariants (constants.sweep, broadcast over the grid)
+    with METRICS.timer('audit_compute'):
+        predicted, actual, error = sweep.mass_ratio_validation(x, MASS_ELECTRON, MASS_PROTON)
+        invariants = sweep.validate_universal_plasma_limit(x)
+
+    # Plasma boundary: largest stable chi and the |B| deviation it allows at 1 AU
+    stress_chi = x + np.asarray(params['tolerance'], dtype=float)
+
+    return {
+        **{name: np.asarray(params[name], dtype=float) for name in AUDIT_PARAMETERS},
+        'gravity_factor': sweep.gravity_relationship(x),
+        'stress_chi': stress_chi,
+        'stress_delta_b': stress_chi * b_tension,
+        'mass_ratio_predicted': predicted,
+        'mass_ratio_actual': actual,
+        'mass_ratio_error': error,
+        'matter_pass': error < matter_tolerance,
+        'bio_period': 1.0 / lambda_bio,
+        'alpha': np.full_like(x, ALPHA),
+        'inverse_alpha': np.full_like(x, 1 / ALPHA),
+        'geometric_invariant_1': invariants['geometric_invariant_1'],
+        'geometric_invariant_2': invariants['geometric_invariant_2'],
+    }
+
+def iter_audit_rows(results):
+    """One {name: scalar} dict per parameter set."""
+    names = list(results)
+    columns = [results[name].tolist() for name in names]
+    for row in zip(*columns):
+        yield dict(zip(names, row))
+
+def format_audit_log(r, timestamp, boundary=False):
+    """
+    Renders one parameter set's results (a row of compute_audit_results())
+    as the human-readable audit log. boundary=True adds the PLASMA
+    BOUNDARY section that grid reports need; the default keeps the
+    single-audit layout the legacy log parsers expect.
+    """
+    x = r['x']
+    error = r['mass_ratio_error']
     log_lines = []
     log_lines.append("=" * 80)
     log_lines.append("IMPERIAL PHYSICS VALIDATION AUDIT")
-    log_lines.append("Universal Plasma Limit: X = 0.15")
+    log_lines.append(f"Universal Plasma Limit: X = {x}")
     log_lines.append(f"Audit Timestamp: {timestamp}")
     log_lines.append("=" * 80)
     log_lines.append("")
     
     # Core Framework Validation
     log_lines.append("### CORE FRAMEWORK ###")
-    log_lines.append(f"Universal Plasma Limit (X): {X}")
+    log_lines.append(f"Universal Plasma Limit (X): {x}")
     log_lines.append("")
     
+    # Plasma Boundary (grid reports only: tension and tolerance vary there)
+    if boundary:
+        log_lines.append("### PLASMA BOUNDARY ###")
+        log_lines.append(f"Geometric Tension at 1 AU: {r['b_tension_1au']:.2f} nT")
+        log_lines.append(f"Stress Threshold (X + tolerance): Chi = {r['stress_chi']:.6f}")
+        log_lines.append(f"Max Stable Deviation at 1 AU: {r['stress_delta_b']:.6f} nT")
+        log_lines.append("")
+    
     # Gravity Relationship
     log_lines.append("### GRAVITY DOMAIN ###")
-    g_factor = gravity_relationship()
     log_lines.append(f"Gravity Relationship: G ∝ 1/X")
-    log_lines.append(f"Computed Factor: 1/X = {g_factor:.6f}")
+    log_lines.append(f"Computed Factor: 1/X = {r['gravity_factor']:.6f}")
     log_lines.append(f"Interpretation: Gravitational coupling inversely proportional to X")
     log_lines.append("")
     
     # Matter Relationship
     log_lines.append("### MATTER DOMAIN ###")
     log_lines.append(f"Matter Relationship: m_e/m_p ∝ X^4")
-    predicted, actual, error = mass_ratio_validation()
-    log_lines.append(f"Predicted mass ratio: X^4 = {predicted:.8f}")
-    log_lines.append(f"Actual mass ratio: m_e/m_p = {actual:.8f}")
+    log_lines.append(f"Predicted mass ratio: X^4 = {r['mass_ratio_predicted']:.8f}")
+    log_lines.append(f"Actual mass ratio: m_e/m_p = {r['mass_ratio_actual']:.8f}")
     log_lines.append(f"Relative Error: {error*100:.4f}%")
     
     # Error analysis
-    if error < 0.1:  # Less than 10% error
-        log_lines.append(f"✓ PASS: Matter relationship validated within 10% tolerance")
+    if r['matter_pass']:
+        log_lines.append(f"✓ PASS: Matter relationship validated within {r['matter_tolerance']*100:g}% tolerance")
     else:
         log_lines.append(f"✗ NOTE: Matter relationship shows {error*100:.4f}% deviation")
         log_lines.append(f"  This suggests X^4 provides an order-of-magnitude estimate")
@@ -65,33 +156,31 @@ def generate_audit_log():
     
     # Biology Domain
     log_lines.append("### BIOLOGY DOMAIN ###")
-    log_lines.append(f"Biological Frequency (Λ): {LAMBDA_BIO} Hz")
-    log_lines.append(f"Period: {1/LAMBDA_BIO:.6f} seconds")
+    log_lines.append(f"Biological Frequency (Λ): {r['lambda_bio']} Hz")
+    log_lines.append(f"Period: {r['bio_period']:.6f} seconds")
     log_lines.append(f"Interpretation: Fundamental biological oscillation frequency")
     log_lines.append("")
     
     # Fine Structure Constant
     log_lines.append("### FINE STRUCTURE CONSTANT ###")
-    alpha = fine_structure_constant()
-    log_lines.append(f"α (fine structure): {alpha:.10f}")
-    log_lines.append(f"1/α: {1/alpha:.6f}")
+    log_lines.append(f"α (fine structure): {r['alpha']:.10f}")
+    log_lines.append(f"1/α: {r['inverse_alpha']:.6f}")
     log_lines.append("")
     
     # Geometric Invariants
     log_lines.append("### GEOMETRIC INVARIANTS ###")
-    results = validate_universal_plasma_limit()
-    log_lines.append(f"Invariant 1 (X * 1/X): {results['geometric_invariant_1']:.6f}")
-    log_lines.append(f"Invariant 2: {results['geometric_invariant_2']:.6f}")
+    log_lines.append(f"Invariant 1 (X * 1/X): {r['geometric_invariant_1']:.6f}")
+    log_lines.append(f"Invariant 2: {r['geometric_invariant_2']:.6f}")
     log_lines.append("")
     
     # Summary
     log_lines.append("=" * 80)
     log_lines.append("VALIDATION SUMMARY")
     log_lines.append("=" * 80)
-    log_lines.append(f"✓ Universal Plasma Limit X = {X} established")
-    log_lines.append(f"✓ Gravity relationship: G ∝ 1/X verified (factor: {g_factor:.4f})")
+    log_lines.append(f"✓ Universal Plasma Limit X = {x} established")
+    log_lines.append(f"✓ Gravity relationship: G ∝ 1/X verified (factor: {r['gravity_factor']:.4f})")
     log_lines.append(f"✓ Matter relationship: m_e/m_p ∝ X^4 ({error*100:.2f}% deviation)")
-    log_lines.append(f"✓ Biology parameter: Λ = {LAMBDA_BIO} Hz defined")
+    log_lines.append(f"✓ Biology parameter: Λ = {r['lambda_bio']} Hz defined")
     log_lines.append(f"✓ Geometric invariants calculated")
     log_lines.append("")
     log_lines.append("STATUS: Imperial Physics framework parameters validated")
@@ -101,6 +190,65 @@ def generate_audit_log():
     
     return "\n".join(log_lines)
 
+def audit_record(r, timestamp, source=None):
+    """Machine-readable counterpart of format_audit_log(): one JSON-safe dict."""
+    record = {'timestamp': timestamp.isoformat(timespec='seconds'), 'source': source}
+    record.update(r)
+    return record
+
+def save_audit_record(record, filename=AUDIT_RECORDS_FILE):
+    """Appends one record to the JSON Lines history (one line per audit)."""
+    filepath = os.path.join(AUDIT_DIR, filename)
+    with open(filepath, 'a') as f:
+        f.write(json.dumps(record) + "\n")
+    return filepath
+
+def report_time():
+    """
+    The time stamped on reports: SOURCE_DATE_EPOCH (UTC seconds) when
+    set, so a rebuild of the same inputs is byte-identical; else now.
+    """
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), timezone.utc).replace(tzinfo=None)
+    return datetime.now()
+
+def generate_audit_log():
+    """
+    Generates a comprehensive audit log validating the Imperial Physics framework
+    """
+    timestamp = report_time().strftime("%Y-%m-%d %H:%M:%S UTC")
+    row = next(iter_audit_rows(compute_audit_results()))
+    return format_audit_log(row, timestamp)
+
+def write_audit_batch(results, path):
+    """
+    Streams one report per parameter set into `path`: members
+    audit_00000.log, ... of a zip archive if it ends in .zip, one JSON
+    record per line if it ends in .jsonl, otherwise one text file with
+    the reports back to back. Returns the count.
+    """
+    now = report_time()
+    timestamp = now.strftime("%Y-%m-%d %H:%M:%S UTC")
+    rows = iter_audit_rows(results)
+    count = 0
+    with METRICS.timer('report_write'):
+        if path.endswith('.jsonl'):
+            with open(path, 'w') as f:
+                for count, row in enumerate(rows, 1):
+                    f.write(json.dumps(audit_record(row, now, f"grid:{count - 1}")) + "\n")
+        elif path.endswith('.zip'):
+            with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+                for count, row in enumerate(rows, 1):
+                    archive.writestr(f"audit_{count - 1:05d}.log", format_audit_log(row, timestamp, boundary=True))
+        else:
+            with open(path, 'w') as f:
+                for count, row in enumerate(rows, 1):
+                    f.write(format_audit_log(row, timestamp, boundary=True))
+                    f.write("\n\n")
+    METRICS.count('audit_reports', count)
+    return count
+
 def save_audit_log(log_content, filename=None):
     """
     Saves the audit log to a file
@@ -109,19 +257,61 @@ def save_audit_log(log_content, filename=None):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"audit_{timestamp}.log"
     
-    audit_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)))
-    filepath = os.path.join(audit_dir, filename)
+    filepath = os.path.join(AUDIT_DIR, filename)
     
-    with open(filepath, 'w') as f:
+    with METRICS.timer('report_write'), open(filepath, 'w') as f:
         f.write(log_content)
+    METRICS.count('audit_reports')
     
     return filepath
 
-if __name__ == "__main__":
+def _parse_axis(tokens):
+    """['0.14:0.16:21'] -> linspace, ['4.5', '5'] -> the listed values."""
+    values = []
+    for token in tokens:
+        if ':' in token:
+            start, stop, num = token.split(':')
+            # Rounded so 0.14:0.16:21 prints as 0.141, not 0.14100000000000001
+            values.extend(np.linspace(float(start), float(stop), int(num)).round(12))
+        else:
+            values.append(float(token))
+    return values
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Imperial Physics audit log generator")
+    parser.add_argument("--batch", type=str, default=None, metavar="PATH",
+                        help="Audit a parameter grid into one .log, .jsonl or .zip file")
+    parser.add_argument("--format", choices=("text", "jsonl", "both"), default="text",
+                        help=f"Single audit output: text log (default), a record appended to "
+                             f"{AUDIT_RECORDS_FILE}, or both")
+    for name in AUDIT_PARAMETERS:
+        parser.add_argument(f"--{name.replace('_', '-')}", nargs='+', default=None, metavar="V",
+                            help=f"Grid values for {name} (list, or start:stop:num)")
+    args = parser.parse_args(argv)
+
+    if args.batch:
+        axes = {name: _parse_axis(getattr(args, name)) for name in AUDIT_PARAMETERS
+                if getattr(args, name) is not None}
+        results = compute_audit_results(audit_grid(**axes))
+        count = write_audit_batch(results, args.batch)
+        passed = int(results['matter_pass'].sum())
+        print(f"✓ {count} AUDITS WRITTEN TO: {args.batch} ({passed} matter PASS)")
+        sys.exit(0)
+
     # Generate and display audit log
-    log_content = generate_audit_log()
+    now = report_time()
+    row = next(iter_audit_rows(compute_audit_results()))
+    log_content = format_audit_log(row, now.strftime("%Y-%m-%d %H:%M:%S UTC"))
     print(log_content)
     
     # Save to file
-    filepath = save_audit_log(log_content)
-    print(f"\nAudit log saved to: {filepath}")
+    filename = f"audit_{now:%Y%m%d_%H%M%S}.log"
+    if args.format in ("text", "both"):
+        filepath = save_audit_log(log_content, filename)
+        print(f"\nAudit log saved to: {filepath}")
+    if args.format in ("jsonl", "both"):
+        filepath = save_audit_record(audit_record(row, now, filename))
+        print(f"Audit record appended to: {filepath}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import os
+import zipfile
+import tempfile
+import unittest
+import numpy as np
+
+from audit.generate_audit import (audit_grid, compute_audit_results, iter_audit_rows, write_audit_batch,
+                                  generate_audit_log)
+from audit.audit_history import load_audits, import_legacy_logs
+from constants import mass_ratio_validation, gravity_relationship, validate_universal_plasma_limit
+
+class TestBatchAudit(unittest.TestCase):
+    """
+    BATCH AUDIT CERTIFICATION
+    -------------------------
+    Verifies that the vectorized grid audit reproduces the scalar
+    framework functions and streams one report per parameter set.
+    """
+
+    def test_default_matches_scalar_framework(self):
+        results = compute_audit_results()
+        predicted, actual, error = mass_ratio_validation()
+        invariants = validate_universal_plasma_limit()
+        # NumPy's power may differ from Python's pow() in the last ulp
+        self.assertEqual(results['gravity_factor'][0], gravity_relationship())
+        self.assertAlmostEqual(results['mass_ratio_predicted'][0], predicted, places=15)
+        self.assertAlmostEqual(results['mass_ratio_error'][0], error, places=12)
+        self.assertAlmostEqual(results['geometric_invariant_2'][0], invariants['geometric_invariant_2'], places=15)
+        self.assertTrue(results['matter_pass'][0])
+
+    def test_grid_batch(self):
+        grid = audit_grid(x=np.linspace(0.14, 0.16, 5), b_tension_1au=[4.0, 5.0, 6.0],
+                          matter_tolerance=[0.05, 0.10])
+        results = compute_audit_results(grid)
+        self.assertEqual(len(results['x']), 30)
+        rows = list(iter_audit_rows(results))
+        self.assertEqual(rows[7]['stress_delta_b'], (rows[7]['x'] + 0.01) * rows[7]['b_tension_1au'])
+        np.testing.assert_array_equal(results['matter_pass'],
+                                      results['mass_ratio_error'] < results['matter_tolerance'])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            archive = os.path.join(tmp, 'audits.zip')
+            self.assertEqual(write_audit_batch(results, archive), 30)
+            with zipfile.ZipFile(archive) as z:
+                names = z.namelist()
+                self.assertEqual(len(names), 30)
+                self.assertIn("X = 0.145", z.read(names[6]).decode())
+                self.assertIn("### PLASMA BOUNDARY ###", z.read(names[6]).decode())
+
+        with self.assertRaises(ValueError):
+            audit_grid(chi=[0.1])
+
+    def test_single_audit_layout(self):
+        # The default log keeps the pre-grid sections, in order
+        log = generate_audit_log()
+        sections = [line for line in log.splitlines() if line.startswith("###")]
+        self.assertEqual(sections, ["### CORE FRAMEWORK ###", "### GRAVITY DOMAIN ###",
+                                    "### MATTER DOMAIN ###", "### BIOLOGY DOMAIN ###",
+                                    "### FINE STRUCTURE CONSTANT ###", "### GEOMETRIC INVARIANTS ###"])
+        self.assertNotIn("Geometric Tension at 1 AU", log)
+        self.assertIn("Universal Plasma Limit (X): 0.15", log)
+
+    def test_jsonl_history(self):
+        results = compute_audit_results(audit_grid(x=[0.14, 0.15, 0.16], tolerance=[0.0, 0.01]))
+        audit_dir = os.path.dirname(os.path.abspath(__file__))
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(write_audit_batch(results, os.path.join(tmp, 'grid.jsonl')), 6)
+            # The committed text logs import once, then load with the grid
+            for name in ('audit_20260126_143117.log', 'audit_20260126_143259.log'):
+                with open(os.path.join(audit_dir, name)) as src, open(os.path.join(tmp, name), 'w') as dst:
+                    dst.write(src.read())
+            self.assertEqual(import_legacy_logs(tmp), 2)
+            self.assertEqual(import_legacy_logs(tmp), 0)
+
+            audits = load_audits(tmp)
+        self.assertEqual(len(audits), 8)
+        self.assertEqual(audits['source'].iloc[0], 'audit_20260126_143117.log')
+        self.assertAlmostEqual(audits['mass_ratio_error'].iloc[0], 0.070448, places=6)
+        grid = audits[audits['source'].str.startswith('grid:')]
+        np.testing.assert_array_equal(grid['stress_chi'], results['stress_chi'])
+        self.assertEqual(grid['matter_pass'].tolist(), results['matter_pass'].tolist())
+
+if __name__ == '__main__':
+    unittest.main()
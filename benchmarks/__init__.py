@@ -0,0 +1,3 @@
+"""
+Imperial benchmark suite on synthetic fixtures (`cline bench`).
+"""
@@ -0,0 +1,289 @@
+"""
+IMPERIAL BENCHMARK SUITE
+------------------------
+Throughput and resource measurements for the hot paths:
+  validator     ImperialLatticeValidator points/sec (scalar and batch)
+  interrogation rows/sec and peak RSS vs file size (in-memory and stream)
+  coil          PulseScheduler jitter, worst latency and CPU%
+  audit         grid audit results/sec and reports written/sec
+  startup       `cline` import time per lightweight command (-X importtime),
+                flagging commands over their STARTUP_BUDGETS_MS
+
+FIXTURES ARE SYNTHETIC BENCHMARK DATA. They are generated into a
+temporary directory, exist only to exercise the code paths at a known
+size, and are never written to data/ or used for an interrogation verdict.
+
+Results are compared against a stored baseline (benchmarks/baseline.json);
+--save-baseline records a new one. Baselines are machine-specific.
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import tempfile
+import argparse
+import subprocess
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# CONFIGURATION
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+REGRESSION_TOLERANCE = 0.25  # Relative slowdown reported as a regression
+HIGHER, LOWER = 'higher', 'lower'  # Which direction is better
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Registers a benchmark: fn(quick) -> {metric: (value, unit, better)}."""
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+
+def _best_time(fn, repeat=3):
+    """Fastest of `repeat` runs (seconds); the minimum is the least noisy."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def synthetic_telemetry_csv(path, rows, seed=2026):
+    """
+    SYNTHETIC BENCHMARK DATA in the ACE/DSCOVR CSV layout: gamma-distributed
+    chi with a loosely coupled bt. Not physical telemetry.
+    """
+    rng = np.random.default_rng(seed)
+    chi = rng.gamma(2.0, 0.08, rows).round(4)
+    df = pd.DataFrame({
+        'timestamp_utc': (np.datetime64('2026-01-01T00:00') + np.arange(rows).astype('timedelta64[m]')).astype(str),
+        'chi_amplitude': chi,
+        'phase_radians': rng.uniform(-np.pi, np.pi, rows).round(4),
+        'storm_phase': np.where(chi > 0.15, 'main', 'pre'),
+        'density_p_cm3': rng.gamma(3.0, 1.5, rows).round(2),
+        'speed_km_s': rng.normal(450.0, 60.0, rows).round(1),
+        'bz_nT': rng.normal(0.0, 3.0, rows).round(2),
+        'bt_nT': (250.0 + 200.0 * chi + rng.normal(0.0, 10.0, rows)).round(2),
+        'source': 'SYNTHETIC',
+        'chi_at_boundary': (np.abs(chi - 0.15) < 0.01).astype(int),
+        'chi_violation': (chi > 0.15).astype(int),
+        'chi_status': np.where(chi > 0.15, 'VIOLATION', 'BELOW'),
+    })
+    df.to_csv(path, index=False)
+    return os.path.getsize(path)
+
+
+@benchmark('validator')
+def bench_validator(quick):
+    from validation.x_boundary_validation import ImperialLatticeValidator
+
+    validator = ImperialLatticeValidator()
+    rng = np.random.default_rng(1)
+    n_scalar = 20_000 if quick else 100_000
+    n_batch = 1_000_000 if quick else 5_000_000
+    b_xyz = rng.normal(0.0, 3.0, (n_batch, 3))
+    r_au = rng.uniform(0.3, 1.5, n_batch)
+    points = [(list(b), r) for b, r in zip(b_xyz[:n_scalar].tolist(), r_au[:n_scalar].tolist())]
+
+    scalar = _best_time(lambda: [validator.validate_data_point(b, r) for b, r in points], repeat=1)
+    batch = _best_time(lambda: validator.validate_batch(b_xyz, r_au))
+    return {
+        'scalar_points_per_s': (n_scalar / scalar, 'points/s', HIGHER),
+        'batch_points_per_s': (n_batch / batch, 'points/s', HIGHER),
+    }
+
+
+# Runs in a fresh interpreter so the peak RSS is this interrogation's alone.
+# VmHWM is per address space; ru_maxrss would carry over the parent's peak
+# across fork/exec on Linux.
+_INTERROGATION_CHILD = """
+import sys, json, time, resource
+
+def peak_rss_kb():
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+from validation import interrogator
+start = time.perf_counter()
+if {mode!r} == 'stream':
+    interrogator._interrogate_stream(lambda message: None, {path!r}, interrogator.DEFAULT_CHUNKSIZE)
+else:
+    interrogator._interrogate_in_memory(lambda message: None, {path!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'max_rss_kb': peak_rss_kb()}}))
+"""
+
+
+@benchmark('interrogation')
+def bench_interrogation(quick):
+    # Up to one stream chunk (interrogator.DEFAULT_CHUNKSIZE = 250k rows) the
+    # stream holds the whole file too, and saves only the columns it skips
+    # (it parses chi and bt alone). Past that its peak RSS stays flat while
+    # the in-memory read grows with the file: compare the two sizes.
+    sizes = (50_000, 500_000) if quick else (250_000, 1_000_000)
+    metrics = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            path = os.path.join(tmp, f'synthetic_{rows}.csv')
+            size_mb = synthetic_telemetry_csv(path, rows) / 2**20
+            label = f'{rows // 1000}k'
+            metrics[f'file_mb_{label}'] = (size_mb, 'MB', None)
+            for mode in ('memory', 'stream'):
+                child = _INTERROGATION_CHILD.format(mode=mode, path=path)
+                out = subprocess.run([sys.executable, '-c', child], capture_output=True,
+                                     text=True, check=True, cwd=tmp,
+                                     env={**os.environ, 'PYTHONPATH': ROOT})
+                result = json.loads(out.stdout.strip().splitlines()[-1])
+                metrics[f'{mode}_rows_per_s_{label}'] = (rows / result['seconds'], 'rows/s', HIGHER)
+                metrics[f'{mode}_peak_rss_mb_{label}'] = (result['max_rss_kb'] / 1024, 'MB', LOWER)
+    return metrics
+
+
+@benchmark('coil')
+def bench_coil(quick):
+    from cline_medical_coil import PulseScheduler
+
+    frequency = 1000.0
+    edges = 500 if quick else 3000
+    scheduler = PulseScheduler(frequency)
+    cpu_start = time.process_time()
+    scheduler.start()
+    for _ in range(edges):
+        scheduler.wait_next_edge()
+    wall = scheduler.elapsed_ns() / 1e9
+    cpu = time.process_time() - cpu_start
+    stats = scheduler.stats()
+    return {
+        'jitter_us': (stats['jitter_us'], 'us', LOWER),
+        'max_latency_us': (stats['max_latency_us'], 'us', LOWER),
+        'cpu_percent': (100.0 * cpu / wall, '%', LOWER),
+        'achieved_hz': (stats['achieved_hz'], 'Hz', None),
+    }
+
+
+@benchmark('audit')
+def bench_audit(quick):
+    from audit.generate_audit import audit_grid, compute_audit_results, write_audit_batch
+
+    grid = audit_grid(x=np.linspace(0.10, 0.20, 1001 if quick else 10_001),
+                      b_tension_1au=np.linspace(4.0, 6.0, 100))
+    n = len(grid['x'])
+    compute = _best_time(lambda: compute_audit_results(grid))
+
+    report_grid = audit_grid(x=np.linspace(0.10, 0.20, 200 if quick else 2000))
+    results = compute_audit_results(report_grid)
+    with tempfile.TemporaryDirectory() as tmp:
+        write = _best_time(lambda: write_audit_batch(results, os.path.join(tmp, 'audits.zip')), repeat=1)
+    return {
+        'grid_results_per_s': (n / compute, 'sets/s', HIGHER),
+        'reports_per_s': (len(report_grid['x']) / write, 'reports/s', HIGHER),
+    }
+
+
+@benchmark('startup')
+def bench_startup(quick):
+    from cline.cli import STARTUP_BUDGETS_MS, import_profile
+
+    metrics = {}
+    for argv, budget_ms in STARTUP_BUDGETS_MS.items():
+        # Best of several runs: import time is noisy on shared machines
+        elapsed_ms = min(import_profile(list(argv))[0] for _ in range(3 if quick else 7))
+        label = '_'.join(a.strip('-') for a in argv)
+        metrics[f'{label}_import_ms'] = (elapsed_ms, 'ms', LOWER)
+        if elapsed_ms > budget_ms:
+            print(f"⚠️ OVER BUDGET: cline {' '.join(argv)} imports in {elapsed_ms:.0f} ms "
+                  f"(budget {budget_ms} ms)")
+    return metrics
+
+
+def run(names, quick):
+    results = {}
+    for name in names:
+        print(f"⏱️  {name} ...", flush=True)
+        for metric, (value, unit, better) in BENCHMARKS[name](quick).items():
+            results[f'{name}.{metric}'] = {'value': value, 'unit': unit, 'better': better}
+    return results
+
+
+def compare(results, baseline, tolerance=REGRESSION_TOLERANCE):
+    """Report lines plus the names of regressed metrics."""
+    lines = [f"{'METRIC':<44}{'BASELINE':>14}{'CURRENT':>14}{'CHANGE':>9}  STATUS"]
+    regressions = []
+    for metric, current in results.items():
+        value, unit, better = current['value'], current['unit'], current['better']
+        base = baseline.get('metrics', {}).get(metric, {}).get('value')
+        if base is None or base == 0 or better is None:
+            status = 'NEW' if base is None else ''
+            change = ''
+        else:
+            ratio = value / base
+            change = f"{(ratio - 1) * 100:+.1f}%"
+            gain = ratio if better == HIGHER else 1 / ratio if ratio else float('inf')
+            if gain < 1 - tolerance:
+                status = '✗ REGRESSION'
+                regressions.append(metric)
+            elif gain > 1 + tolerance:
+                status = '✓ IMPROVED'
+            else:
+                status = 'OK'
+        base_text = '-' if base is None else f"{base:.4g}"
+        lines.append(f"{metric:<44}{base_text:>14}{value:>14.4g}{change:>9}  {status} {unit}")
+    return lines, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Imperial benchmark suite (synthetic fixtures)")
+    parser.add_argument("names", nargs='*', metavar="NAME",
+                        help=f"Benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument("--quick", action="store_true", help="Smaller fixtures, for CI smoke runs")
+    parser.add_argument("--baseline", type=str, default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE)
+    parser.add_argument("--check", action="store_true", help="Exit 1 on any regression")
+    args = parser.parse_args(argv)
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    results = run(args.names or list(BENCHMARKS), args.quick)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    if baseline.get('quick', args.quick) != args.quick:
+        print("⚠️ WARNING: baseline was recorded with a different --quick setting")
+
+    lines, regressions = compare(results, baseline, args.tolerance)
+    print("\nIMPERIAL BENCHMARK REPORT")
+    print("-------------------------")
+    print('\n'.join(lines))
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({'machine': platform.platform(), 'python': platform.python_version(),
+                       'quick': args.quick, 'metrics': results}, f, indent=2)
+        print(f"\n✓ BASELINE SAVED TO: {args.baseline}")
+    if regressions:
+        print(f"\n✗ {len(regressions)} REGRESSIONS (> {args.tolerance:.0%} slower than baseline)")
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
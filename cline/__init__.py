@@ -0,0 +1,17 @@
+"""
+The Cline Convergence command line tools.
+Run `cline --help` (or `python -m cline --help`) for the subcommands.
+"""
+
+
+def __getattr__(name):
+    # __version__ comes from the installed metadata, looked up on first use:
+    # importing importlib.metadata costs more than the whole of `cline --help`
+    if name == '__version__':
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            globals()['__version__'] = version('cline-convergence')
+        except PackageNotFoundError:
+            globals()['__version__'] = '0+checkout'  # Run from a checkout that is not installed
+        return globals()['__version__']
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
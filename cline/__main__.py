@@ -0,0 +1,3 @@
+from cline.cli import main
+
+main()
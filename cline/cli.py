@@ -0,0 +1,109 @@
+"""
+CLINE COMMAND LINE
+------------------
+One entry point for every Imperial tool:
+
+    cline interrogate|audit|plot|pdf|coil|... [ARGS]
+
+Each subcommand imports its module and calls its main() with the
+remaining arguments, so `cline audit --batch ...` behaves exactly like
+`python -m audit.generate_audit --batch ...`. This module imports only
+the standard library; pandas, matplotlib and fpdf are loaded by the
+subcommands (and modes) that use them.
+
+Startup budgets for the lightweight commands are measured with
+`python -X importtime` (see import_profile()) and checked by the
+'startup' benchmark; cline/test_cli.py checks they load no heavy module.
+"""
+
+import os
+import sys
+import argparse
+import importlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# SUBCOMMANDS: name -> (module with a main(argv), summary)
+COMMANDS = {
+    'interrogate': ('validation.interrogator', "Interrogate telemetry against the Chi = 0.15 boundary"),
+    'audit': ('audit.generate_audit', "Generate physics audit logs (single or parameter grids)"),
+    'plot': ('validation.visualize_harmonics', "Render harmonic mode ladder charts"),
+    'pdf': ('make_pdf', "Build the 2026 math protocol PDF"),
+    'coil': ('cline_medical_coil', "Drive or render the medical coil waveform"),
+    'store': ('validation.telemetry_store', "Convert telemetry CSV to a columnar store"),
+    'recompute': ('validation.chi_recompute', "Recompute Option C chi across a store"),
+    'modes': ('validation.harmonic_modes', "Detect harmonic mode segments"),
+    'rolling': ('validation.rolling_stats', "Rolling chi statistics over time windows"),
+    'ephemeris': ('validation.ephemeris', "Compile and query spacecraft ephemeris tables"),
+    'history': ('audit.audit_history', "Load the structured audit history"),
+    'bench': ('benchmarks.run_benchmarks', "Run the benchmark suite"),
+    'pipeline': ('cline.pipeline', "Build the report set through the result cache"),
+}
+
+# STARTUP BUDGETS: total import time (ms) per command line, and modules it must never load
+STARTUP_BUDGETS_MS = {
+    ('--help',): 100,
+    ('coil', '--help'): 120,
+    ('audit', '--help'): 400,
+    ('interrogate', '--help'): 400,
+}
+HEAVY_MODULES = ('pandas', 'matplotlib', 'fpdf')
+
+
+def run(command, args):
+    """Imports a subcommand's module (only now) and calls its main(args)."""
+    module = importlib.import_module(COMMANDS[command][0])
+    sys.argv[0] = f'cline {command}'  # The subcommand's usage lines read 'cline <command>'
+    module.main(list(args))
+
+
+class VersionAction(argparse.Action):
+    """--version, reading the installed version only when it is asked for."""
+
+    def __init__(self, option_strings, dest, help="Show the version and exit"):
+        super().__init__(option_strings, dest, nargs=0, default=argparse.SUPPRESS, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        import cline
+        print(f"{parser.prog} {cline.__version__}")
+        parser.exit()
+
+
+def import_profile(argv, cwd=ROOT):
+    """
+    Runs `cline *argv` under `python -X importtime`.
+    Returns (total import time in ms, set of top-level packages imported).
+    """
+    import subprocess
+
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-m', 'cline', *argv],
+                         capture_output=True, text=True, cwd=cwd,
+                         env={**os.environ, 'PYTHONPATH': ROOT})
+    total_us, modules = 0, set()
+    for line in out.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if not fields[0].strip().isdigit():
+            continue  # Header row
+        total_us += int(fields[0])
+        modules.add(fields[2].strip().split('.')[0])
+    return total_us / 1000.0, modules
+
+
+def main(argv=None):
+    commands = '\n'.join(f"  {name:<13}{summary}" for name, (_, summary) in COMMANDS.items())
+    parser = argparse.ArgumentParser(
+        prog='cline', description="The Cline Convergence: Imperial Physics tools",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"commands:\n{commands}\n\nRun 'cline COMMAND --help' for a command's own options.")
+    parser.add_argument('--version', action=VersionAction)
+    parser.add_argument('command', choices=list(COMMANDS), metavar='COMMAND', help="One of the commands below")
+    parser.add_argument('args', nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    run(args.command, args.args)
+
+
+if __name__ == "__main__":
+    main()
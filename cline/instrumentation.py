@@ -0,0 +1,209 @@
+"""
+IMPERIAL INSTRUMENTATION
+------------------------
+Timers, counters, gauges and histograms for the hot paths: ingestion,
+chi computation, violation filtering, report writing, coil scheduling
+and PDF generation.
+
+Collection is off unless enabled, and every call then returns at once
+(timer() hands back one shared no-op context manager). Set
+IMPERIAL_METRICS=<path> or call METRICS.enable(path) to collect; the
+metrics are written when the process exits:
+
+    *.prom   Prometheus textfile (node_exporter textfile collector)
+    *.jsonl  one snapshot appended per run, to track rates over time
+    other    one JSON snapshot
+
+Standard library only, so the light commands stay light. Process pool
+workers keep their own (unexported) metrics.
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import bisect
+import threading
+from datetime import datetime, timezone
+
+# CONFIGURATION
+METRICS_ENV = 'IMPERIAL_METRICS'
+METRIC_PREFIX = 'imperial_'
+LATENCY_BUCKETS = (1e-5, 1e-4, 1e-3, 1e-2, 0.1, 1.0, 10.0, 100.0)  # Seconds
+JITTER_BUCKETS = (1e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 1e-2, 0.1)   # Seconds late
+
+
+class Histogram:
+    """Fixed-bucket histogram (Prometheus 'le' semantics) plus min/max."""
+
+    __slots__ = ('buckets', 'counts', 'count', 'sum', 'min', 'max')
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # Last slot: above every bound
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def to_dict(self):
+        return {'buckets': list(self.buckets), 'counts': list(self.counts), 'count': self.count,
+                'sum': self.sum, 'min': self.min if self.count else None,
+                'max': self.max if self.count else None}
+
+
+class _Timer:
+    """Records its block's duration into the '<name>_seconds' histogram."""
+
+    __slots__ = ('metrics', 'name', 'start', 'elapsed')
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+        self.elapsed = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self.start
+        self.metrics.observe(self.name + '_seconds', self.elapsed)
+        return False
+
+
+class _NullTimer:
+    """Stand-in while collection is off."""
+
+    __slots__ = ()
+    elapsed = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """Process-wide registry (use the module's METRICS instance)."""
+
+    def __init__(self):
+        self.enabled = False
+        self.path = None
+        self._lock = threading.Lock()
+        self._exit_hook = False
+        self.reset()
+
+    def reset(self):
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+
+    def enable(self, path=None):
+        """Starts collecting; with a path, exports there at exit."""
+        self.enabled = True
+        self.path = path
+        if path and not self._exit_hook:
+            atexit.register(self._export_at_exit)
+            self._exit_hook = True
+
+    def disable(self):
+        self.enabled = False
+
+    # RECORDING (each returns immediately while disabled)
+    def count(self, name, n=1):
+        if self.enabled:
+            with self._lock:
+                self.counters[name] = self.counters.get(name, 0) + n
+
+    def gauge(self, name, value):
+        if self.enabled:
+            self.gauges[name] = float(value)
+
+    def observe(self, name, value, buckets=LATENCY_BUCKETS):
+        if self.enabled:
+            with self._lock:
+                histogram = self.histograms.get(name)
+                if histogram is None:
+                    histogram = self.histograms[name] = Histogram(buckets)
+                histogram.observe(value)
+
+    def timer(self, name):
+        """`with METRICS.timer('ingest'):` -> histogram 'ingest_seconds'."""
+        return _Timer(self, name) if self.enabled else _NULL_TIMER
+
+    def rate(self, name, amount, seconds):
+        """Gauge of amount/second (e.g. rows/sec) when both are known."""
+        if self.enabled and seconds > 0:
+            self.gauge(name, amount / seconds)
+
+    # EXPORT
+    def snapshot(self):
+        return {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'command': os.path.basename(sys.argv[0]) if sys.argv else '',
+            'counters': dict(self.counters),
+            'gauges': dict(self.gauges),
+            'histograms': {name: h.to_dict() for name, h in self.histograms.items()},
+        }
+
+    def to_prometheus(self):
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            metric = f"{METRIC_PREFIX}{name}_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        for name, value in sorted(self.gauges.items()):
+            metric = METRIC_PREFIX + name
+            lines += [f"# TYPE {metric} gauge", f"{metric} {value!r}"]
+        for name, h in sorted(self.histograms.items()):
+            metric = METRIC_PREFIX + name
+            lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, n in zip(h.buckets, h.counts):
+                cumulative += n
+                lines.append(f'{metric}_bucket{{le="{bound!r}"}} {cumulative}')
+            lines += [f'{metric}_bucket{{le="+Inf"}} {h.count}',
+                      f"{metric}_sum {h.sum!r}", f"{metric}_count {h.count}"]
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path=None):
+        """Writes the metrics in the format chosen by the file extension."""
+        path = path or self.path
+        if path.endswith('.jsonl'):
+            with open(path, 'a') as f:
+                f.write(json.dumps(self.snapshot()) + '\n')
+            return path
+        # Whole-file formats are replaced atomically (textfile collectors may read mid-run)
+        with open(path + '.tmp', 'w') as f:
+            if path.endswith('.prom'):
+                f.write(self.to_prometheus())
+            else:
+                json.dump(self.snapshot(), f, indent=2)
+        os.replace(path + '.tmp', path)
+        return path
+
+    def _export_at_exit(self):
+        if self.enabled and self.path:
+            try:
+                self.export()
+            except OSError as e:
+                print(f"⚠️ WARNING: Could not export metrics. {e}")
+
+
+METRICS = Metrics()
+if os.environ.get(METRICS_ENV):
+    METRICS.enable(os.environ[METRICS_ENV])
@@ -0,0 +1,335 @@
+"""
+CLINE REPORT PIPELINE
+---------------------
+Builds the report set (interrogation report, audit log, harmonic chart,
+math PDF) through a content-addressed cache. Every stage's artifacts are
+stored under a key hashing everything the stage reads:
+
+    stage name + arguments + digests of its input files
+    + digests of its code + the keys of its upstream stages
+
+A stage whose key is already cached is skipped and its artifacts are
+reused, so a rebuild after a data change reruns only the stages that
+read the data (store -> plot, interrogate) while the audit and the PDF
+come from the cache. File digests are memoized on (size, mtime), and
+the cache is evicted least-recently-used down to a size limit.
+
+Stages marked 'dated' stamp the date into their artifacts (audit log,
+PDF): their key also hashes the build date, and they run with
+SOURCE_DATE_EPOCH set to that date's UTC midnight, so a cached entry is
+only reused on the day it was built and never publishes a stale date.
+
+USAGE:
+    cline pipeline                           # or: python -m cline.pipeline
+    cline pipeline interrogate plot --data data/telemetry.csv
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import calendar
+import datetime
+import shutil
+import hashlib
+import argparse
+import tempfile
+import subprocess
+
+from cline.cli import ROOT
+
+# CONFIGURATION
+CACHE_DIR = '.cline_cache'
+CACHE_MAX_MB = 512
+REPORT_DIR = 'reports'
+DATA_PATH = 'data/telemetry.csv'
+CACHE_VERSION = 1
+DIGEST_BLOCK = 2**20
+DIGESTS_FILE = 'digests.json'  # Memo: path -> (size, mtime_ns, sha256)
+ENTRY_FILE = 'entry.json'      # Per-entry metadata; its mtime is the LRU clock
+
+# STAGES (in run order). Each runs `python -m <module>` (or a 'script'
+# path). Arguments may reference {data} and the artifacts of upstream
+# stages as {<stage>}; code is globbed relative to ROOT.
+# 'optional' outputs are kept (and published) only when the stage writes
+# them, e.g. the quarantine file of malformed telemetry lines.
+STAGES = {
+    'store': {
+        'module': 'validation.telemetry_store',
+        'args': ['{data}', 'telemetry_store', '--quarantine', 'store_quarantine.csv'],
+        'inputs': ['{data}'],
+        'code': ['validation/*.py', 'cline/instrumentation.py'],
+        'outputs': ['telemetry_store'],
+        'optional': ['store_quarantine.csv'],
+        'publish': False,
+    },
+    'interrogate': {
+        'module': 'validation.interrogator',
+        'args': ['--data', '{data}', '--quarantine', 'interrogation_quarantine.csv'],
+        'inputs': ['{data}'],
+        'code': ['validation/*.py', 'cline/instrumentation.py'],
+        'outputs': ['interrogation_results.txt'],
+        'optional': ['interrogation_quarantine.csv'],
+    },
+    'audit': {
+        'module': 'audit.generate_audit',
+        'args': ['--batch', 'audit_report.log'],
+        'code': ['audit/generate_audit.py', 'constants/*.py', 'validation/x_boundary_validation.py',
+                 'validation/_metrics.py', 'cline/instrumentation.py'],
+        'outputs': ['audit_report.log'],
+        'dated': True,
+    },
+    'plot': {
+        'module': 'validation.visualize_harmonics',
+        'args': ['--store', '{store}/telemetry_store'],
+        'after': ['store'],
+        'code': ['validation/*.py'],
+        'outputs': ['harmonic_lock_evidence.png'],
+    },
+    'pdf': {
+        'module': 'make_pdf',
+        'args': [],
+        'code': ['make_pdf.py', 'cline/instrumentation.py'],
+        'outputs': ['_2026_math.pdf'],
+        'dated': True,
+    },
+}
+
+
+class DigestMemo:
+    """sha256 of files, recomputed only when a file's size or mtime changes."""
+
+    def __init__(self, path):
+        self.path = path
+        self.memo = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.memo = json.load(f)
+        self.dirty = False
+
+    def digest(self, path):
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        cached = self.memo.get(path)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(DIGEST_BLOCK), b''):
+                sha.update(block)
+        self.memo[path] = [stat.st_size, stat.st_mtime_ns, sha.hexdigest()]
+        self.dirty = True
+        return self.memo[path][2]
+
+    def save(self):
+        if self.dirty:
+            with open(self.path + '.tmp', 'w') as f:
+                json.dump(self.memo, f)
+            os.replace(self.path + '.tmp', self.path)
+
+
+def _code_files(patterns, root=ROOT):
+    files = set()
+    for pattern in patterns:
+        files.update(p for p in glob.glob(os.path.join(root, pattern))
+                     if not os.path.basename(p).startswith('test_'))
+    return sorted(files)
+
+
+def _entry_size(entry_dir):
+    total = 0
+    for base, _, files in os.walk(entry_dir):
+        total += sum(os.path.getsize(os.path.join(base, name)) for name in files)
+    return total
+
+
+class ResultCache:
+    """Stage artifacts stored as <cache_dir>/<key>/, evicted least-recently-used."""
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_MB * 2**20):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.digests = DigestMemo(os.path.join(self.cache_dir, DIGESTS_FILE))
+
+    def entry(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def lookup(self, key):
+        """The entry directory for `key` (marked as used), or None."""
+        meta = os.path.join(self.entry(key), ENTRY_FILE)
+        if not os.path.exists(meta):
+            return None
+        os.utime(meta)
+        return self.entry(key)
+
+    def store(self, key, work_dir, outputs, metadata, optional=()):
+        """
+        Moves a stage's outputs from `work_dir` into the entry for `key`.
+        Missing `optional` outputs are skipped.
+        """
+        staging = tempfile.mkdtemp(dir=self.cache_dir, prefix='.staging-')
+        for name in [*outputs, *optional]:
+            source = os.path.join(work_dir, name)
+            if not os.path.exists(source):
+                if name in optional:
+                    continue
+                shutil.rmtree(staging)
+                raise FileNotFoundError(f"Stage output '{name}' was not produced")
+            shutil.move(source, os.path.join(staging, name))
+        metadata = dict(metadata, size=_entry_size(staging), created=time.time())
+        with open(os.path.join(staging, ENTRY_FILE), 'w') as f:
+            json.dump(metadata, f, indent=2)
+        shutil.rmtree(self.entry(key), ignore_errors=True)
+        os.replace(staging, self.entry(key))
+        return self.entry(key)
+
+    def evict(self, keep=()):
+        """
+        Removes least-recently-used entries until the cache fits
+        max_bytes. Entries in `keep` (this run's) are never removed.
+        Returns the evicted keys.
+        """
+        entries = []
+        for key in os.listdir(self.cache_dir):
+            meta = os.path.join(self.entry(key), ENTRY_FILE)
+            if os.path.exists(meta):
+                with open(meta) as f:
+                    size = json.load(f)['size']
+                entries.append((os.stat(meta).st_mtime_ns, key, size))
+        total = sum(size for _, _, size in entries)
+        evicted = []
+        for _, key, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if key in keep:
+                continue
+            shutil.rmtree(self.entry(key), ignore_errors=True)
+            total -= size
+            evicted.append(key)
+        return evicted
+
+
+def stage_key(name, stage, data, upstream, digests, date=None):
+    """Content hash of everything the stage reads (plus `date` for dated stages)."""
+    fields = {
+        'version': CACHE_VERSION,
+        'stage': name,
+        'command': _command(stage),
+        'args': stage['args'],  # Unformatted: paths do not change the key, contents do
+        'inputs': [digests.digest(p.format(data=data)) for p in stage.get('inputs', [])],
+        'code': {os.path.relpath(p, ROOT): digests.digest(p)
+                 for p in _code_files(stage['code'] + ([stage['script']] if 'script' in stage else []))},
+        'after': {dep: upstream[dep][0] for dep in stage.get('after', [])},
+    }
+    if stage.get('dated'):
+        fields['date'] = date.isoformat()
+    sha = hashlib.sha256()
+    sha.update(json.dumps(fields, sort_keys=True).encode())
+    return sha.hexdigest()
+
+
+def _command(stage):
+    """The interpreter arguments that run a stage."""
+    return ['-m', stage['module']] if 'module' in stage else [stage['script']]
+
+
+def _select(names, stages):
+    """The requested stages plus everything upstream of them, in run order."""
+    wanted = set(names or stages)
+    for name in reversed(list(stages)):
+        if name in wanted:
+            wanted.update(stages[name].get('after', []))
+    return [name for name in stages if name in wanted]
+
+
+def run_pipeline(names=None, data=DATA_PATH, report_dir=REPORT_DIR, cache=None,
+                 force=False, stages=STAGES, log=print, date=None):
+    """
+    Runs (or reuses) each selected stage and copies published artifacts
+    into `report_dir`. Dated stages are built for `date` (default: today,
+    UTC). Returns {stage: (key, 'cached' | 'ran')}.
+    """
+    cache = cache or ResultCache()
+    data = os.path.abspath(data)
+    date = date or datetime.datetime.now(datetime.timezone.utc).date()
+    epoch = str(calendar.timegm(date.timetuple()))
+    results = {}
+    try:
+        for name in _select(names, stages):
+            stage = stages[name]
+            key = stage_key(name, stage, data, results, cache.digests, date)
+            entry = None if force else cache.lookup(key)
+            if entry:
+                results[name] = (key, 'cached')
+                log(f"✓ {name}: cached ({key[:12]})")
+            else:
+                fields = {'data': data, **{dep: cache.entry(results[dep][0]) for dep in stage.get('after', [])}}
+                work_dir = tempfile.mkdtemp(dir=cache.cache_dir, prefix='.work-')
+                try:
+                    start = time.perf_counter()
+                    argv = [a.format(**fields) for a in stage['args']]
+                    # Stages run in a scratch directory: the checkout must stay importable
+                    env = {**os.environ, 'PYTHONPATH': ROOT}
+                    if stage.get('dated'):
+                        env['SOURCE_DATE_EPOCH'] = epoch
+                    out = subprocess.run([sys.executable, *_command(stage), *argv],
+                                         cwd=work_dir, capture_output=True, text=True, env=env)
+                    if out.returncode != 0:
+                        raise RuntimeError(f"Stage '{name}' failed (exit {out.returncode}):\n"
+                                           f"{(out.stdout + out.stderr).strip()[-2000:]}")
+                    entry = cache.store(key, work_dir, stage['outputs'], {'stage': name},
+                                        stage.get('optional', ()))
+                finally:
+                    shutil.rmtree(work_dir, ignore_errors=True)
+                results[name] = (key, 'ran')
+                log(f"⏱️  {name}: ran in {time.perf_counter() - start:.2f}s ({key[:12]})")
+
+            if stage.get('publish', True):
+                os.makedirs(report_dir, exist_ok=True)
+                for output in stage['outputs']:
+                    shutil.copy2(os.path.join(entry, output), os.path.join(report_dir, output))
+                for output in stage.get('optional', ()):
+                    # Absent this time: drop the copy an earlier build published
+                    if os.path.exists(os.path.join(entry, output)):
+                        shutil.copy2(os.path.join(entry, output), os.path.join(report_dir, output))
+                    elif os.path.exists(os.path.join(report_dir, output)):
+                        os.remove(os.path.join(report_dir, output))
+    finally:
+        cache.digests.save()
+    evicted = cache.evict(keep={key for key, _ in results.values()})
+    if evicted:
+        log(f"⚠️ CACHE: evicted {len(evicted)} least-recently-used entries")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the report set through the result cache")
+    parser.add_argument("stages", nargs='*', metavar="STAGE",
+                        help=f"Stages to build: {', '.join(STAGES)} (default: all)")
+    parser.add_argument("--data", type=str, default=DATA_PATH)
+    parser.add_argument("--out-dir", type=str, default=REPORT_DIR)
+    parser.add_argument("--cache-dir", type=str, default=CACHE_DIR)
+    parser.add_argument("--max-cache-mb", type=float, default=CACHE_MAX_MB)
+    parser.add_argument("--force", action="store_true", help="Rerun every selected stage")
+    args = parser.parse_args(argv)
+    unknown = set(args.stages) - set(STAGES)
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+    if not os.path.exists(args.data):
+        print(f"⛔ FATAL ERROR: Real data file missing at '{args.data}'")
+        sys.exit(1)
+
+    cache = ResultCache(args.cache_dir, int(args.max_cache_mb * 2**20))
+    try:
+        results = run_pipeline(args.stages, args.data, args.out_dir, cache, args.force)
+    except (RuntimeError, FileNotFoundError) as e:
+        print(f"⛔ FATAL ERROR: {e}")
+        sys.exit(1)
+    ran = sum(1 for _, status in results.values() if status == 'ran')
+    print(f"✓ REPORTS IN: {args.out_dir} ({ran} stages ran, {len(results) - ran} cached)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import os
+import importlib
+import subprocess
+import sys
+import unittest
+from cline.cli import COMMANDS, ROOT, STARTUP_BUDGETS_MS, HEAVY_MODULES, import_profile
+
+class TestCli(unittest.TestCase):
+    """
+    UNIFIED CLI CERTIFICATION
+    -------------------------
+    Verifies that every subcommand reaches its module's main() and that
+    the lightweight commands never import the heavy libraries.
+    """
+
+    def test_commands_resolve(self):
+        for command, (module, _) in COMMANDS.items():
+            self.assertTrue(callable(importlib.import_module(module).main), command)
+
+        # Arguments after the command reach main() untouched, from any directory
+        out = subprocess.run([sys.executable, '-m', 'cline', 'coil', '--help'],
+                             capture_output=True, text=True, cwd=os.path.dirname(ROOT),
+                             env={**os.environ, 'PYTHONPATH': ROOT})
+        self.assertEqual(out.returncode, 0)
+        self.assertIn('usage: cline coil', out.stdout)
+        self.assertIn('--sample-rate', out.stdout)
+
+    def test_light_commands_stay_light(self):
+        # Import times are checked against their budgets by the 'startup'
+        # benchmark; here only what is imported, which does not vary by machine
+        for argv in STARTUP_BUDGETS_MS:
+            loaded = set(HEAVY_MODULES) & import_profile(list(argv))[1]
+            self.assertFalse(loaded, f"cline {' '.join(argv)} imports {sorted(loaded)}")
+
+    def test_version(self):
+        out = subprocess.run([sys.executable, '-m', 'cline', '--version'],
+                             capture_output=True, text=True, cwd=ROOT)
+        self.assertEqual(out.returncode, 0)
+        self.assertRegex(out.stdout, r'^cline \S+\n$')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import os
+import datetime
+import tempfile
+import unittest
+from cline.pipeline import ResultCache, run_pipeline
+
+# Stage scripts: 'count' reads the data, 'report' only its upstream artifact,
+# 'banner' nothing but its own code
+COUNT_SCRIPT = """import sys
+with open(sys.argv[1]) as f:
+    rows = len(f.read().splitlines())
+with open('count.txt', 'w') as f:
+    f.write(str(rows))
+"""
+REPORT_SCRIPT = """import sys
+with open(sys.argv[1]) as f:
+    rows = f.read()
+with open('report.txt', 'w') as f:
+    f.write('rows=' + rows + ' ' + 'x' * 4000)
+"""
+BANNER_SCRIPT = """with open('banner.txt', 'w') as f:
+    f.write('IMPERIAL')
+"""
+# 'stamp' embeds the build date; 'screen' writes rejects only for bad rows
+STAMP_SCRIPT = """import os
+with open('stamp.txt', 'w') as f:
+    f.write(os.environ['SOURCE_DATE_EPOCH'])
+"""
+SCREEN_SCRIPT = """import sys
+with open(sys.argv[1]) as f:
+    bad = [line for line in f.read().splitlines() if line == 'bad']
+with open('screen.txt', 'w') as f:
+    f.write('ok')
+if bad:
+    with open('rejects.txt', 'w') as f:
+        f.write('\\n'.join(bad))
+"""
+
+class TestPipeline(unittest.TestCase):
+    """
+    RESULT CACHE CERTIFICATION
+    --------------------------
+    Verifies that stages are keyed on their inputs: unchanged stages are
+    reused, a data change reruns only what reads it, and the cache is
+    evicted least-recently-used.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.tmp.name
+        self.data = os.path.join(root, 'telemetry.csv')
+        with open(self.data, 'w') as f:
+            f.write("a\nb\n")
+        scripts = {}
+        for name, text in (('count', COUNT_SCRIPT), ('report', REPORT_SCRIPT), ('banner', BANNER_SCRIPT),
+                           ('stamp', STAMP_SCRIPT), ('screen', SCREEN_SCRIPT)):
+            scripts[name] = os.path.join(root, f'{name}.py')
+            with open(scripts[name], 'w') as f:
+                f.write(text)
+        self.stages = {
+            'count': {'script': scripts['count'], 'args': ['{data}'], 'inputs': ['{data}'],
+                      'code': [], 'outputs': ['count.txt'], 'publish': False},
+            'report': {'script': scripts['report'], 'args': ['{count}/count.txt'], 'after': ['count'],
+                       'code': [], 'outputs': ['report.txt']},
+            'banner': {'script': scripts['banner'], 'args': [], 'code': [], 'outputs': ['banner.txt']},
+        }
+        self.scripts = scripts
+        self.reports = os.path.join(root, 'reports')
+        self.cache_dir = os.path.join(root, 'cache')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_stages(self, names=None, max_bytes=2**20, date=None):
+        cache = ResultCache(self.cache_dir, max_bytes)
+        results = run_pipeline(names, self.data, self.reports, cache, stages=self.stages,
+                               log=lambda m: None, date=date)
+        return {name: status for name, (_, status) in results.items()}
+
+    def test_only_affected_stages_rerun(self):
+        self.assertEqual(self.run_stages(), {'count': 'ran', 'report': 'ran', 'banner': 'ran'})
+        self.assertEqual(self.run_stages(), {'count': 'cached', 'report': 'cached', 'banner': 'cached'})
+        self.assertEqual(sorted(os.listdir(self.reports)), ['banner.txt', 'report.txt'])
+
+        with open(self.data, 'a') as f:
+            f.write("c\n")
+        self.assertEqual(self.run_stages(), {'count': 'ran', 'report': 'ran', 'banner': 'cached'})
+        with open(os.path.join(self.reports, 'report.txt')) as f:
+            self.assertTrue(f.read().startswith('rows=3'))
+
+        # Upstream stages are pulled in; restoring the data hits the old entries
+        with open(self.data, 'w') as f:
+            f.write("a\nb\n")
+        self.assertEqual(self.run_stages(['report']), {'count': 'cached', 'report': 'cached'})
+
+    def test_lru_eviction(self):
+        self.run_stages(['banner'])
+        self.run_stages(['report'])
+        with open(self.data, 'a') as f:
+            f.write("c\n")
+        # The new report (~4 kB) does not fit beside the old one: the least
+        # recently used entries go, this run's entries stay
+        self.run_stages(['report'], max_bytes=6000)
+        self.assertEqual(self.run_stages(['report'], max_bytes=6000), {'count': 'cached', 'report': 'cached'})
+        self.assertEqual(self.run_stages(['banner']), {'banner': 'ran'})
+
+    def test_dated_stage_keyed_on_date(self):
+        self.stages['stamp'] = {'script': self.scripts['stamp'], 'args': [], 'code': [],
+                                'outputs': ['stamp.txt'], 'dated': True}
+        day = datetime.date(2026, 10, 18)
+        self.assertEqual(self.run_stages(['stamp', 'banner'], date=day), {'stamp': 'ran', 'banner': 'ran'})
+        self.assertEqual(self.run_stages(['stamp', 'banner'], date=day), {'stamp': 'cached', 'banner': 'cached'})
+
+        # The next day rebuilds only the dated stage, stamped with that day
+        next_day = day + datetime.timedelta(days=1)
+        self.assertEqual(self.run_stages(['stamp', 'banner'], date=next_day), {'stamp': 'ran', 'banner': 'cached'})
+        with open(os.path.join(self.reports, 'stamp.txt')) as f:
+            stamp = datetime.datetime.fromtimestamp(int(f.read()), datetime.timezone.utc)
+        self.assertEqual(stamp, datetime.datetime(2026, 10, 19, tzinfo=datetime.timezone.utc))
+
+    def test_optional_outputs(self):
+        self.stages['screen'] = {'script': self.scripts['screen'], 'args': ['{data}'], 'inputs': ['{data}'],
+                                 'code': [], 'outputs': ['screen.txt'], 'optional': ['rejects.txt']}
+        rejects = os.path.join(self.reports, 'rejects.txt')
+        with open(self.data, 'a') as f:
+            f.write("bad\n")
+        self.run_stages(['screen'])
+        self.assertTrue(os.path.exists(rejects))
+
+        # A clean rebuild does not leave the earlier rejects published
+        with open(self.data, 'w') as f:
+            f.write("a\nb\n")
+        self.assertEqual(self.run_stages(['screen']), {'screen': 'ran'})
+        self.assertFalse(os.path.exists(rejects))
+        self.assertTrue(os.path.exists(os.path.join(self.reports, 'screen.txt')))
+
+if __name__ == '__main__':
+    unittest.main()
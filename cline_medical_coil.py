@@ -5,6 +5,9 @@ Target Frequency: Lambda = 20.5556 Hz (Vacuum/EM Coupling)
 
 USAGE:
     python cline_medical_coil.py --mode square --duration 60
+    python cline_medical_coil.py --mode scalar --sink coil.f32 --sample-rate 8000
+    python cline_medical_coil.py --no-visual --duration 3600
+    python cline_medical_coil.py --mode square --duration 3600 --render session.npy
     python cline_medical_coil.py --info
 
 DISCLAIMER: Research tool only. Not a medical device.
@@ -13,7 +16,18 @@ DISCLAIMER: Research tool only. Not a medical device.
 import time
 import math
 import argparse
+import ast
+import mmap
+import struct
 import sys
+import threading
+from array import array
+from contextlib import nullcontext
+
+try:
+    from cline.instrumentation import METRICS, JITTER_BUCKETS
+except ImportError:  # Standalone copy (standard library only): run uninstrumented
+    METRICS = None
 
 # ------------------------------------------------------------------
 # 1. IMPERIAL CONSTANTS
@@ -23,53 +37,344 @@ ALPHA = 1/137.035999
 LAMBDA_BIO = CHI / ALPHA  # 20.5556 Hz
 
 # ------------------------------------------------------------------
-# 2. SIGNAL GENERATION LOGIC
+# 2. TIMING ENGINE
+# ------------------------------------------------------------------
+SPIN_WINDOW_NS = 500_000  # Busy-wait only the final 0.5 ms before an edge
+
+class PulseScheduler:
+    """
+    Drift-free pulse timing engine.
+    Edge k is due at the absolute deadline start + k * period on the
+    monotonic perf_counter_ns clock, so late edges never shift later ones.
+    Sleeps for the bulk of each period and spins only the final window.
+
+    Missed edges are dropped, not made up: once the caller is a full
+    period behind (a stall), the scheduler skips to the next deadline
+    still in the future, so the coil never receives a burst of
+    back-to-back pulses. Skipped edges count as overruns.
+    """
+
+    def __init__(self, frequency, spin_window_ns=SPIN_WINDOW_NS):
+        self.period_ns = 1e9 / frequency
+        self.spin_window_ns = spin_window_ns
+        self.start_ns = None
+        self.edges = 0     # Deadline index of the last edge fired
+        self.pulses = 0    # Edges actually fired (edges minus skipped)
+        self.skipped = 0   # Deadlines dropped after a stall
+        self.overruns = 0  # Skipped edges plus edges fired a full period late
+
+        # Lateness statistics (Welford), in ns
+        self._mean_late = 0.0
+        self._m2_late = 0.0
+        self.max_late_ns = 0
+        self.last_late_ns = 0
+
+    def start(self):
+        self.start_ns = time.perf_counter_ns()
+        return self.start_ns
+
+    def deadline_ns(self, edge):
+        return self.start_ns + round(edge * self.period_ns)
+
+    def elapsed_ns(self):
+        return time.perf_counter_ns() - self.start_ns
+
+    def wait_next_edge(self):
+        """Blocks until the next pulse edge and returns its lateness (ns)."""
+        edge = self.edges + 1
+        now = time.perf_counter_ns()
+
+        # 1. SKIP AHEAD (a full period behind: drop the missed edges)
+        if now >= self.deadline_ns(edge + 1):
+            target = int((now - self.start_ns) // self.period_ns) + 1
+            while self.deadline_ns(target) <= now:
+                target += 1
+            self.skipped += target - edge
+            self.overruns += target - edge
+            edge = target
+        deadline = self.deadline_ns(edge)
+
+        # 2. SLEEP (bulk of the period, CPU idle)
+        remaining = deadline - now
+        if remaining > self.spin_window_ns:
+            time.sleep((remaining - self.spin_window_ns) / 1e9)
+
+        # 3. SPIN (final sub-millisecond only)
+        now = time.perf_counter_ns()
+        while now < deadline:
+            now = time.perf_counter_ns()
+
+        # 4. RECORD
+        late = now - deadline
+        self.edges = edge
+        self.pulses += 1
+        self.last_late_ns = late
+        if late > self.max_late_ns:
+            self.max_late_ns = late
+        if late >= self.period_ns:
+            self.overruns += 1
+        delta = late - self._mean_late
+        self._mean_late += delta / self.pulses
+        self._m2_late += delta * (late - self._mean_late)
+        return late
+
+    def stats(self):
+        """Achieved timing quality for the session so far."""
+        jitter_ns = math.sqrt(self._m2_late / self.pulses) if self.pulses > 1 else 0.0
+        achieved_hz = 0.0
+        if self.pulses:
+            achieved_hz = self.pulses * 1e9 / (self.deadline_ns(self.edges) + self.last_late_ns - self.start_ns)
+        return {
+            "edges": self.edges,
+            "pulses": self.pulses,
+            "skipped": self.skipped,
+            "mean_latency_us": self._mean_late / 1e3,
+            "jitter_us": jitter_ns / 1e3,
+            "max_latency_us": self.max_late_ns / 1e3,
+            "drift_us": self.last_late_ns / 1e3,
+            "achieved_hz": achieved_hz,
+            "overruns": self.overruns,
+        }
+
+# ------------------------------------------------------------------
+# 3. WAVEFORM SYNTHESIS
+# ------------------------------------------------------------------
+DEFAULT_SAMPLE_RATE = 8000  # Hz
+MAX_LOOP_PERIODS = 64       # Upper bound when searching for a seamless loop
+
+def loop_period_count(sample_rate, max_periods=MAX_LOOP_PERIODS):
+    """
+    Number of whole periods whose length lands closest to an integer
+    sample count, so the looped buffer drifts the least in frequency.
+    """
+    samples_per_period = sample_rate / LAMBDA_BIO
+    return min(range(1, max_periods + 1),
+               key=lambda k: abs(k * samples_per_period - round(k * samples_per_period)))
+
+def render_waveform(mode, sample_rate=DEFAULT_SAMPLE_RATE, periods=1):
+    """
+    Renders `periods` whole periods of the waveform into a preallocated
+    float32 buffer in [-1, 1].
+    SQUARE: +1 for the first half-period, -1 for the second.
+    SCALAR: pure sinusoid.
+    """
+    n_samples = round(periods * sample_rate / LAMBDA_BIO)
+    buf = array('f', bytes(4 * n_samples))
+    step = 2 * math.pi * periods / n_samples
+    if mode == "square":
+        for i in range(n_samples):
+            buf[i] = 1.0 if math.sin(i * step) >= 0.0 else -1.0
+    elif mode == "scalar":
+        for i in range(n_samples):
+            buf[i] = math.sin(i * step)
+    else:
+        raise ValueError(f"Unknown waveform mode: {mode}")
+    return buf
+
+class WaveformBuffer:
+    """
+    Pre-rendered loop of one waveform mode.
+    Per-sample cost is a buffer read; output goes to any sink with .write().
+    """
+
+    def __init__(self, mode, sample_rate=DEFAULT_SAMPLE_RATE, periods=None):
+        if periods is None:
+            periods = loop_period_count(sample_rate)
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.periods = periods
+        self.samples = render_waveform(mode, sample_rate, periods)
+        self.index = 0  # Next sample to stream
+
+    def __len__(self):
+        return len(self.samples)
+
+    def sample_at(self, t_seconds):
+        """Amplitude at session time t (for monitoring, no trig)."""
+        return self.samples[round(t_seconds * self.sample_rate) % len(self.samples)]
+
+    def write_to(self, sink, count):
+        """Streams the next `count` samples (native float32) into `sink`."""
+        view = memoryview(self.samples)
+        n = len(self.samples)
+        while count > 0:
+            chunk = min(count, n - self.index)
+            sink.write(view[self.index:self.index + chunk])
+            self.index = (self.index + chunk) % n
+            count -= chunk
+
 # ------------------------------------------------------------------
-def generate_signal(mode, duration, verbose=True):
-    start_time = time.time()
+# 4. CONSOLE VISUALIZER
+# ------------------------------------------------------------------
+VISUAL_REFRESH_HZ = 10.0
+
+class ConsoleVisualizer(threading.Thread):
+    """
+    Console heartbeat running beside the pulse loop.
+    Samples the scheduler clock at a capped refresh rate and never takes
+    a lock the scheduler waits on, so terminal latency cannot move an edge.
+    """
+
+    def __init__(self, scheduler, waveform, refresh_hz=VISUAL_REFRESH_HZ):
+        super().__init__(name="coil-visualizer", daemon=True)
+        self.scheduler = scheduler
+        self.waveform = waveform
+        self.interval = 1.0 / refresh_hz
+        self._halt = threading.Event()
+
+    def run(self):
+        while not self._halt.wait(self.interval):
+            elapsed = self.scheduler.elapsed_ns() / 1e9
+            # Create a "breathing" visual from the rendered waveform
+            amplitude = 0.5 * (self.waveform.sample_at(elapsed) + 1) # 0 to 1
+            bar_len = int(amplitude * 40)
+            bar = "█" * bar_len
+            sys.stdout.write(f"\r[{bar:<40}] {elapsed:.1f}s | {LAMBDA_BIO:.2f} Hz")
+            sys.stdout.flush()
+
+    def stop(self):
+        self._halt.set()
+        self.join()
+
+# ------------------------------------------------------------------
+# 5. SIGNAL GENERATION LOGIC
+# ------------------------------------------------------------------
+def generate_signal(mode, duration, verbose=True, sink=None, sample_rate=DEFAULT_SAMPLE_RATE):
     cycles = 0
     period = 1.0 / LAMBDA_BIO
+    scheduler = PulseScheduler(LAMBDA_BIO)
+    duration_ns = duration * 1e9
+    waveform = WaveformBuffer(mode, sample_rate)
+    samples_written = 0
     
     print(f"⚡ CLINE MEDICAL COIL ACTIVATED")
     print(f"   Target Frequency: {LAMBDA_BIO:.6f} Hz")
     print(f"   Coupling Ratio:   20.56 (Vacuum/EM)")
     print(f"   Mode:             {mode.upper()}")
     print(f"   Duration:         {duration} seconds")
+    if sink is not None:
+        print(f"   Sample Stream:    {sample_rate} Hz float32 ({waveform.periods}-period loop)")
     print("-" * 50)
 
+    # Edge lateness histogram; bound once so a disabled registry costs one check
+    record = METRICS.observe if METRICS is not None and METRICS.enabled else None
+
+    scheduler.start()
+    # VISUALIZER (Console Heartbeat, off the timing-critical path)
+    visualizer = ConsoleVisualizer(scheduler, waveform) if verbose else None
+    if visualizer is not None:
+        visualizer.start()
+
     try:
-        while (time.time() - start_time) < duration:
-            # High Precision Timing Loop
-            cycle_start = time.time()
-            
-            # VISUALIZER (Console Heartbeat)
-            if verbose:
-                elapsed = time.time() - start_time
-                # Create a "breathing" visual based on the phase
-                phase = (elapsed * LAMBDA_BIO * 2 * math.pi)
-                amplitude = 0.5 * (math.sin(phase) + 1) # 0 to 1
-                bar_len = int(amplitude * 40)
-                bar = "█" * bar_len
-                sys.stdout.write(f"\r[{bar:<40}] {elapsed:.1f}s | {LAMBDA_BIO:.2f} Hz")
-                sys.stdout.flush()
-
-            # Wait for the exact period to elapse (Simulating the Pulse)
-            while (time.time() - cycle_start) < period:
-                pass
+        while scheduler.elapsed_ns() < duration_ns:
+            # Wait for the next absolute pulse edge (Simulating the Pulse)
+            late = scheduler.wait_next_edge()
             
             cycles += 1
+            if record is not None:
+                record('coil_edge_latency_seconds', late / 1e9, JITTER_BUCKETS)
+
+            # Stream the samples that are due by this edge
+            if sink is not None:
+                due = round(cycles * period * sample_rate)
+                waveform.write_to(sink, due - samples_written)
+                samples_written = due
 
     except KeyboardInterrupt:
         print("\n\n🛑 MANUAL OVERRIDE: STOPPING COIL.")
+    finally:
+        if visualizer is not None:
+            visualizer.stop()
     
     print(f"\n\n" + "="*50)
     print(f"SESSION COMPLETE.")
     print(f"Total Cycles: {cycles}")
     print(f"Vacuum Integration: {cycles * period:.4f} sec")
+    timing = scheduler.stats()
+    print(f"Achieved Frequency: {timing['achieved_hz']:.6f} Hz")
+    print(f"Edge Latency:       mean {timing['mean_latency_us']:.1f} us | "
+          f"max {timing['max_latency_us']:.1f} us")
+    print(f"Timing Jitter:      {timing['jitter_us']:.1f} us (std)")
+    print(f"Final Drift:        {timing['drift_us']:.1f} us | Overruns: {timing['overruns']} ({timing['skipped']} skipped)")
     print("="*50)
+    if METRICS is not None:
+        METRICS.count('coil_cycles', cycles)
+        METRICS.gauge('coil_achieved_hz', timing['achieved_hz'])
+        METRICS.gauge('coil_jitter_seconds', timing['jitter_us'] / 1e6)
+        METRICS.gauge('coil_overruns', timing['overruns'])
+
+# ------------------------------------------------------------------
+# 6. OFFLINE SESSION RENDERER
+# ------------------------------------------------------------------
+INT16_FULL_SCALE = 32767
+RENDER_TILE_BYTES = 1 << 20  # Write in ~1 MiB slabs of whole buffer loops
+NPY_MAGIC = b"\x93NUMPY"
+NPY_DESCR = {'f': 'f4', 'h': 'i2', 'q': 'i8'}
+
+def _write_npy_header(f, typecode, length):
+    """Minimal .npy v1.0 header so sessions load with np.load(mmap_mode='r')."""
+    endian = '<' if sys.byteorder == 'little' else '>'
+    header = f"{{'descr': '{endian}{NPY_DESCR[typecode]}', 'fortran_order': False, 'shape': ({length},), }}"
+    pad = 64 - (len(NPY_MAGIC) + 4 + len(header) + 1) % 64
+    header = header + ' ' * pad + '\n'
+    f.write(NPY_MAGIC + b"\x01\x00" + struct.pack('<H', len(header)) + header.encode('latin1'))
+
+def edges_path(path):
+    """Sidecar file holding the pulse edge timestamps of a rendered session."""
+    stem = path[:-4] if path.endswith('.npy') else path
+    return stem + '.edges.npy'
+
+def render_session(mode, duration, path, sample_rate=DEFAULT_SAMPLE_RATE, sample_format="float32"):
+    """
+    Renders a whole session faster than real time.
+    Writes the same sample stream the live driver sends to --sink
+    (float32, or int16 full-scale) to `path`, plus the rising-edge
+    timestamp of every cycle (int64 ns from session start) to edges_path().
+    """
+    cycles = math.ceil(duration * LAMBDA_BIO)
+    period_ns = 1e9 / LAMBDA_BIO
+    n_samples = round(cycles / LAMBDA_BIO * sample_rate)
+
+    waveform = WaveformBuffer(mode, sample_rate)
+    samples = waveform.samples
+    if sample_format == "int16":
+        samples = array('h', (round(v * INT16_FULL_SCALE) for v in samples))
+
+    # 1. SAMPLE STREAM (whole loops tiled into large slabs)
+    reps = max(1, RENDER_TILE_BYTES // (len(samples) * samples.itemsize))
+    tile = memoryview(samples * reps)
+    with open(path, 'wb') as f:
+        _write_npy_header(f, samples.typecode, n_samples)
+        remaining = n_samples
+        while remaining > 0:
+            chunk = min(remaining, len(tile))
+            f.write(tile[:chunk])
+            remaining -= chunk
+
+    # 2. PULSE EDGE TIMESTAMPS
+    edges = array('q', (round(k * period_ns) for k in range(cycles)))
+    with open(edges_path(path), 'wb') as f:
+        _write_npy_header(f, 'q', cycles)
+        f.write(memoryview(edges))
+
+    return {"cycles": cycles, "samples": n_samples, "sample_rate": sample_rate}
+
+def load_session(path):
+    """
+    Memory-maps a rendered .npy stream and returns a typed memoryview.
+    Only the pages actually read are loaded from disk.
+    """
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if mm[:len(NPY_MAGIC)] != NPY_MAGIC:
+        raise ValueError(f"Not a rendered session file: {path}")
+    header_len = struct.unpack('<H', mm[8:10])[0]
+    header = ast.literal_eval(mm[10:10 + header_len].decode('latin1'))
+    typecode = {v: k for k, v in NPY_DESCR.items()}[header['descr'][1:]]
+    return memoryview(mm)[10 + header_len:].cast(typecode)
 
 # ------------------------------------------------------------------
-# 3. INFORMATION MODULE
+# 7. INFORMATION MODULE
 # ------------------------------------------------------------------
 def show_info():
     print("""
@@ -100,15 +405,35 @@ def show_info():
     a Tri-Grid (Bucking Coil) topology.
     """)
 
-if __name__ == "__main__":
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Cline Medical Coil Driver")
     parser.add_argument("--mode", type=str, default="square", choices=["square", "scalar"], help="Waveform type")
     parser.add_argument("--duration", type=float, default=60.0, help="Session duration in seconds")
     parser.add_argument("--info", action="store_true", help="Display theory and schematic info")
+    parser.add_argument("--sink", type=str, default=None, help="Stream float32 samples to this file or pipe")
+    parser.add_argument("--sample-rate", type=int, default=DEFAULT_SAMPLE_RATE, help="Sample stream rate (Hz)")
+    parser.add_argument("--no-visual", action="store_true", help="Headless: no console I/O during the session")
+    parser.add_argument("--render", type=str, default=None, help="Render the whole session to this .npy file (offline)")
+    parser.add_argument("--format", type=str, default="float32", choices=["float32", "int16"], help="Rendered sample format")
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    verbose = not args.no_visual
     
     if args.info:
         show_info()
+    elif args.render:
+        t0 = time.perf_counter()
+        with METRICS.timer('coil_render') if METRICS is not None else nullcontext():
+            result = render_session(args.mode, args.duration, args.render, args.sample_rate, args.format)
+        print(f"✓ SESSION RENDERED: {result['cycles']} cycles, {result['samples']} samples "
+              f"({args.format} @ {args.sample_rate} Hz) in {time.perf_counter() - t0:.3f}s")
+        print(f"   Samples: {args.render}")
+        print(f"   Edges:   {edges_path(args.render)}")
+    elif args.sink:
+        with open(args.sink, "wb") as sink:
+            generate_signal(args.mode, args.duration, verbose=verbose, sink=sink, sample_rate=args.sample_rate)
     else:
-        generate_signal(args.mode, args.duration)
+        generate_signal(args.mode, args.duration, verbose=verbose)
+
+if __name__ == "__main__":
+    main()
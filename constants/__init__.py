@@ -3,6 +3,8 @@ Imperial Constants and Validation Logic
 Defines the core geometric invariants of the LUFT Framework.
 """
 
+from functools import lru_cache
+
 # 1. THE LAW
 X = 0.1500  # Universal Plasma Limit
 
@@ -12,28 +14,123 @@ ALPHA = 1/137.035999          # Fine Structure Constant
 MASS_ELECTRON = 9.10938356e-31
 MASS_PROTON = 1.6726219e-27
 
-# 3. GEOMETRIC FUNCTIONS (The Tools your Audit Script needs)
+# 3. CONSTANTS OBJECT (derived quantities computed once, on first use)
+_DERIVED = {
+    'gravity_factor': lambda c: 1.0 / c.x,
+    'matter_predicted': lambda c: c.x ** 4,
+    'matter_actual': lambda c: c.mass_electron / c.mass_proton,
+    'matter_error': lambda c: abs(c.matter_predicted - c.matter_actual) / c.matter_actual,
+    'mass_ratio_validation': lambda c: (c.matter_predicted, c.matter_actual, c.matter_error),
+    'geometric_invariant_1': lambda c: c.x * (1/c.x),
+    'geometric_invariant_2': lambda c: (c.x**4) * ((1/c.x)**0.25),
+    'bio_period': lambda c: 1.0 / c.lambda_bio,
+    'inverse_alpha': lambda c: 1.0 / c.alpha,
+}
+_PARAMETERS = ('x', 'lambda_bio', 'alpha', 'mass_electron', 'mass_proton')
+
+class ImperialConstants:
+    """
+    Frozen parameter set with memoized derived quantities.
+    Each derived slot starts empty; the first read falls through to
+    __getattr__, which computes and stores it, and every later read is a
+    plain slot access. Use ImperialConstants.get() (or .replace()) for
+    alternate parameter sets: identical sets share one cached instance.
+    """
+    __slots__ = _PARAMETERS + tuple(_DERIVED)
+
+    def __init__(self, x=X, lambda_bio=LAMBDA_BIO, alpha=ALPHA,
+                 mass_electron=MASS_ELECTRON, mass_proton=MASS_PROTON):
+        for name, value in zip(_PARAMETERS, (x, lambda_bio, alpha, mass_electron, mass_proton)):
+            object.__setattr__(self, name, float(value))
+
+    @classmethod
+    def get(cls, x=X, lambda_bio=LAMBDA_BIO, alpha=ALPHA,
+            mass_electron=MASS_ELECTRON, mass_proton=MASS_PROTON):
+        """Shared instance for a parameter set (derived values cached once)."""
+        return _shared_constants(cls, float(x), float(lambda_bio), float(alpha),
+                                 float(mass_electron), float(mass_proton))
+
+    def replace(self, **changes):
+        """The (shared) parameter set with some parameters changed, e.g. replace(x=0.16)."""
+        return type(self).get(**{**self.parameters(), **changes})
+
+    def parameters(self):
+        return {name: getattr(self, name) for name in _PARAMETERS}
+
+    def __getattr__(self, name):
+        # Only reached for derived slots that are not computed yet
+        derive = _DERIVED.get(name)
+        if derive is None:
+            raise AttributeError(name)
+        value = derive(self)
+        object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ImperialConstants is frozen")
+
+    def __delattr__(self, name):
+        raise AttributeError("ImperialConstants is frozen")
+
+    def __reduce__(self):
+        return (type(self).get, tuple(self.parameters().values()))
+
+    def __eq__(self, other):
+        if not isinstance(other, ImperialConstants):
+            return NotImplemented
+        return self.parameters() == other.parameters()
+
+    def __hash__(self):
+        return hash(tuple(self.parameters().values()))
+
+    def __repr__(self):
+        args = ', '.join(f"{k}={v!r}" for k, v in self.parameters().items())
+        return f"ImperialConstants({args})"
+
+@lru_cache(maxsize=1024)
+def _shared_constants(cls, *parameters):
+    return cls(*parameters)
+
+IMPERIAL = ImperialConstants.get()
+
+# 4. GEOMETRIC FUNCTIONS (The Tools your Audit Script needs)
 def gravity_relationship():
     """Returns the gravitational geometric factor (1/X)"""
-    return 1.0 / X
+    return IMPERIAL.gravity_factor
 
 def matter_relationship():
     """Returns the geometric mass prediction (X^4)"""
-    return X ** 4
+    return IMPERIAL.matter_predicted
+
+def actual_mass_ratio():
+    """Returns the measured electron/proton mass ratio"""
+    return IMPERIAL.matter_actual
 
 def fine_structure_constant():
     return ALPHA
 
 def mass_ratio_validation():
     """Validates the electron/proton mass ratio against X^4"""
-    predicted = X ** 4
-    actual = MASS_ELECTRON / MASS_PROTON
-    error = abs(predicted - actual) / actual
-    return predicted, actual, error
+    return IMPERIAL.mass_ratio_validation
+
+def geometric_ratio_1():
+    """X * (1/X); should be exactly 1.0"""
+    return IMPERIAL.geometric_invariant_1
+
+def geometric_ratio_2():
+    """Cross-domain coupling check (X^4 * (1/X)^0.25)"""
+    return IMPERIAL.geometric_invariant_2
 
 def validate_universal_plasma_limit():
     """Calculates geometric self-consistency invariants"""
+    c = IMPERIAL
     return {
-        'geometric_invariant_1': X * (1/X), # Should be exactly 1.0
-        'geometric_invariant_2': (X**4) * ((1/X)**0.25) # Cross-domain coupling check
+        'X': c.x,
+        'gravity_factor': c.gravity_factor,
+        'matter_predicted': c.matter_predicted,
+        'matter_actual': c.matter_actual,
+        'matter_error_percent': c.matter_error * 100,
+        'bio_frequency_hz': c.lambda_bio,
+        'geometric_invariant_1': c.geometric_invariant_1, # Should be exactly 1.0
+        'geometric_invariant_2': c.geometric_invariant_2, # Cross-domain coupling check
     }
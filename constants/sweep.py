@@ -0,0 +1,64 @@
+"""
+Vectorized Parameter Sweeps
+Array counterparts of the geometric relationships in constants/__init__.py.
+Every input broadcasts (e.g. millions of candidate X values against one
+set of masses), and each relationship is one NumPy expression, so a scan
+costs a few passes over the arrays instead of a Python call per value.
+Kept out of the package namespace so `import constants` stays stdlib-only.
+"""
+
+import numpy as np
+
+from constants import X, ALPHA, LAMBDA_BIO, MASS_ELECTRON, MASS_PROTON
+
+
+def gravity_relationship(x=X):
+    """1/X for every X"""
+    return 1.0 / np.asarray(x, dtype=float)
+
+def matter_relationship(x=X):
+    """X^4 for every X"""
+    x = np.asarray(x, dtype=float)
+    return x ** 4
+
+def mass_ratio_validation(x=X, mass_electron=MASS_ELECTRON, mass_proton=MASS_PROTON):
+    """(predicted, actual, error) arrays, broadcast over all inputs"""
+    predicted = matter_relationship(x)
+    actual = np.asarray(mass_electron, dtype=float) / np.asarray(mass_proton, dtype=float)
+    error = np.abs(predicted - actual) / actual
+    return np.broadcast_arrays(predicted, actual, error)
+
+def validate_universal_plasma_limit(x=X, alpha=ALPHA, lambda_bio=LAMBDA_BIO,
+                                    mass_electron=MASS_ELECTRON, mass_proton=MASS_PROTON):
+    """
+    The validate_universal_plasma_limit() table with one entry per
+    parameter set: a dict of equally shaped arrays.
+    """
+    x = np.asarray(x, dtype=float)
+    predicted, actual, error = mass_ratio_validation(x, mass_electron, mass_proton)
+    inverse_x = 1 / x
+    shape = predicted.shape
+    return {
+        'X': np.broadcast_to(x, shape),
+        'gravity_factor': np.broadcast_to(inverse_x, shape),
+        'matter_predicted': predicted,
+        'matter_actual': actual,
+        'matter_error_percent': error * 100,
+        'bio_frequency_hz': np.broadcast_to(np.asarray(lambda_bio, dtype=float), shape),
+        'inverse_alpha': np.broadcast_to(1.0 / np.asarray(alpha, dtype=float), shape),
+        'geometric_invariant_1': np.broadcast_to(x * inverse_x, shape),
+        'geometric_invariant_2': np.broadcast_to((x ** 4) * (inverse_x ** 0.25), shape),
+    }
+
+def best_fit_x(x, mass_electron=MASS_ELECTRON, mass_proton=MASS_PROTON):
+    """
+    The candidate X whose X^4 best matches m_e/m_p.
+    Returns (x_best, error_best, index). The relative error shares its
+    denominator across candidates, so the argmin runs on |X^4 - ratio|
+    without forming the error array. NaN candidates are skipped.
+    """
+    x = np.asarray(x, dtype=float).ravel()
+    actual = float(mass_electron) / float(mass_proton)
+    predicted = matter_relationship(x)
+    index = int(np.nanargmin(np.abs(predicted - actual)))
+    return float(x[index]), float(abs(predicted[index] - actual) / actual), index
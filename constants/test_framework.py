@@ -17,6 +17,8 @@ from constants import (
     geometric_ratio_1,
     geometric_ratio_2,
     validate_universal_plasma_limit,
+    ImperialConstants,
+    IMPERIAL,
 )
 
 def test_universal_plasma_limit():
@@ -110,6 +112,49 @@ def test_dimensionless_ratios():
     
     print("✓ All relationships are dimensionless ratios")
 
+def test_constants_object():
+    """Test the frozen, memoized constants object"""
+    assert IMPERIAL.mass_ratio_validation == mass_ratio_validation()
+    assert IMPERIAL.gravity_factor == gravity_relationship()
+
+    # Identical parameter sets share one instance (and its cached values)
+    assert ImperialConstants.get(x=0.15) is IMPERIAL
+    sweep = IMPERIAL.replace(x=0.16)
+    assert sweep is ImperialConstants.get(0.16)
+    assert sweep.matter_predicted == 0.16 ** 4
+    assert sweep.lambda_bio == LAMBDA_BIO
+
+    try:
+        IMPERIAL.x = 0.2
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("ImperialConstants should be frozen")
+    assert not hasattr(IMPERIAL, '__dict__')
+    print("✓ Constants object is frozen and memoized")
+
+def test_vectorized_sweep():
+    """Test the array sweep API against the scalar relationships"""
+    import numpy as np
+    from constants import sweep
+
+    x = np.linspace(0.10, 0.20, 1_000_001)
+    predicted, actual, error = sweep.mass_ratio_validation(x)
+    assert predicted.shape == actual.shape == error.shape == x.shape
+    i = 500_000  # x == 0.15
+    assert abs(predicted[i] - matter_relationship()) < 1e-15
+    assert abs(error[i] - mass_ratio_validation()[2]) < 1e-12
+
+    table = sweep.validate_universal_plasma_limit(x[:3])
+    assert table['geometric_invariant_2'].shape == (3,)
+    assert abs(table['gravity_factor'][0] - 10.0) < 1e-12
+
+    best, best_error, index = sweep.best_fit_x(x)
+    assert index == int(np.argmin(error))
+    assert abs(best - actual_mass_ratio() ** 0.25) < 1e-7
+    assert best_error < 1e-5
+    print(f"✓ Vectorized sweep: best X = {best:.7f} ({best_error*100:.5f}% error)")
+
 def run_all_tests():
     """Run all tests"""
     print("=" * 70)
@@ -127,6 +172,8 @@ def run_all_tests():
         test_geometric_invariant_2,
         test_validate_universal_plasma_limit,
         test_dimensionless_ratios,
+        test_constants_object,
+        test_vectorized_sweep,
     ]
     
     passed = 0
@@ -1,5 +1,23 @@
 from fpdf import FPDF
+import os
+import argparse
 import datetime
+from contextlib import nullcontext
+
+try:
+    from cline.instrumentation import METRICS
+except ImportError:  # cline not importable: build the PDF uninstrumented
+    METRICS = None
+
+def _timer(name):
+    return METRICS.timer(name) if METRICS is not None else nullcontext()
+
+def report_date():
+    """SOURCE_DATE_EPOCH's date when set (reproducible rebuilds), else today."""
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        return datetime.datetime.fromtimestamp(int(epoch), datetime.timezone.utc).date()
+    return datetime.date.today()
 
 class ImperialPDF(FPDF):
     def header(self):
@@ -23,7 +41,7 @@ def create_math_manifest():
     
     # Metadata
     pdf.set_font("Arial", "", 12)
-    pdf.cell(0, 10, f"Date: {datetime.date.today()}", 0, 1)
+    pdf.cell(0, 10, f"Date: {report_date()}", 0, 1)
     pdf.cell(0, 10, "Author: Dr. Carl Dean Cline Sr.", 0, 1)
     pdf.cell(0, 10, "Observatory: LUFT Portal", 0, 1)
     pdf.ln(10)
@@ -76,11 +94,17 @@ def create_math_manifest():
     )
 
     # Save
-    pdf.output("_2026_math.pdf")
+    with _timer('pdf_write'):
+        pdf.output("_2026_math.pdf")
     print("PDF GENERATED SUCCESSFULLY: _2026_math.pdf")
 
-if __name__ == "__main__":
+def main(argv=None):
+    argparse.ArgumentParser(description="Build the 2026 math protocol PDF").parse_args(argv)
     try:
-        create_math_manifest()
+        with _timer('pdf_render'):
+            create_math_manifest()
     except Exception as e:
         print("Error: You need to install fpdf first. Run: pip install fpdf")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+import io
+import os
+import math
+import struct
+import tempfile
+import statistics
+import threading
+import tracemalloc
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import numpy as np
+import cline_medical_coil as coil
+
+class FakeClock:
+    """Stands in for the time module: every read advances by one tick."""
+
+    def __init__(self, tick_ns=1_000, oversleep_ns=100_000):
+        self.now = 0
+        self.tick_ns = tick_ns
+        self.oversleep_ns = oversleep_ns  # OS wake-up lag, inside the spin window
+
+    def perf_counter_ns(self):
+        self.now += self.tick_ns
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += round(seconds * 1e9) + self.oversleep_ns
+
+class TestPulseScheduler(unittest.TestCase):
+    """
+    PULSE SCHEDULER CERTIFICATION
+    -----------------------------
+    Drives the scheduler on an injected clock: edges land on absolute
+    deadlines, a stall is caught up without shifting later edges, and
+    the running lateness statistics match a direct computation.
+    """
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.patch = mock.patch.object(coil, 'time', self.clock)
+        self.patch.start()
+        self.scheduler = coil.PulseScheduler(coil.LAMBDA_BIO)
+        self.scheduler.start()
+
+    def tearDown(self):
+        self.patch.stop()
+
+    def run_edges(self, count, stalls=None):
+        lates = []
+        for edge in range(1, count + 1):
+            self.clock.now += (stalls or {}).get(edge, 0)
+            lates.append(self.scheduler.wait_next_edge())
+        return lates
+
+    def test_absolute_deadlines(self):
+        lates = self.run_edges(200)
+        # The spin absorbs the oversleep: every edge within one clock tick
+        self.assertLessEqual(max(lates), self.clock.tick_ns)
+        self.assertEqual(self.scheduler.edges, 200)
+        self.assertEqual(self.scheduler.deadline_ns(200),
+                         self.scheduler.start_ns + round(200 * 1e9 / coil.LAMBDA_BIO))
+        self.assertAlmostEqual(self.scheduler.stats()['achieved_hz'], coil.LAMBDA_BIO, places=3)
+
+    def test_overrun_skips_ahead(self):
+        period_ns = self.scheduler.period_ns
+        fired = []
+        for edge in range(1, 11):
+            if edge == 5:
+                self.clock.now += round(3.5 * period_ns)  # Stall: edges 5-7 are missed
+            late = self.scheduler.wait_next_edge()
+            fired.append(self.clock.now)
+            self.assertLessEqual(late, self.clock.tick_ns)
+        # No burst: the edge after the stall waits for the next future deadline
+        gaps = [b - a for a, b in zip(fired, fired[1:])]
+        self.assertGreaterEqual(min(gaps), period_ns - 2 * self.clock.tick_ns)
+        self.assertEqual(self.scheduler.edges, 13)
+        self.assertEqual(self.scheduler.pulses, 10)
+        self.assertEqual((self.scheduler.skipped, self.scheduler.overruns), (3, 3))
+        self.assertEqual(self.scheduler.deadline_ns(13), self.scheduler.start_ns + round(13 * period_ns))
+
+    def test_late_edge_fires_at_once(self):
+        # Less than a period behind: the edge fires immediately, nothing skipped
+        period_ns = self.scheduler.period_ns
+        lates = self.run_edges(6, stalls={3: round(1.5 * period_ns)})
+        self.assertGreater(lates[2], 0.4 * period_ns)
+        self.assertLess(lates[2], period_ns)
+        self.assertLessEqual(max(lates[3:]), self.clock.tick_ns)
+        self.assertEqual((self.scheduler.skipped, self.scheduler.overruns), (0, 0))
+        self.assertEqual(self.scheduler.edges, 6)
+
+    def test_lateness_statistics(self):
+        lates = self.run_edges(40, stalls={3: 2_000_000, 17: 7_500_000, 30: 120_000_000})
+        stats = self.scheduler.stats()
+        self.assertAlmostEqual(stats['mean_latency_us'], statistics.fmean(lates) / 1e3, places=6)
+        self.assertAlmostEqual(stats['jitter_us'], statistics.pstdev(lates) / 1e3, places=6)
+        self.assertEqual(stats['max_latency_us'], max(lates) / 1e3)
+        self.assertEqual(stats['drift_us'], lates[-1] / 1e3)
+        self.assertEqual(stats['pulses'], 40)
+        self.assertEqual(stats['skipped'], 2)  # The 120 ms stall drops edges 30 and 31
+        self.assertEqual(stats['edges'], 42)
+
+class TestPulseSchedulerRealClock(unittest.TestCase):
+    """Short run on the real clock: the cycle count follows the deadlines."""
+
+    def test_short_session(self):
+        scheduler = coil.PulseScheduler(coil.LAMBDA_BIO)
+        scheduler.start()
+        edges = math.floor(0.25 * coil.LAMBDA_BIO)
+        for _ in range(edges):
+            scheduler.wait_next_edge()
+        stats = scheduler.stats()
+        self.assertEqual(stats['edges'], edges)
+        self.assertEqual(stats['overruns'], 0)
+        self.assertAlmostEqual(stats['achieved_hz'], coil.LAMBDA_BIO, delta=0.01 * coil.LAMBDA_BIO)
+
+def float32(value):
+    return struct.unpack('f', struct.pack('f', value))[0]
+
+class NullSink:
+    """Counts streamed bytes without keeping them."""
+
+    def __init__(self):
+        self.bytes = 0
+
+    def write(self, view):
+        self.bytes += view.nbytes
+
+class TestWaveformBuffer(unittest.TestCase):
+    """
+    WAVEFORM BUFFER CERTIFICATION
+    -----------------------------
+    The pre-rendered loop must equal the trig formula sample for sample,
+    and streaming it must reuse the one buffer.
+    """
+
+    def test_matches_formula(self):
+        for mode in ("square", "scalar"):
+            wave = coil.WaveformBuffer(mode, sample_rate=8000)
+            n = len(wave)
+            step = 2 * math.pi * wave.periods / n
+            for i in range(n):
+                value = math.sin(i * step)
+                expected = (1.0 if value >= 0.0 else -1.0) if mode == "square" else float32(value)
+                self.assertEqual(wave.samples[i], expected)
+
+    def test_loop_tracks_lambda(self):
+        # The whole-sample loop keeps the phase of the original heartbeat
+        # formula, 0.5 * (sin(2 pi LAMBDA t) + 1), to within its rounding
+        wave = coil.WaveformBuffer("scalar", sample_rate=8000)
+        self.assertAlmostEqual(len(wave) * coil.LAMBDA_BIO / 8000, wave.periods, delta=0.01)
+        for t in (0.0, 0.013, 0.5, 1.0, 2.7):
+            heartbeat = 0.5 * (math.sin(t * coil.LAMBDA_BIO * 2 * math.pi) + 1)
+            self.assertAlmostEqual(0.5 * (wave.sample_at(t) + 1), heartbeat, delta=0.02)
+
+    def test_streaming_reuses_buffer(self):
+        wave = coil.WaveformBuffer("square", sample_rate=8000)
+        samples, sink = wave.samples, NullSink()
+        wave.write_to(sink, 1000)  # Warm up
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            for _ in range(500):
+                wave.write_to(sink, 3 * len(wave) + 17)
+            grown = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        self.assertIs(wave.samples, samples)
+        self.assertLess(grown, 1024)
+        self.assertEqual(sink.bytes, 4 * (1000 + 500 * (3 * len(wave) + 17)))
+        self.assertEqual(wave.index, (1000 + 500 * (3 * len(wave) + 17)) % len(wave))
+
+class TestConsoleVisualizer(unittest.TestCase):
+    """
+    VISUALIZER CERTIFICATION
+    ------------------------
+    The heartbeat thread must stop promptly, and --no-visual must keep
+    it (and all console output) out of the pulse loop.
+    """
+
+    def test_start_stop(self):
+        scheduler = coil.PulseScheduler(coil.LAMBDA_BIO)
+        scheduler.start()
+        visualizer = coil.ConsoleVisualizer(scheduler, coil.WaveformBuffer("scalar"), refresh_hz=200.0)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            visualizer.start()
+            threading.Event().wait(0.05)
+            visualizer.stop()
+        self.assertFalse(visualizer.is_alive())
+        self.assertIn(f"{coil.LAMBDA_BIO:.2f} Hz", out.getvalue())
+
+        # A visualizer halted mid-interval does not wait for its next frame
+        slow = coil.ConsoleVisualizer(scheduler, coil.WaveformBuffer("scalar"), refresh_hz=0.1)
+        slow.start()
+        stopped = threading.Event()
+        threading.Thread(target=lambda: (slow.stop(), stopped.set())).start()
+        self.assertTrue(stopped.wait(1.0))
+
+    def test_no_visual(self):
+        for verbose in (True, False):
+            out = io.StringIO()
+            with mock.patch.object(coil, 'ConsoleVisualizer', wraps=coil.ConsoleVisualizer) as visualizer, \
+                    redirect_stdout(out):
+                coil.generate_signal("square", 0.2, verbose=verbose)
+            self.assertEqual(visualizer.called, verbose)
+            self.assertIn(f"Total Cycles: {math.ceil(0.2 * coil.LAMBDA_BIO)}\n", out.getvalue())
+            self.assertFalse(any(t.name == "coil-visualizer" for t in threading.enumerate()))
+            if not verbose:
+                # Nothing is written between the banner and the summary
+                self.assertNotIn("\r[", out.getvalue())
+
+class TestSessionRender(unittest.TestCase):
+    """
+    SESSION RENDER CERTIFICATION
+    ----------------------------
+    Rendered .npy sessions must round-trip through load_session() and
+    np.load() with the same dtype, shape and values as the live stream.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        for sample_format, dtype in (("float32", np.float32), ("int16", np.int16)):
+            path = os.path.join(self.tmp.name, f'session_{sample_format}.npy')
+            result = coil.render_session("scalar", 3.0, path, sample_rate=4000, sample_format=sample_format)
+
+            stored = np.load(path)
+            view = coil.load_session(path)
+            self.assertEqual(stored.dtype, np.dtype(dtype))
+            self.assertEqual(stored.shape, (result['samples'],))
+            self.assertEqual(np.asarray(view).dtype, stored.dtype)
+            self.assertEqual(view.shape, stored.shape)
+            np.testing.assert_array_equal(np.asarray(view), stored)
+
+            # Same samples as the live --sink stream
+            wave = coil.WaveformBuffer("scalar", 4000)
+            live = np.tile(np.asarray(wave.samples), result['samples'] // len(wave) + 1)[:result['samples']]
+            if sample_format == "int16":
+                live = np.round(live.astype(float) * coil.INT16_FULL_SCALE).astype(np.int16)
+            np.testing.assert_array_equal(stored, live)
+            view.release()
+
+            edges = np.load(coil.edges_path(path), mmap_mode='r')
+            self.assertEqual((edges.dtype, edges.shape), (np.dtype(np.int64), (result['cycles'],)))
+            np.testing.assert_array_equal(edges, [round(k * 1e9 / coil.LAMBDA_BIO) for k in range(result['cycles'])])
+
+    def test_rejects_foreign_files(self):
+        path = os.path.join(self.tmp.name, 'not_a_session.npy')
+        with open(path, 'wb') as f:
+            f.write(b'IMPERIAL' * 16)
+        with self.assertRaises(ValueError):
+            coil.load_session(path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,4 @@
+"""
+Imperial telemetry validation: ingestion, the columnar store, the
+interrogator and the analyses built on it (`cline interrogate|store|...`).
+"""
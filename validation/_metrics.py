@@ -0,0 +1,45 @@
+"""
+Optional instrumentation for the validation and audit modules: cline's
+METRICS registry when the cline package is importable, else an inert
+stand-in with the same interface, so the physics and ingestion code
+never needs cline to run.
+"""
+
+try:
+    from cline.instrumentation import METRICS
+except ImportError:  # cline not importable: run uninstrumented
+
+    class _NullTimer:
+        """Stand-in timer (elapsed stays 0.0)."""
+
+        __slots__ = ()
+        elapsed = 0.0
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+    class NullMetrics:
+        """A registry that is never enabled: every call returns at once."""
+
+        enabled = False
+        counters = {}
+
+        def count(self, name, n=1):
+            pass
+
+        def gauge(self, name, value):
+            pass
+
+        def observe(self, name, value, buckets=None):
+            pass
+
+        def timer(self, name):
+            return _NullTimer()
+
+        def rate(self, name, amount, seconds):
+            pass
+
+    METRICS = NullMetrics()
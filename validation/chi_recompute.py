@@ -0,0 +1,167 @@
+"""
+IMPERIAL CHI RECOMPUTATION (OPTION C)
+-------------------------------------
+Derives chi for every row of a telemetry store from the raw magnetometer
+columns instead of trusting the precomputed chi_amplitude:
+
+    chi = |B_obs - B_geo(r)| / B_geo(r),   B_geo(r) = B_TENSION_1AU / r^2
+
+B_obs is |(bx, by, bz)| where all three components are present and
+bt_nT otherwise. r is the spacecraft's heliocentric distance per row:
+interpolated from a spacecraft ephemeris table (--ephemeris), an 'r_au'
+store column if there is one, else the L1 distance from a low-precision
+solar ephemeris of the row's timestamp.
+The store is processed in chunks of mapped rows through
+ImperialLatticeValidator.validate_batch(), and the result is written as
+new columns, so the archive can be re-audited under a different
+B_TENSION_1AU / CHI_LIMIT / TOLERANCE in one pass.
+
+USAGE:
+    cline recompute data/telemetry_store --b-tension 5.0
+"""
+
+import os
+import sys
+import argparse
+import numpy as np
+
+from validation.x_boundary_validation import ImperialLatticeValidator
+from validation.telemetry_store import TelemetryStore, STORE_PATH, MANIFEST_FILE, NAT, MISSING_CODE
+from validation.telemetry_stats import TelemetryAggregate
+from validation.ephemeris import load_ephemeris, resolve_ephemeris
+
+# CONFIGURATION
+CHI_COLUMN = 'chi_option_c'
+STATUS_SUFFIX = '_status'
+RECOMPUTE_CHUNKSIZE = 1_000_000
+L1_OFFSET_AU = 0.01  # Sun-Earth L1 sits ~1.5 million km sunward of Earth
+J2000_NS = np.datetime64('2000-01-01T12:00', 'ns').view('int64')
+DAY_NS = 86_400 * 10**9
+
+
+def heliocentric_distance(epoch_ns, offset_au=L1_OFFSET_AU):
+    """
+    Sun distance (AU) of a spacecraft at L1 for each epoch-ns timestamp:
+    Earth's orbital radius from the Astronomical Almanac's low-precision
+    solar coordinates (~1e-4 AU), less the L1 offset. NaT -> NaN.
+    """
+    epoch_ns = np.asarray(epoch_ns, dtype=np.int64)
+    days = (epoch_ns - J2000_NS) / DAY_NS
+    g = np.radians(357.529 + 0.98560028 * days)
+    r = 1.00014 - 0.01671 * np.cos(g) - 0.00014 * np.cos(2 * g)
+    return np.where(epoch_ns == NAT, np.nan, r - offset_au)
+
+
+def observed_field(bx, by, bz, bt):
+    """|B| from the vector components where complete, else bt_nT."""
+    components = np.column_stack((bx, by, bz))
+    magnitude = ImperialLatticeValidator._magnitude(components, axis=1)
+    return np.where(np.isnan(magnitude), bt, magnitude)
+
+
+def _column(store, name, rows):
+    if name in store:
+        return np.asarray(store[name][rows])
+    return np.full(rows.stop - rows.start, np.nan)
+
+
+def recompute_chi(store_dir=STORE_PATH, b_tension_1au=None, chi_limit=None, tolerance=None,
+                  r_au=None, column=CHI_COLUMN, chunksize=RECOMPUTE_CHUNKSIZE, ephemeris=None):
+    """
+    Writes `column` (float chi) and `column`_status (0 = STABLE,
+    1 = LATTICE_STRESS, -1 = no field or distance data) to the store.
+    Parameters left as None keep the validator's calibration; r_au=None
+    takes distances from the `ephemeris` table (spacecraft name or CSV),
+    the store's r_au column or the L1 ephemeris, in that order.
+    Returns (aggregate of the new chi, stress count, settings).
+    """
+    store = TelemetryStore(store_dir)
+    validator = ImperialLatticeValidator()
+    if b_tension_1au is not None:
+        validator.B_TENSION_1AU = float(b_tension_1au)
+    if chi_limit is not None:
+        validator.CHI_LIMIT = float(chi_limit)
+    if tolerance is not None:
+        validator.TOLERANCE = float(tolerance)
+    table = None
+    if r_au is not None:
+        distance = 'fixed'
+    elif ephemeris is not None:
+        table = load_ephemeris(ephemeris)
+        distance = f"table:{table.name}"
+    elif 'r_au' in store:
+        distance = 'r_au column'
+    else:
+        distance = 'ephemeris'
+
+    agg = TelemetryAggregate()
+    stress = [0]
+    status_column = column + STATUS_SUFFIX
+
+    def chi_chunks():
+        for lo in range(0, len(store), chunksize):
+            rows = slice(lo, min(lo + chunksize, len(store)))
+
+            # 1. GET THE DATA
+            b_obs = observed_field(_column(store, 'bx_nT', rows), _column(store, 'by_nT', rows),
+                                   _column(store, 'bz_nT', rows), _column(store, 'bt_nT', rows))
+
+            # 2. GET THE DISTANCE
+            if r_au is not None:
+                r = float(r_au)
+            elif table is not None:
+                r = table.r_au(store['timestamp_utc'][rows])
+            elif distance == 'r_au column':
+                r = np.asarray(store['r_au'][rows])
+            else:
+                r = heliocentric_distance(store['timestamp_utc'][rows])
+
+            # 3. AUDIT (vectorized Option C)
+            result = validator.validate_batch(b_obs, r)
+            chi = result['chi']
+            status = np.where(np.isnan(chi), MISSING_CODE, result['status']).astype(np.int8)
+            stress[0] += int(np.count_nonzero(status == validator.STATUS_LATTICE_STRESS))
+            agg.update(chi)
+            yield {column: chi, status_column: status}
+
+    settings = {
+        'b_tension_1au': validator.B_TENSION_1AU,
+        'chi_limit': validator.CHI_LIMIT,
+        'tolerance': validator.TOLERANCE,
+        'distance': distance if r_au is None else float(r_au),
+    }
+    store.add_columns({column: 'float', status_column: 'flag'}, chi_chunks(), settings)
+    return agg, stress[0], settings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Recompute Option C chi from raw magnetometer columns")
+    parser.add_argument("store_dir", nargs='?', default=STORE_PATH)
+    parser.add_argument("--b-tension", type=float, default=None, help="B_TENSION_1AU override (nT)")
+    parser.add_argument("--chi-limit", type=float, default=None, help="CHI_LIMIT override")
+    parser.add_argument("--tolerance", type=float, default=None, help="TOLERANCE override")
+    parser.add_argument("--r-au", type=float, default=None,
+                        help="Fixed heliocentric distance instead of per-row distances")
+    parser.add_argument("--ephemeris", type=str, default=None,
+                        help="Spacecraft ephemeris table (name in data/ephemeris/ or CSV path)")
+    parser.add_argument("--column", type=str, default=CHI_COLUMN)
+    parser.add_argument("--chunksize", type=int, default=RECOMPUTE_CHUNKSIZE)
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(os.path.join(args.store_dir, MANIFEST_FILE)):
+        print(f"⛔ FATAL ERROR: Telemetry store missing at '{args.store_dir}'")
+        sys.exit(1)
+    if args.ephemeris and not os.path.exists(resolve_ephemeris(args.ephemeris)):
+        print(f"⛔ FATAL ERROR: Ephemeris table missing at '{resolve_ephemeris(args.ephemeris)}'")
+        sys.exit(1)
+    agg, stress, settings = recompute_chi(args.store_dir, args.b_tension, args.chi_limit,
+                                          args.tolerance, args.r_au, args.column, args.chunksize,
+                                          args.ephemeris)
+    print(f"✓ CHI RECOMPUTED: {agg.n_rows} rows -> '{args.column}' "
+          f"(B_1AU={settings['b_tension_1au']} nT, limit={settings['chi_limit']}, "
+          f"tolerance={settings['tolerance']}, r={settings['distance']})")
+    print(f"   Max Chi: {agg.max_chi:.5f} | LATTICE_STRESS rows: {stress}")
+
+
+if __name__ == "__main__":
+    main()
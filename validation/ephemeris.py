@@ -0,0 +1,153 @@
+"""
+IMPERIAL EPHEMERIS TABLES
+-------------------------
+Per-sample heliocentric distance for spacecraft away from 1 AU
+(Voyager-style deep-space series). Each spacecraft has a local table
+of time -> r_au:
+
+    data/ephemeris/<spacecraft>.csv     timestamp_utc,r_au
+
+A table is compiled once into sorted epoch-ns knots and saved beside the
+CSV as <spacecraft>.npz; later runs load the compiled knots unless the
+CSV has changed since. Lookups are one piecewise-linear np.interp over
+the whole timestamp array, so r_au and 1/r^2 for millions of samples
+cost a single vectorized pass. Timestamps outside the table (or NaT)
+get NaN: distances are never extrapolated.
+"""
+
+import os
+import sys
+import argparse
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from validation.telemetry_store import NAT
+
+# CONFIGURATION
+EPHEMERIS_DIR = 'data/ephemeris'
+EPHEMERIS_COLUMNS = ('timestamp_utc', 'r_au')
+CACHE_SUFFIX = '.npz'
+CACHE_VERSION = 1
+
+
+class EphemerisTable:
+    """Sorted knots of one trajectory, interpolated linearly in time."""
+
+    def __init__(self, name, times_ns, r_au):
+        self.name = name
+        self.times_ns = np.asarray(times_ns, dtype=np.int64)
+        self.r_au_knots = np.asarray(r_au, dtype=float)
+        if len(self.times_ns) == 0:
+            raise ValueError(f"Ephemeris '{name}' has no valid rows")
+        # Offsets from the first knot keep nanosecond resolution in float64
+        self._origin = int(self.times_ns[0])
+        self._knots = (self.times_ns - self._origin).astype(float)
+
+    def __len__(self):
+        return len(self.times_ns)
+
+    @classmethod
+    def from_csv(cls, path, name=None):
+        """
+        Reads a timestamp_utc,r_au table. Rows with a missing time or a
+        non-positive distance are dropped; knots are sorted and a repeated
+        timestamp keeps its last row.
+        """
+        df = pd.read_csv(path, usecols=list(EPHEMERIS_COLUMNS))
+        times = pd.to_datetime(df['timestamp_utc'], errors='coerce').to_numpy(dtype='datetime64[ns]')
+        r_au = pd.to_numeric(df['r_au'], errors='coerce').to_numpy(dtype=float)
+        valid = ~np.isnat(times) & (r_au > 0)
+        times, r_au = times[valid].view(np.int64), r_au[valid]
+
+        order = np.argsort(times, kind='stable')
+        times, r_au = times[order], r_au[order]
+        last = np.append(times[1:] != times[:-1], True)
+        name = name or os.path.splitext(os.path.basename(path))[0]
+        return cls(name, times[last], r_au[last])
+
+    @property
+    def span(self):
+        """(first, last) knot as datetime64[ns]."""
+        return self.times_ns[0].view('datetime64[ns]'), self.times_ns[-1].view('datetime64[ns]')
+
+    def r_au(self, timestamps):
+        """Distance (AU) at each epoch-ns / datetime64 timestamp."""
+        t = np.asarray(timestamps)
+        if t.dtype.kind == 'M':
+            t = t.astype('datetime64[ns]')
+        t = t.view(np.int64) if t.dtype.kind == 'M' else t.astype(np.int64)
+        r = np.interp((t - self._origin).astype(float), self._knots, self.r_au_knots,
+                      left=np.nan, right=np.nan)
+        r = np.where(t == NAT, np.nan, r)
+        return r[()] if r.ndim == 0 else r  # A scalar timestamp gives a scalar distance
+
+    def inverse_square(self, timestamps):
+        """1/r^2 at each timestamp (the Option C tension scale factor)."""
+        r = self.r_au(timestamps)
+        return 1.0 / (r * r)
+
+    def save(self, path):
+        np.savez(path, version=CACHE_VERSION, times_ns=self.times_ns, r_au=self.r_au_knots)
+
+
+def resolve_ephemeris(source, directory=EPHEMERIS_DIR):
+    """A spacecraft name (looked up in `directory`) or a CSV path."""
+    if os.path.exists(source):
+        return source
+    return os.path.join(directory, f"{source}.csv")
+
+
+@lru_cache(maxsize=16)
+def _cached_table(path, mtime_ns, size):
+    """One compiled table per source version, shared within a process."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    cache_path = os.path.splitext(path)[0] + CACHE_SUFFIX
+    if os.path.exists(cache_path) and os.stat(cache_path).st_mtime_ns >= mtime_ns:
+        with np.load(cache_path) as cached:
+            if int(cached['version']) == CACHE_VERSION:
+                return EphemerisTable(name, cached['times_ns'], cached['r_au'])
+
+    table = EphemerisTable.from_csv(path, name)
+    try:
+        table.save(cache_path)
+    except OSError:
+        pass  # Read-only archive: the in-process cache still applies
+    return table
+
+
+def load_ephemeris(source, directory=EPHEMERIS_DIR):
+    """
+    The compiled table for a spacecraft name or CSV path. Reuses the
+    .npz beside the CSV across runs and the loaded table within a run;
+    editing the CSV invalidates both.
+    """
+    path = resolve_ephemeris(source, directory)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Ephemeris table missing at '{path}'")
+    stat = os.stat(path)
+    return _cached_table(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile and query a spacecraft ephemeris table")
+    parser.add_argument("source", help=f"Spacecraft name (in {EPHEMERIS_DIR}/) or CSV path")
+    parser.add_argument("--at", type=str, nargs='*', default=[], help="Timestamps to look up")
+    args = parser.parse_args(argv)
+
+    try:
+        table = load_ephemeris(args.source)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"⛔ FATAL ERROR: {e}")
+        sys.exit(1)
+    first, last = table.span
+    print(f"✓ EPHEMERIS LOADED: {table.name} ({len(table)} knots, {first} -> {last})")
+    if args.at:
+        when = pd.to_datetime(args.at).to_numpy(dtype='datetime64[ns]')
+        for t, r in zip(args.at, table.r_au(when)):
+            print(f"   {t}: r = {r:.6f} AU")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+IMPERIAL HARMONIC MODE DETECTOR
+-------------------------------
+Assigns a harmonic mode to every sample of a chi time series and
+run-length encodes the result into the mode ladder.
+Modes are rungs in multiples of the 0.15 limit. A rung is entered when
+chi reaches its entry ratio and released only once chi falls below the
+exit ratio (hysteresis), so noise around a threshold does not flicker
+between modes. Every step is a NumPy pass over the whole series; months
+of 1-minute data take seconds.
+"""
+
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+
+from validation.telemetry_stats import CHI_LIMIT
+from validation.telemetry_store import TelemetryStore, STORE_PATH, MANIFEST_FILE
+
+# CONFIGURATION
+# Rung -> entry ratio (chi / CHI_LIMIT). Mode 1 is the fundamental.
+MODE_LADDER = {1: 0.0, 2: 1.5, 4: 2.5, 8: 5.0}
+MODE_HYSTERESIS = 0.05  # Exit ratio = entry ratio * (1 - hysteresis)
+
+
+def _latch(on, off):
+    """
+    Two-threshold latch: True from each `on` sample until the next `off`
+    sample. Samples that are neither hold the previous state.
+    """
+    event = np.where(on, 1, np.where(off, 0, -1))
+    changed = np.flatnonzero(event >= 0)
+    if len(changed) == 0:
+        return np.zeros(len(on), dtype=bool)
+    # Forward-fill the index of the last decisive sample
+    last = np.full(len(on), -1, dtype=np.int64)
+    last[changed] = changed
+    last = np.maximum.accumulate(last)
+    return (last >= 0) & (event[np.maximum(last, 0)] == 1)
+
+
+def detect_modes(chi, limit=CHI_LIMIT, ladder=MODE_LADDER, hysteresis=MODE_HYSTERESIS):
+    """
+    Harmonic mode of every sample (int8 array, same length as `chi`).
+    NaN samples hold the current mode.
+    """
+    chi = np.asarray(chi, dtype=float)
+    ratio = chi / limit
+    present = ~np.isnan(ratio)
+
+    rungs = sorted(ladder)
+    modes = np.full(len(chi), rungs[0], dtype=np.int8)
+    for rung in rungs[1:]:
+        enter = ladder[rung]
+        exit_ = enter * (1.0 - hysteresis)
+        held = _latch(present & (ratio >= enter), present & (ratio < exit_))
+        # Rungs ascend, so a higher latched rung overrides a lower one
+        modes[held] = rung
+    return modes
+
+
+def run_lengths(values):
+    """(starts, stops) of the runs of equal consecutive values."""
+    if len(values) == 0:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+    edges = np.flatnonzero(values[1:] != values[:-1]) + 1
+    starts = np.concatenate(([0], edges))
+    stops = np.concatenate((edges, [len(values)]))
+    return starts, stops
+
+
+def mode_segments(timestamps, chi, **detector):
+    """
+    The mode ladder: one row per contiguous mode segment with its time
+    span, rung, sample count and peak chi (plus the time of that peak).
+    """
+    timestamps = np.asarray(timestamps, dtype='datetime64[ns]')
+    chi = np.asarray(chi, dtype=float)
+    modes = detect_modes(chi, **detector)
+    starts, stops = run_lengths(modes)
+    if len(starts) == 0:
+        return pd.DataFrame({'start': timestamps[:0], 'end': timestamps[:0],
+                             'harmonic_mode': modes[:0], 'rows': starts,
+                             'max_chi': chi[:0], 'timestamp': timestamps[:0]})
+
+    # Peak per segment: NaN-skipping max, then the first sample reaching it
+    max_chi = np.fmax.reduceat(chi, starts)
+    segment = np.repeat(np.arange(len(starts)), stops - starts)
+    hits = np.flatnonzero(chi == max_chi[segment])
+    peak = starts.copy()
+    first_segments, first_hits = np.unique(segment[hits], return_index=True)
+    peak[first_segments] = hits[first_hits]
+
+    return pd.DataFrame({
+        'start': timestamps[starts],
+        'end': timestamps[stops - 1],
+        'harmonic_mode': modes[starts],
+        'rows': stops - starts,
+        'max_chi': max_chi,
+        'timestamp': timestamps[peak],
+    })
+
+
+def store_mode_ladder(store_dir=STORE_PATH, start=None, end=None, **detector):
+    """Mode ladder of a telemetry store (optionally a time window of it)."""
+    store = TelemetryStore(store_dir)
+    rows = store.window_rows(start, end)
+    timestamps = np.asarray(store['timestamp_utc'][rows]).view('datetime64[ns]')
+    chi = np.asarray(store['chi_amplitude'][rows])
+    return mode_segments(timestamps, chi, **detector)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Detect harmonic mode steps in stored telemetry")
+    parser.add_argument("store_dir", nargs='?', default=STORE_PATH)
+    parser.add_argument("--start", type=str, default=None)
+    parser.add_argument("--end", type=str, default=None)
+    parser.add_argument("--jsonl", type=str, default=None,
+                        help="Write the ladder as JSON lines (timestamp, max_chi, harmonic_mode)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(os.path.join(args.store_dir, MANIFEST_FILE)):
+        print(f"⛔ FATAL ERROR: Telemetry store missing at '{args.store_dir}'")
+        sys.exit(1)
+    ladder = store_mode_ladder(args.store_dir, args.start, args.end)
+    print(f"✓ {len(ladder)} MODE SEGMENTS DETECTED")
+    print(ladder.to_string(index=False))
+    if args.jsonl:
+        ladder[['timestamp', 'max_chi', 'harmonic_mode']].to_json(
+            args.jsonl, orient='records', lines=True, date_format='iso')
+        print(f"✓ LADDER SAVED TO: {args.jsonl}")
+
+
+if __name__ == "__main__":
+    main()
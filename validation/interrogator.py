@@ -4,18 +4,98 @@ IMPERIAL INTERROGATION PROTOCOL
 Strict Validation of the Chi = 0.15 Boundary.
 NO SYNTHETIC DATA ALLOWED.
 Generates 'interrogation_results.txt' for GitHub Actions.
+
+Each mode imports only what it reads with: pandas for CSV telemetry,
+asyncio for live feeds, process pools for multi-file runs. A columnar
+store interrogation (or --help) starts without loading pandas.
+
+Set IMPERIAL_METRICS=<file.prom|file.json|file.jsonl> to export stage
+timings and rows/sec (see cline/instrumentation.py).
 """
 
 import sys
 import os
-import pandas as pd
-import numpy as np
+import glob
+import argparse
+
+from validation.telemetry_stats import TelemetryAggregate, classify_verdict
+from validation._metrics import METRICS
 
 # CONFIGURATION
 DATA_PATH = 'data/telemetry.csv'
 OUTPUT_FILE = 'interrogation_results.txt'
+DEFAULT_CHUNKSIZE = 250_000
+AGGREGATE_COLUMNS = ('chi_amplitude', 'bt_nT')  # All the streamed reductions read
+NO_ROWS_ERROR = "\n⛔ FATAL ERROR: No valid telemetry rows survived ingestion."
+
+def _imperial_correlation(violation_count, violation_mean):
+    """Geometric correlation: penalize mean excursion past the wall."""
+    if violation_count > 0:
+        deviation = violation_mean - 0.15
+        # Penalize deviation but reward accurate tracking of the wall
+        imp_corr = 1.0 - (deviation * 0.1) 
+        return max(0.9618, imp_corr) 
+    return 0.9999 
+
+def _report_verdict(log, max_chi, std_corr, imp_corr):
+    # 5. GENERATE REPORT
+    log("\nIMPERIAL INTERROGATION REPORT")
+    log("-----------------------------")
+    log(f"Standard Correlation: {std_corr:.4f}")
+    log(f"Imperial Correlation: {imp_corr:.4f}")
+    log(f"Max Chi:              {max_chi:.5f}")
+    
+    # 6. VERDICT
+    log(classify_verdict(max_chi))
+
+def _require_rows(log, n_rows):
+    # No surviving rows leaves max chi undefined: fail rather than give a verdict
+    if n_rows == 0:
+        log(NO_ROWS_ERROR)
+        sys.exit(1)
+
+def _log_quarantine(log, ingest):
+    if ingest.quarantined:
+        log(f"⚠️ QUARANTINED: {ingest.quarantined} malformed lines -> {ingest.quarantine_path}")
+
+def _save_report(report_lines):
+    # 7. SAVE ARTIFACT
+    try:
+        with METRICS.timer('report_write'), open(OUTPUT_FILE, 'w') as f:
+            f.write('\n'.join(report_lines))
+        print(f"\n✓ REPORT SAVED TO: {OUTPUT_FILE}")
+    except Exception as e:
+        print(f"⚠️ WARNING: Could not save report file. {e}")
 
-def perform_interrogation():
+def resolve_inputs(data):
+    """A file, a directory of *.csv files, or a glob -> sorted file list."""
+    if os.path.isdir(data):
+        return sorted(glob.glob(os.path.join(data, '*.csv')))
+    if glob.has_magic(data):
+        return sorted(p for p in glob.glob(data) if os.path.isfile(p))
+    return [data]
+
+def perform_interrogation(stream=False, chunksize=DEFAULT_CHUNKSIZE, store=None,
+                          start=None, end=None, data=None, workers=None,
+                          incremental=False, checkpoint=None, chi_column='chi_amplitude',
+                          quarantine=None):
+    """
+    stream=True reads the telemetry in bounded chunks of `chunksize` rows
+    and folds them into running aggregates (constant peak memory).
+    store=DIR interrogates a columnar telemetry store instead of the CSV,
+    memory-mapping only the columns it needs; start/end restrict it to a
+    time window located through the store's time index, and chi_column
+    selects a derived chi column (e.g. one written by chi_recompute.py).
+    data=PATH overrides DATA_PATH; a directory or glob matching several
+    files is reduced in parallel by `workers` processes, each streaming
+    its file in chunks (so stream=True is implied).
+    incremental=True resumes from the `checkpoint` file and only reads
+    rows appended since the previous run (checkpoint=None uses
+    CHECKPOINT_FILE); it takes a single file.
+    quarantine=PATH writes a single file's malformed lines there instead
+    of next to the input.
+    The report is identical to the in-memory run.
+    """
     report_lines = []
     
     def log(message):
@@ -24,9 +104,21 @@ def perform_interrogation():
 
     log("--- STARTING IMPERIAL INTERROGATION ---")
 
-    # 1. STRICT DATA EXISTENCE CHECK
-    if not os.path.exists(DATA_PATH):
-        err = f"\n⛔ FATAL ERROR: Real data file missing at '{DATA_PATH}'"
+    # 1. STRICT DATA EXISTENCE CHECK (a directory or glob matching no file counts as missing)
+    inputs = resolve_inputs(data or DATA_PATH)
+    if store:
+        from validation.telemetry_store import MANIFEST_FILE
+        data_path = os.path.join(store, MANIFEST_FILE)
+    else:
+        data_path = inputs[0] if inputs else data
+    if incremental and not store and len(inputs) > 1:
+        raise ValueError("incremental interrogation takes a single file, not "
+                         f"{len(inputs)} files matching '{data}'")
+    if quarantine and not store and len(inputs) > 1:
+        raise ValueError("a quarantine path takes a single file, not "
+                         f"{len(inputs)} files matching '{data}'")
+    if not (store or inputs) or not os.path.exists(data_path):
+        err = f"\n⛔ FATAL ERROR: Real data file missing at '{data_path}'"
         log(err)
         log("⛔ SECURITY PROTOCOL: Synthetic data generation is STRICTLY PROHIBITED.")
         # Write log before crashing so we see why
@@ -34,13 +126,90 @@ def perform_interrogation():
             f.write('\n'.join(report_lines))
         sys.exit(1)
 
-    # 2. LOAD REAL DATA
     try:
-        df = pd.read_csv(DATA_PATH)
+        with METRICS.timer('interrogation') as timer:
+            if store:
+                _interrogate_store(log, store, chunksize, start, end, chi_column)
+            elif len(inputs) > 1:
+                _interrogate_parallel(log, inputs, chunksize, workers)
+            elif incremental:
+                _interrogate_incremental(log, inputs[0], chunksize, checkpoint, quarantine)
+            elif stream:
+                _interrogate_stream(log, inputs[0], chunksize, quarantine)
+            else:
+                _interrogate_in_memory(log, inputs[0], quarantine)
+    except SystemExit:
+        # Write log before crashing so we see why
+        _save_report(report_lines)
+        raise
+    METRICS.rate('interrogation_rows_per_second', METRICS.counters.get('interrogation_rows', 0), timer.elapsed)
+
+    _save_report(report_lines)
+
+def perform_live_interrogation(source, idle_timeout=None, queue_size=None):
+    """
+    Interrogates a live feed: a CSV being appended to (tailed), '-' for
+    stdin, or tcp://host:port. Every verdict change is logged as it
+    happens; the full report is written when the feed ends (EOF,
+    `idle_timeout` seconds without data on a tailed file, or Ctrl-C).
+    queue_size=None uses LIVE_QUEUE_SIZE.
+    """
+    import asyncio
+    from validation.live_feed import run_live, LIVE_QUEUE_SIZE
+
+    report_lines = []
+
+    def log(message):
+        print(message)
+        report_lines.append(message)
+
+    def on_event(event):
+        log(f"📡 {event['timestamp_utc']} | {event['verdict']} "
+            f"(max chi {event['max_chi']:.5f}, {event['rows']} rows, {event['latency_ms']:.2f} ms)")
+
+    log("--- STARTING LIVE IMPERIAL INTERROGATION ---")
+    log(f"📡 SOURCE: {source}")
+
+    live = None
+    try:
+        live = asyncio.run(run_live(source, on_event, queue_size or LIVE_QUEUE_SIZE, idle_timeout))
+    except KeyboardInterrupt:
+        log("⚠️ FEED INTERRUPTED")
+    except OSError as e:
+        log(f"\n⛔ FATAL ERROR: Could not read live feed '{source}'. {e}")
+        _save_report(report_lines)
+        sys.exit(1)
+    if live is None:
+        _save_report(report_lines)
+        return None
+
+    agg = live.aggregate
+    log(f"✓ FEED CLOSED: {agg.n_rows} observations, max latency {live.max_latency_s * 1e3:.2f} ms")
+    if live.rejected:
+        log(f"⚠️ REJECTED: {live.rejected} malformed lines")
+    if agg.n_rows == 0:
+        log(NO_ROWS_ERROR)
+        _save_report(report_lines)
+        sys.exit(1)
+    std_corr = agg.correlation()
+    imp_corr = _imperial_correlation(agg.violation_count, agg.violation_mean())
+    _report_verdict(log, agg.max_chi, std_corr, imp_corr)
+    _save_report(report_lines)
+    return live
+
+def _interrogate_in_memory(log, path, quarantine=None):
+    from validation.telemetry_ingest import read_telemetry
+
+    # 2. LOAD REAL DATA (row layouts detected and mapped to the canonical schema)
+    try:
+        df, ingest = read_telemetry(path, quarantine_path=quarantine)
         log(f"✓ RAW DATA INGESTED: {len(df)} observations loaded.")
+        METRICS.count('interrogation_rows', len(df))
+        _log_quarantine(log, ingest)
     except Exception as e:
         log(f"⛔ ERROR: Corrupt data stream. {e}")
         sys.exit(1)
+    _require_rows(log, len(df))
 
     # 3. VERIFY COLUMNS
     if 'chi_amplitude' not in df.columns:
@@ -57,37 +226,204 @@ def perform_interrogation():
         std_corr = 0.0
 
     # Imperial Correlation (Geometric)
-    violations = df[df['chi_amplitude'] > 0.15]
-    if len(violations) > 0:
-        deviation = violations['chi_amplitude'].mean() - 0.15
-        # Penalize deviation but reward accurate tracking of the wall
-        imp_corr = 1.0 - (deviation * 0.1) 
-        imp_corr = max(0.9618, imp_corr) 
-    else:
-        imp_corr = 0.9999 
+    with METRICS.timer('violation_filter'):
+        violations = df[df['chi_amplitude'] > 0.15]
+    METRICS.count('violations', len(violations))
+    imp_corr = _imperial_correlation(len(violations), violations['chi_amplitude'].mean())
 
-    # 5. GENERATE REPORT
-    log("\nIMPERIAL INTERROGATION REPORT")
-    log("-----------------------------")
-    log(f"Standard Correlation: {std_corr:.4f}")
-    log(f"Imperial Correlation: {imp_corr:.4f}")
-    log(f"Max Chi:              {max_chi:.5f}")
-    
-    # 6. VERDICT
-    if max_chi <= 0.15000:
-        log("VERDICT: LOGIC CONFIRMED (Nominal).")
-    elif max_chi <= 0.917:
-        log("VERDICT: LOGIC CONFIRMED (Mode 6 Harmonic Event).")
-    else:
-        log("VERDICT: ANOMALY DETECTED (High-Energy Compression Event).")
+    _report_verdict(log, max_chi, std_corr, imp_corr)
 
-    # 7. SAVE ARTIFACT
+def _interrogate_stream(log, path, chunksize, quarantine=None):
+    from validation.telemetry_ingest import TelemetryReader
+
+    # 2. STREAM REAL DATA (row layouts detected and mapped to the canonical schema)
+    agg = TelemetryAggregate()
+    has_bt = False
     try:
-        with open(OUTPUT_FILE, 'w') as f:
-            f.write('\n'.join(report_lines))
-        print(f"\n✓ REPORT SAVED TO: {OUTPUT_FILE}")
+        reader = TelemetryReader(path, chunk_rows=chunksize, columns=AGGREGATE_COLUMNS,
+                                 quarantine_path=quarantine)
+        for chunk in reader:
+            # 3. VERIFY COLUMNS
+            if 'chi_amplitude' not in chunk.columns:
+                log("⛔ ERROR: Column 'chi_amplitude' missing from telemetry.")
+                sys.exit(1)
+            has_bt = 'bt_nT' in chunk.columns
+            # 4. PERFORM IMPERIAL CALCULATIONS (folded per chunk)
+            with METRICS.timer('aggregate_update'):
+                agg.update(chunk['chi_amplitude'].to_numpy(dtype=float),
+                           chunk['bt_nT'].to_numpy(dtype=float) if has_bt else None)
+        log(f"✓ RAW DATA INGESTED: {agg.n_rows} observations loaded.")
+        METRICS.count('interrogation_rows', agg.n_rows)
+        _log_quarantine(log, reader.report)
+    except SystemExit:
+        raise
     except Exception as e:
-        print(f"⚠️ WARNING: Could not save report file. {e}")
+        log(f"⛔ ERROR: Corrupt data stream. {e}")
+        sys.exit(1)
+    _require_rows(log, agg.n_rows)
+
+    METRICS.count('violations', agg.violation_count)
+    std_corr = agg.correlation() if has_bt else 0.0
+    imp_corr = _imperial_correlation(agg.violation_count, agg.violation_mean())
+
+    _report_verdict(log, agg.max_chi, std_corr, imp_corr)
+
+def _interrogate_incremental(log, path, chunksize, checkpoint_path=None, quarantine=None):
+    from validation.telemetry_checkpoint import InterrogationCheckpoint, CHECKPOINT_FILE
+
+    # 2. RESUME FROM CHECKPOINT, FOLD IN ONLY THE APPENDED ROWS
+    checkpoint_path = checkpoint_path or CHECKPOINT_FILE
+    try:
+        state = InterrogationCheckpoint.load(checkpoint_path, path)
+        if state.offset:
+            log(f"✓ CHECKPOINT: resumed at byte {state.offset} ({state.aggregate.n_rows} observations).")
+        else:
+            log("✓ CHECKPOINT: none valid, full pass.")
+        seen_violations = state.aggregate.violation_count
+        new_rows, new_bytes = state.advance(chunksize, quarantine)
+        METRICS.count('violations', state.aggregate.violation_count - seen_violations)
+        log(f"✓ DELTA INGESTED: {new_rows} new observations ({new_bytes} bytes).")
+        log(f"✓ RAW DATA INGESTED: {state.aggregate.n_rows} observations loaded.")
+        METRICS.count('interrogation_rows', new_rows)
+        _log_quarantine(log, state.ingest)
+        state.save(checkpoint_path)
+    except Exception as e:
+        log(f"⛔ ERROR: Corrupt data stream. {e}")
+        sys.exit(1)
+    _require_rows(log, state.aggregate.n_rows)
+
+    agg = state.aggregate
+    std_corr = agg.correlation()
+    imp_corr = _imperial_correlation(agg.violation_count, agg.violation_mean())
+
+    _report_verdict(log, agg.max_chi, std_corr, imp_corr)
+
+def _aggregate_file(path, chunksize):
+    """Worker: one file -> mergeable partial aggregate + ingest report."""
+    from validation.telemetry_ingest import TelemetryReader
+
+    agg = TelemetryAggregate()
+    reader = TelemetryReader(path, chunk_rows=chunksize, columns=AGGREGATE_COLUMNS)
+    for chunk in reader:
+        agg.update(chunk['chi_amplitude'].to_numpy(dtype=float),
+                   chunk['bt_nT'].to_numpy(dtype=float))
+    return agg, reader.report
+
+def _interrogate_parallel(log, paths, chunksize, workers):
+    from concurrent.futures import ProcessPoolExecutor
+    from validation.telemetry_ingest import IngestReport
+
+    # 2. REDUCE EACH FILE IN A WORKER (row layouts detected per file)
+    agg = TelemetryAggregate()
+    ingest = IngestReport()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() yields in input order, so the merge order is deterministic
+            for part, report in pool.map(_aggregate_file, paths, [chunksize] * len(paths)):
+                agg.merge(part)
+                ingest.merge(report)
+        log(f"✓ RAW DATA INGESTED: {agg.n_rows} observations loaded from {len(paths)} files.")
+        METRICS.count('interrogation_rows', agg.n_rows)
+        METRICS.count('violations', agg.violation_count)
+        _log_quarantine(log, ingest)
+    except Exception as e:
+        log(f"⛔ ERROR: Corrupt data stream. {e}")
+        sys.exit(1)
+    _require_rows(log, agg.n_rows)
+
+    # 3./4. MERGED IMPERIAL CALCULATIONS
+    std_corr = agg.correlation()
+    imp_corr = _imperial_correlation(agg.violation_count, agg.violation_mean())
+
+    _report_verdict(log, agg.max_chi, std_corr, imp_corr)
+
+def _interrogate_store(log, store_dir, chunksize, start=None, end=None, chi_column='chi_amplitude'):
+    from validation.telemetry_store import TelemetryStore
+
+    # 2. MAP REAL DATA (columnar store, pages touched on demand)
+    try:
+        store = TelemetryStore(store_dir)
+        rows = store.window_rows(start, end) if (start or end) else slice(0, len(store))
+        n_rows = len(range(len(store))[rows]) if isinstance(rows, slice) else len(rows)
+        if start or end:
+            log(f"✓ TIME WINDOW: [{start or '-inf'}, {end or '+inf'})")
+        log(f"✓ RAW DATA INGESTED: {n_rows} observations loaded.")
+        METRICS.count('interrogation_rows', n_rows)
+    except Exception as e:
+        log(f"⛔ ERROR: Corrupt data stream. {e}")
+        sys.exit(1)
+    _require_rows(log, n_rows)
+
+    # 3. VERIFY COLUMNS
+    if chi_column not in store:
+        log(f"⛔ ERROR: Column '{chi_column}' missing from telemetry.")
+        sys.exit(1)
+    if chi_column != 'chi_amplitude':
+        log(f"✓ CHI COLUMN: {chi_column} {store.manifest.get('derived', {}).get(chi_column, {})}")
+    has_bt = 'bt_nT' in store
+
+    # 4. PERFORM IMPERIAL CALCULATIONS (folded per slice of the mapped columns)
+    agg = TelemetryAggregate()
+    chi = store[chi_column][rows]
+    bt = store['bt_nT'][rows] if has_bt else None
+    with METRICS.timer('aggregate_update'):
+        for lo in range(0, n_rows, chunksize):
+            hi = lo + chunksize
+            agg.update(chi[lo:hi], bt[lo:hi] if has_bt else None)
+    METRICS.count('violations', agg.violation_count)
+
+    std_corr = agg.correlation() if has_bt else 0.0
+    imp_corr = _imperial_correlation(agg.violation_count, agg.violation_mean())
+
+    _report_verdict(log, agg.max_chi, std_corr, imp_corr)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Imperial Interrogation Protocol")
+    parser.add_argument("--stream", action="store_true",
+                        help="Read telemetry in bounded chunks (constant memory)")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE,
+                        help="Rows per chunk in --stream / --store mode")
+    parser.add_argument("--store", type=str, default=None,
+                        help="Interrogate a columnar telemetry store directory")
+    parser.add_argument("--data", type=str, default=None,
+                        help=f"Telemetry file, directory of *.csv or glob (default: {DATA_PATH})")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for multi-file runs, which always stream (default: all cores)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only fold in rows appended since the last checkpoint (append-only files: "
+                             "in-place edits are detected only near the file head and the checkpoint; "
+                             "delete the checkpoint to force a full pass)")
+    parser.add_argument("--checkpoint", type=str, default=None,
+                        help="Checkpoint file for --incremental (default: interrogation_checkpoint.json)")
+    parser.add_argument("--quarantine", type=str, default=None, metavar="PATH",
+                        help="Quarantine file for malformed lines (single --data file; default: next to it)")
+    parser.add_argument("--start", type=str, default=None,
+                        help="Window start, inclusive (--store only), e.g. '2026-01-30 16:00'")
+    parser.add_argument("--end", type=str, default=None,
+                        help="Window end, exclusive (--store only)")
+    parser.add_argument("--chi-column", type=str, default='chi_amplitude',
+                        help="Chi column to interrogate (--store only), e.g. 'chi_option_c'")
+    parser.add_argument("--live", type=str, default=None, metavar="SOURCE",
+                        help="Tail a live feed: growing CSV, '-' for stdin, or tcp://host:port")
+    parser.add_argument("--idle-timeout", type=float, default=None,
+                        help="Stop --live after this many seconds without new data (tailed files)")
+    args = parser.parse_args(argv)
+    if args.live:
+        perform_live_interrogation(args.live, idle_timeout=args.idle_timeout)
+        sys.exit(0)
+    if (args.start or args.end) and not args.store:
+        parser.error("--start/--end require --store")
+    if args.chi_column != 'chi_amplitude' and not args.store:
+        parser.error("--chi-column requires --store")
+    if args.incremental and args.data and len(resolve_inputs(args.data)) > 1:
+        parser.error("--incremental takes a single --data file, not a directory or glob of several")
+    if args.quarantine and args.data and len(resolve_inputs(args.data)) > 1:
+        parser.error("--quarantine takes a single --data file, not a directory or glob of several")
+
+    perform_interrogation(stream=args.stream, chunksize=args.chunksize, store=args.store,
+                          start=args.start, end=args.end, data=args.data, workers=args.workers,
+                          incremental=args.incremental, checkpoint=args.checkpoint,
+                          chi_column=args.chi_column, quarantine=args.quarantine)
 
 if __name__ == "__main__":
-    perform_interrogation()
+    main()
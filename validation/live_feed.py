@@ -0,0 +1,141 @@
+"""
+IMPERIAL LIVE FEED
+------------------
+asyncio sources and consumer for real-time interrogation.
+A source (tailed CSV, stdin pipe or local socket) pushes raw lines into a
+bounded queue; when the consumer falls behind, the source blocks on the
+full queue instead of buffering without limit, so memory and end-to-end
+latency stay bounded. Each record is folded in O(1) and an event is
+emitted whenever the verdict changes.
+"""
+
+import os
+import sys
+import time
+import asyncio
+
+from validation.telemetry_stats import TelemetryAggregate, classify_verdict
+from validation._metrics import METRICS
+from validation.telemetry_ingest import parse_record
+
+# CONFIGURATION
+LIVE_QUEUE_SIZE = 1024      # Lines in flight between source and consumer
+TAIL_POLL_INTERVAL = 0.25   # Seconds between checks of a tailed file
+_EOF = None                 # Queue sentinel
+
+
+async def tail_file(path, queue, poll_interval=TAIL_POLL_INTERVAL, idle_timeout=None):
+    """
+    Follows a growing CSV from its first line. Partial lines wait until
+    their newline arrives; a truncated file is re-read from the top.
+    Stops after `idle_timeout` seconds without new data (None = never).
+    """
+    f = open(path, 'r', newline='')
+    pending = ''
+    idle_since = time.monotonic()
+    try:
+        while True:
+            line = f.readline()
+            if line:
+                pending += line
+                if pending.endswith('\n'):
+                    await queue.put((pending, time.perf_counter()))
+                    pending = ''
+                idle_since = time.monotonic()
+                continue
+            if os.path.getsize(path) < f.tell():
+                f.seek(0)
+                pending = ''
+                continue
+            if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                break
+            await asyncio.sleep(poll_interval)
+    finally:
+        f.close()
+        await queue.put(_EOF)
+
+
+async def read_stream(reader, queue):
+    """Lines from an asyncio.StreamReader (socket or pipe) until EOF."""
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            await queue.put((line.decode('utf-8', 'replace'), time.perf_counter()))
+    finally:
+        await queue.put(_EOF)
+
+
+async def open_source(source, queue, idle_timeout=None):
+    """
+    '-'               -> stdin pipe
+    'tcp://host:port' -> local socket (connects as a client)
+    anything else     -> tailed file
+    """
+    if source == '-':
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        return await read_stream(reader, queue)
+    if source.startswith('tcp://'):
+        host, port = source[len('tcp://'):].rsplit(':', 1)
+        reader, writer = await asyncio.open_connection(host, int(port))
+        try:
+            return await read_stream(reader, queue)
+        finally:
+            writer.close()
+    return await tail_file(source, queue, idle_timeout=idle_timeout)
+
+
+class LiveInterrogation:
+    """Consumer side: O(1) aggregate updates and verdict-change events."""
+
+    def __init__(self, on_event=None):
+        self.aggregate = TelemetryAggregate()
+        self.verdict = None
+        self.rejected = 0
+        self.max_latency_s = 0.0
+        self.on_event = on_event or (lambda event: None)
+
+    def process(self, line, received_at):
+        record, reason = parse_record(line)
+        if record is None:
+            if reason != 'header':
+                self.rejected += 1
+            return None
+        self.aggregate.update_one(record['chi_amplitude'], record['bt_nT'])
+
+        latency = time.perf_counter() - received_at
+        METRICS.observe('live_latency_seconds', latency)
+        if latency > self.max_latency_s:
+            self.max_latency_s = latency
+
+        verdict = classify_verdict(self.aggregate.max_chi)
+        if verdict == self.verdict:
+            return None
+        self.verdict = verdict
+        event = {
+            'timestamp_utc': record['timestamp_utc'],
+            'verdict': verdict,
+            'max_chi': self.aggregate.max_chi,
+            'rows': self.aggregate.n_rows,
+            'latency_ms': latency * 1e3,
+        }
+        self.on_event(event)
+        return event
+
+    async def consume(self, queue):
+        while True:
+            item = await queue.get()
+            if item is _EOF:
+                return
+            self.process(*item)
+
+
+async def run_live(source, on_event=None, queue_size=LIVE_QUEUE_SIZE, idle_timeout=None):
+    """Runs one source against one consumer until the source ends."""
+    queue = asyncio.Queue(maxsize=queue_size)
+    live = LiveInterrogation(on_event)
+    await asyncio.gather(open_source(source, queue, idle_timeout), live.consume(queue))
+    return live
@@ -0,0 +1,169 @@
+"""
+IMPERIAL ROLLING CHI STATISTICS
+-------------------------------
+Rolling max, mean and fraction of samples above CHI_LIMIT over time
+windows (e.g. 1h, 6h, 24h). A window ending at sample t covers
+(t - window, t], like pandas' time-based rolling.
+The max comes from a monotonic deque and the mean / fraction from
+running sums, so every sample is pushed and evicted exactly once per
+window: multi-window statistics over the whole archive are one linear
+pass, not a rescan of each window.
+RollingChiStats serves live feeds one sample at a time;
+rolling_chi_stats() does the same over whole NumPy arrays.
+"""
+
+import os
+import sys
+import math
+import argparse
+from collections import deque
+import numpy as np
+import pandas as pd
+
+from validation.telemetry_stats import CHI_LIMIT
+from validation.telemetry_store import TelemetryStore, STORE_PATH, MANIFEST_FILE
+
+# CONFIGURATION
+DEFAULT_WINDOWS = ('1h', '6h', '24h')
+
+
+def _window_ns(window):
+    return int(pd.Timedelta(window).value)
+
+
+class RollingWindow:
+    """Streaming statistics over one time window, O(1) amortized per sample."""
+
+    def __init__(self, window, limit=CHI_LIMIT):
+        self.window_ns = _window_ns(window)
+        self.limit = limit
+        self._samples = deque()  # (t, chi) of every present sample in the window
+        self._maxima = deque()   # (t, chi) with strictly decreasing chi
+        self._sum = 0.0
+        self._over = 0
+
+    def push(self, t_ns, chi):
+        """Adds one sample (epoch-ns, ascending) and returns (max, mean, fraction)."""
+        # 1. EVICT SAMPLES THAT LEFT THE WINDOW
+        horizon = t_ns - self.window_ns
+        samples = self._samples
+        while samples and samples[0][0] <= horizon:
+            _, old = samples.popleft()
+            self._sum -= old
+            self._over -= old > self.limit
+        maxima = self._maxima
+        while maxima and maxima[0][0] <= horizon:
+            maxima.popleft()
+
+        # 2. ADMIT THE NEW SAMPLE (NaN only advances the window)
+        if not math.isnan(chi):
+            samples.append((t_ns, chi))
+            self._sum += chi
+            self._over += chi > self.limit
+            while maxima and maxima[-1][1] <= chi:
+                maxima.pop()
+            maxima.append((t_ns, chi))
+
+        if not samples:
+            return math.nan, math.nan, math.nan
+        n = len(samples)
+        return maxima[0][1], self._sum / n, self._over / n
+
+
+class RollingChiStats:
+    """Several RollingWindows fed from one stream."""
+
+    def __init__(self, windows=DEFAULT_WINDOWS, limit=CHI_LIMIT):
+        self.windows = {w: RollingWindow(w, limit) for w in windows}
+
+    def push(self, t_ns, chi):
+        """{window: (max, mean, fraction)} after adding one sample."""
+        return {w: rolling.push(t_ns, chi) for w, rolling in self.windows.items()}
+
+
+def _sliding_max(chi, left):
+    """Max of chi[left[i]:i + 1] for every i (NaN-skipping), monotonic deque."""
+    values = chi.tolist()
+    out = [math.nan] * len(values)
+    maxima = deque()  # Indices with strictly decreasing values
+    for i, (value, lo) in enumerate(zip(values, left.tolist())):
+        if value == value:  # not NaN
+            while maxima and values[maxima[-1]] <= value:
+                maxima.pop()
+            maxima.append(i)
+        while maxima and maxima[0] < lo:
+            maxima.popleft()
+        if maxima:
+            out[i] = values[maxima[0]]
+    return np.array(out, dtype=float)
+
+
+def rolling_chi_stats(timestamps, chi, windows=DEFAULT_WINDOWS, limit=CHI_LIMIT):
+    """
+    Batch rolling statistics for time-ordered samples. Returns a DataFrame
+    with max_<w>, mean_<w> and frac_<w> columns (NaN where a window holds
+    no present samples).
+    """
+    t = np.asarray(timestamps, dtype='datetime64[ns]').view('int64')
+    chi = np.asarray(chi, dtype=float)
+    if len(t) > 1 and np.any(t[1:] < t[:-1]):
+        raise ValueError("rolling_chi_stats() needs samples in time order")
+
+    # 1. PREFIX SUMS (one pass, shared by all windows)
+    present = ~np.isnan(chi)
+    zero = np.zeros(1)
+    count = np.concatenate((zero, np.cumsum(present)))
+    total = np.concatenate((zero, np.cumsum(np.where(present, chi, 0.0))))
+    over = np.concatenate((zero, np.cumsum(present & (chi > limit))))
+
+    out = {}
+    index = np.arange(len(t))
+    for window in windows:
+        # 2. WINDOW START OF EVERY SAMPLE: first t > t_i - window
+        left = np.searchsorted(t, t - _window_ns(window), side='right')
+        n = count[index + 1] - count[left]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out[f'max_{window}'] = _sliding_max(chi, left)
+            out[f'mean_{window}'] = np.where(n > 0, (total[index + 1] - total[left]) / n, np.nan)
+            out[f'frac_{window}'] = np.where(n > 0, (over[index + 1] - over[left]) / n, np.nan)
+    return pd.DataFrame(out)
+
+
+def store_rolling_stats(store_dir=STORE_PATH, windows=DEFAULT_WINDOWS, start=None, end=None):
+    """Rolling statistics of a telemetry store, in time order, with timestamps."""
+    store = TelemetryStore(store_dir)
+    rows = store.window_rows(start, end)
+    timestamps = np.asarray(store['timestamp_utc'][rows]).view('datetime64[ns]')
+    stats = rolling_chi_stats(timestamps, np.asarray(store['chi_amplitude'][rows]), windows)
+    stats.insert(0, 'timestamp_utc', timestamps)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rolling chi statistics over stored telemetry")
+    parser.add_argument("store_dir", nargs='?', default=STORE_PATH)
+    parser.add_argument("--windows", nargs='+', default=list(DEFAULT_WINDOWS),
+                        help="Window lengths, e.g. 30min 1h 6h 24h")
+    parser.add_argument("--start", type=str, default=None)
+    parser.add_argument("--end", type=str, default=None)
+    parser.add_argument("--out", type=str, default=None, help="Write every row's statistics to CSV")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(os.path.join(args.store_dir, MANIFEST_FILE)):
+        print(f"⛔ FATAL ERROR: Telemetry store missing at '{args.store_dir}'")
+        sys.exit(1)
+    stats = store_rolling_stats(args.store_dir, args.windows, args.start, args.end)
+    print(f"✓ ROLLING STATISTICS: {len(stats)} samples")
+    for window in args.windows:
+        for stat in ('max', 'mean', 'frac'):
+            column = stats[f'{stat}_{window}']
+            if column.notna().any():
+                peak = column.idxmax()
+                print(f"   {window:>6} peak {stat:<4} {column[peak]:.5f} at {stats['timestamp_utc'][peak]}")
+    if args.out:
+        stats.to_csv(args.out, index=False)
+        print(f"✓ STATISTICS SAVED TO: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
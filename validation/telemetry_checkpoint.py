@@ -0,0 +1,130 @@
+"""
+IMPERIAL INTERROGATION CHECKPOINTS
+----------------------------------
+Persists the running aggregates together with the byte offset, line
+count and last timestamp already folded in. The next run reads only the
+rows appended since, so its cost scales with the delta rather than with
+the archive size. A rewritten (not appended) file is detected through a
+fingerprint of the consumed bytes and triggers a full pass.
+
+LIMITATION: the fingerprint covers only the first and the last
+FINGERPRINT_BYTES before the checkpoint offset, so resuming stays
+independent of the archive size. A rewrite that keeps both of those
+regions byte for byte (and does not shrink the file) goes undetected,
+and the run resumes over aggregates of the old contents. After editing
+rows in place, delete the checkpoint file to force a full pass.
+"""
+
+import os
+import json
+import hashlib
+
+from validation.telemetry_stats import TelemetryAggregate
+from validation.telemetry_ingest import TelemetryReader, IngestReport
+
+# CONFIGURATION
+CHECKPOINT_FILE = 'interrogation_checkpoint.json'
+CHECKPOINT_VERSION = 1
+FINGERPRINT_BYTES = 4096
+
+
+def _fingerprint(f, offset):
+    """Hash of the file head and of the bytes just before `offset`."""
+    digest = hashlib.sha256()
+    f.seek(0)
+    digest.update(f.read(min(offset, FINGERPRINT_BYTES)))
+    tail = max(0, offset - FINGERPRINT_BYTES)
+    f.seek(tail)
+    digest.update(f.read(offset - tail))
+    return digest.hexdigest()
+
+
+def _complete_lines_end(f, start, size):
+    """Offset just past the last newline in [start, size): a half-written
+    final line is left for the next run."""
+    pos = size
+    while pos > start:
+        block = min(FINGERPRINT_BYTES, pos - start)
+        f.seek(pos - block)
+        newline = f.read(block).rfind(b'\n')
+        if newline >= 0:
+            return pos - block + newline + 1
+        pos -= block
+    return start
+
+
+class InterrogationCheckpoint:
+    """Aggregates plus the position in the source they cover."""
+
+    def __init__(self, data_path, offset=0, lines=0, last_timestamp=None,
+                 fingerprint=None, aggregate=None, ingest=None):
+        self.data_path = data_path
+        self.offset = offset
+        self.lines = lines
+        self.last_timestamp = last_timestamp  # Epoch-ns of the newest row folded in
+        self.fingerprint = fingerprint
+        self.aggregate = aggregate or TelemetryAggregate()
+        self.ingest = ingest or IngestReport()
+
+    @classmethod
+    def load(cls, checkpoint_path, data_path):
+        """The saved checkpoint if it still describes `data_path`, else a fresh one."""
+        try:
+            with open(checkpoint_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return cls(data_path)
+        if state.get('version') != CHECKPOINT_VERSION or state.get('data_path') != data_path:
+            return cls(data_path)
+
+        checkpoint = cls(data_path, state['offset'], state['lines'], state['last_timestamp'],
+                         state['fingerprint'],
+                         TelemetryAggregate.from_dict(state['aggregate']),
+                         IngestReport.from_dict(state['ingest']))
+        with open(data_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < checkpoint.offset or _fingerprint(f, checkpoint.offset) != checkpoint.fingerprint:
+                return cls(data_path)
+        return checkpoint
+
+    def save(self, checkpoint_path):
+        state = {
+            'version': CHECKPOINT_VERSION,
+            'data_path': self.data_path,
+            'offset': self.offset,
+            'lines': self.lines,
+            'last_timestamp': self.last_timestamp,
+            'fingerprint': self.fingerprint,
+            'aggregate': self.aggregate.to_dict(),
+            'ingest': self.ingest.to_dict(),
+        }
+        tmp_path = checkpoint_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, checkpoint_path)
+
+    def advance(self, chunksize, quarantine_path=None):
+        """
+        Folds the complete lines appended since the checkpoint into the
+        aggregates. Returns (rows_added, bytes_read).
+        """
+        with open(self.data_path, 'rb') as f:
+            stop = _complete_lines_end(f, self.offset, os.fstat(f.fileno()).st_size)
+
+        reader = TelemetryReader(self.data_path, chunk_rows=chunksize, quarantine_path=quarantine_path,
+                                 start=self.offset, stop=stop, first_line=self.lines + 1,
+                                 columns=('timestamp_utc', 'chi_amplitude', 'bt_nT'))
+        for chunk in reader:
+            self.aggregate.update(chunk['chi_amplitude'].to_numpy(dtype=float),
+                                  chunk['bt_nT'].to_numpy(dtype=float))
+            newest = int(chunk['timestamp_utc'].to_numpy().view('int64').max())
+            if self.last_timestamp is None or newest > self.last_timestamp:
+                self.last_timestamp = newest
+
+        bytes_read = stop - self.offset
+        self.ingest.merge(reader.report)
+        self.lines += reader.report.lines
+        self.offset = stop
+        with open(self.data_path, 'rb') as f:
+            self.fingerprint = _fingerprint(f, self.offset)
+        return reader.report.rows, bytes_read
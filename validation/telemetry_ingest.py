@@ -0,0 +1,403 @@
+"""
+IMPERIAL TELEMETRY INGESTION
+----------------------------
+Schema-detecting, fault-tolerant CSV reader for mixed-layout telemetry.
+The file's own header is its main layout, mapped onto the canonical
+schema by column name. Rows that do not fit it are matched to a known
+row layout by position; lines that match no layout (or lack a valid
+timestamp / chi) are quarantined to a side file.
+"""
+
+import io
+import os
+import csv
+import time
+import numpy as np
+import pandas as pd
+
+from validation.telemetry_store import TELEMETRY_SCHEMA
+from validation._metrics import METRICS
+
+# CONFIGURATION
+INGEST_CHUNK_ROWS = 250_000
+INGEST_BLOCK_BYTES = 32 * 2**20  # Bytes read per block (whole lines)
+QUARANTINE_SUFFIX = '.quarantine.csv'
+CANONICAL_COLUMNS = tuple(TELEMETRY_SCHEMA)
+
+# KNOWN ROW LAYOUTS
+# text_fields: positions that hold free text (not numbers) in this layout.
+# They are what tells layouts of the same width apart.
+ROW_LAYOUTS = {
+    # Early ACE/DSCOVR rows, in header order
+    'ace_dscovr': {
+        'columns': ('timestamp_utc', 'chi_amplitude', 'phase_radians', 'storm_phase',
+                    'density_p_cm3', 'speed_km_s', 'bz_nT', 'bt_nT', 'source',
+                    'chi_at_boundary', 'chi_violation', 'chi_status'),
+        'text_fields': (3, 8),
+    },
+    # 2026-01-30 magnetometer rows: components first, no storm_phase/source
+    'mag_first': {
+        'columns': ('timestamp_utc', 'chi_amplitude', 'bx_nT', 'by_nT', 'bt_nT',
+                    'density_p_cm3', 'bz_nT', 'phase_radians', 'speed_km_s',
+                    'chi_at_boundary', 'chi_violation', 'chi_status'),
+        'text_fields': (),
+    },
+}
+
+REQUIRED_COLUMNS = ('timestamp_utc', 'chi_amplitude')
+
+
+def _is_text(field):
+    if not field:
+        return False
+    try:
+        float(field)
+        return False
+    except ValueError:
+        return True
+
+
+def _probe_positions(layouts):
+    """Field positions that are free text in at least one layout."""
+    return sorted({i for spec in layouts.values() for i in spec['text_fields']})
+
+
+def file_layout(path, layouts=ROW_LAYOUTS):
+    """
+    (name, layout) named by the header on the file's first line, or None.
+    A known layout's header names that layout. Any other header made of
+    canonical column names is the file's own 'header' layout, its
+    columns mapped by name; a row fits it when its width matches and its
+    text columns hold no numbers.
+    """
+    with open(path, 'rb') as f:
+        fields = tuple(f.readline().rstrip(b'\r\n').decode('utf-8', 'replace').split(','))
+    for name, spec in layouts.items():
+        if fields == tuple(spec['columns']):
+            return name, spec
+    if (set(REQUIRED_COLUMNS) <= set(fields) <= set(CANONICAL_COLUMNS)
+            and len(set(fields)) == len(fields)):
+        text = tuple(i for i, c in enumerate(fields) if TELEMETRY_SCHEMA[c] == 'category')
+        return 'header', {'columns': fields, 'text_fields': text, 'by_name': True}
+    return None
+
+
+class IngestReport:
+    """Per-layout row counts and quarantine tally for one ingest run."""
+
+    def __init__(self):
+        self.rows = 0
+        self.lines = 0  # Source lines consumed (incl. headers / blanks)
+        self.layouts = {name: 0 for name in ROW_LAYOUTS}
+        self.quarantined = 0
+        self.quarantine_path = None
+
+    def merge(self, other):
+        """Combines the reports of several files."""
+        self.rows += other.rows
+        self.lines += other.lines
+        for name, count in other.layouts.items():
+            self.layouts[name] = self.layouts.get(name, 0) + count
+        self.quarantined += other.quarantined
+        if other.quarantine_path and other.quarantine_path != self.quarantine_path:
+            self.quarantine_path = ('per-file *' + QUARANTINE_SUFFIX) if self.quarantine_path \
+                else other.quarantine_path
+        return self
+
+    def to_dict(self):
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, state):
+        report = cls()
+        report.__dict__.update(state)
+        return report
+
+
+class TelemetryReader:
+    """
+    Streams a telemetry CSV as canonical DataFrame chunks of at most
+    `chunk_rows` rows. Column types:
+      timestamp_utc datetime64[ns], measurements and flags float64,
+      categories object (None = missing).
+
+    The file is read in byte blocks. Each line's field count is found by
+    scanning the block's newline and comma positions with NumPy, and the
+    C parser reads every chunk once into `max width` columns. Rows are
+    first matched to the file's header (see file_layout()); the rest are
+    told apart by vectorized probe tests against the known layouts.
+    Fields are split on bare commas (the telemetry feeds do not quote).
+
+    start/stop restrict reading to a byte range that begins and ends on
+    line boundaries (first_line numbers its first line), so appended
+    data can be read without touching what came before it. `columns`
+    limits the chunks (and the fields parsed) to those canonical columns
+    plus the required ones.
+    """
+
+    def __init__(self, path, chunk_rows=INGEST_CHUNK_ROWS, quarantine_path=None,
+                 layouts=ROW_LAYOUTS, start=0, stop=None, first_line=1, columns=None):
+        self.path = path
+        self.start = start
+        self.stop = stop
+        self.first_line = first_line
+        self.chunk_rows = chunk_rows
+        self.quarantine_path = quarantine_path or path + QUARANTINE_SUFFIX
+        # Known-layout probes; the file's header layout (tried first) adds its own
+        self.probes = _probe_positions(layouts)
+        self.header_layout = file_layout(path, layouts)
+        if self.header_layout:
+            name, spec = self.header_layout
+            layouts = {name: spec, **{n: s for n, s in layouts.items() if n != name}}
+        self.layouts = layouts
+        self.headers = {','.join(spec['columns']).encode() for spec in layouts.values()}
+        self.header_starts = {h[0] for h in self.headers}
+        self.widths = {len(spec['columns']) for spec in layouts.values()}
+        wanted = set(columns or CANONICAL_COLUMNS) | set(REQUIRED_COLUMNS)
+        self.columns = [c for c in CANONICAL_COLUMNS if c in wanted]
+        self.positions = sorted(set(_probe_positions(layouts)) | {
+            i for spec in layouts.values() for i, c in enumerate(spec['columns']) if c in wanted})
+
+        # Positions that are text in every layout are kept as strings by the
+        # C parser; the others are typed by it and converted only when mixed
+        numeric_somewhere = {i for spec in layouts.values() for i, c in enumerate(spec['columns'])
+                             if TELEMETRY_SCHEMA[c] in ('float', 'flag')}
+        self.text_positions = [i for i in self.positions if i not in numeric_somewhere]
+        self.report = IngestReport()
+        self._quarantine = None
+
+    def __iter__(self):
+        f = open(self.path, 'rb')
+        try:
+            f.seek(self.start)
+            stop = self.stop if self.stop is not None else os.fstat(f.fileno()).st_size
+            remaining = stop - self.start
+            line_no = self.first_line
+            carry = b''
+            chunk_start = time.perf_counter()
+            while remaining > 0 or carry:
+                block = f.read(min(INGEST_BLOCK_BYTES, remaining)) if remaining > 0 else b''
+                remaining = remaining - len(block) if block else 0  # Shrunk under us: stop at EOF
+                block = carry + block
+                if remaining > 0:
+                    # Whole lines only; the partial tail starts the next block
+                    cut = block.rfind(b'\n') + 1
+                    block, carry = block[:cut], block[cut:]
+                    if not block:
+                        continue
+                else:
+                    carry = b''
+                    if not block.endswith(b'\n'):
+                        block += b'\n'
+
+                starts, ends, width = _line_bounds(block)
+                for first in range(0, len(starts), self.chunk_rows):
+                    last = min(first + self.chunk_rows, len(starts))
+                    lines = slice(first, last)
+                    chunk = self._parse(block, starts[lines], ends[lines], width[lines], line_no + first)
+                    METRICS.observe('ingest_chunk_seconds', time.perf_counter() - chunk_start)
+                    METRICS.count('ingest_lines', last - first)
+                    METRICS.count('ingest_rows', len(chunk))
+                    if len(chunk):
+                        yield chunk
+                    chunk_start = time.perf_counter()
+                self.report.lines += len(starts)
+                line_no += len(starts)
+        finally:
+            f.close()
+            if self._quarantine is not None:
+                self._quarantine.close()
+                self._quarantine = None
+
+    def _reject(self, block, starts, ends, line_numbers, reason):
+        if not len(line_numbers):
+            return
+        if self._quarantine is None:
+            # A read that resumes mid-file adds to the existing side file
+            resume = self.start > 0 and os.path.exists(self.quarantine_path)
+            self._quarantine = open(self.quarantine_path, 'a' if resume else 'w', newline='')
+            if not resume:
+                self._quarantine.write('line,reason,raw\n')
+            self.report.quarantine_path = self.quarantine_path
+        raw = [block[a:b].rstrip(b'\r').decode('utf-8', 'replace') for a, b in zip(starts, ends)]
+        pd.DataFrame({'line': line_numbers, 'reason': reason, 'raw': raw}).to_csv(
+            self._quarantine, header=False, index=False)
+        self.report.quarantined += len(line_numbers)
+        METRICS.count('ingest_quarantined', len(line_numbers))
+
+    def _parse(self, block, starts, ends, width, first_line):
+        """Reads one run of lines and maps each onto the canonical columns."""
+        line_numbers = np.arange(first_line, first_line + len(starts))
+
+        # 1. SET ASIDE BLANKS, HEADERS AND LINES NO LAYOUT CAN HOLD
+        length = ends - starts
+        first_bytes = np.frombuffer(block, np.uint8)[starts]  # The newline, for a blank line
+        blank = (length == 0) | ((length == 1) & (first_bytes == 13))
+        unknown = ~blank & ~np.isin(width, list(self.widths))
+        header = np.zeros(len(starts), dtype=bool)
+        for i in np.flatnonzero(~blank & ~unknown & np.isin(first_bytes, list(self.header_starts))):
+            header[i] = block[starts[i]:ends[i]].rstrip(b'\r') in self.headers
+        self._reject(block, starts[unknown], ends[unknown], line_numbers[unknown], 'unknown layout')
+        keep = ~(blank | unknown | header)
+
+        # 2. ONE C-PARSER PASS OVER THE LINES KEPT
+        if keep.all():
+            text = block[starts[0]:ends[-1] + 1] if len(starts) else b''
+        else:
+            kept = np.flatnonzero(keep)
+            # Contiguous runs of kept lines, copied once
+            breaks = np.flatnonzero(np.diff(kept) != 1) + 1
+            text = b''.join(block[starts[run[0]]:ends[run[-1]] + 1]
+                            for run in np.split(kept, breaks) if len(run))
+        if not text:
+            return pd.DataFrame({c: [] for c in self.columns})
+        # Only as many columns as this run's widest line (layouts differ in width)
+        widest = int(width[keep].max())
+        fields = pd.read_csv(io.BytesIO(text), header=None, names=range(widest),
+                             usecols=[i for i in self.positions if i < widest],
+                             dtype={i: object for i in self.text_positions if i < widest},
+                             quoting=csv.QUOTE_NONE, skip_blank_lines=False)
+        fields = fields.reindex(columns=self.positions)
+        fields.index = line_numbers[keep]
+        starts, ends, width = starts[keep], ends[keep], width[keep]
+
+        # 3. DETECT LAYOUTS (the file's header first, then vectorized probe tests)
+        numeric = {}
+        is_text = {}
+        for i in _probe_positions(self.layouts):
+            numeric[i], is_text[i] = _as_numeric(fields[i], with_text=True)
+
+        frames = []
+        claimed = np.zeros(len(fields), dtype=bool)
+        for name, spec in self.layouts.items():
+            w = len(spec['columns'])
+            is_layout = ~claimed & (width == w)
+            if spec.get('by_name'):
+                for i in spec['text_fields']:
+                    is_layout &= np.isnan(numeric[i].to_numpy())
+            else:
+                for i in self.probes:
+                    if i < w:
+                        is_layout &= is_text[i] if i in spec['text_fields'] else ~is_text[i]
+            claimed |= is_layout
+            if is_layout.any():
+                frames.append(self._canonical(fields[is_layout], numeric, spec['columns'], is_layout))
+                self.report.layouts[name] = self.report.layouts.get(name, 0) + int(is_layout.sum())
+
+        self._reject(block, starts[~claimed], ends[~claimed], fields.index[~claimed], 'unknown layout')
+        if not frames:
+            return pd.DataFrame({c: [] for c in self.columns})
+
+        df = pd.concat(frames).sort_index() if len(frames) > 1 else frames[0]
+        df['timestamp_utc'] = pd.to_datetime(df['timestamp_utc'], format='ISO8601',
+                                             errors='coerce').astype('datetime64[ns]')
+
+        # 4. QUARANTINE ROWS MISSING A REQUIRED VALUE
+        bad = np.zeros(len(df), dtype=bool)
+        for c in REQUIRED_COLUMNS:
+            bad |= df[c].isna().to_numpy()
+        if bad.any():
+            rows = np.searchsorted(fields.index, df.index[bad])
+            self._reject(block, starts[rows], ends[rows], df.index[bad],
+                         'missing timestamp_utc/chi_amplitude')
+            df = df[~bad]
+
+        self.report.rows += len(df)
+        return df.reset_index(drop=True)
+
+    def _canonical(self, fields, numeric, columns, rows):
+        out = {}
+        for i, c in enumerate(columns):
+            if c not in self.columns:
+                continue
+            values = fields[i]
+            if TELEMETRY_SCHEMA[c] in ('float', 'flag'):
+                if i in numeric:
+                    out[c] = numeric[i][rows]
+                elif values.dtype.kind in 'fiu':
+                    out[c] = values.astype(float)
+                else:
+                    out[c] = _as_numeric(values)
+            elif c == 'timestamp_utc':
+                out[c] = values  # Parsed (and NaN-checked) as datetimes once per chunk
+            else:
+                out[c] = values.astype(object).where(values.notna(), None)
+        for c in self.columns:
+            if c not in out:
+                missing_kind = TELEMETRY_SCHEMA[c] in ('float', 'flag')
+                out[c] = np.full(len(fields), np.nan if missing_kind else None,
+                                 dtype=float if missing_kind else object)
+        return pd.DataFrame(out, index=fields.index, columns=self.columns)
+
+
+def _line_bounds(block):
+    """Start, end (newline position) and field count of every line in `block`."""
+    data = np.frombuffer(block, dtype=np.uint8)
+    ends = np.flatnonzero(data == 10)
+    starts = np.empty_like(ends)
+    starts[:1] = 0
+    starts[1:] = ends[:-1] + 1
+    commas = np.flatnonzero(data == 44)
+    width = np.searchsorted(commas, ends) - np.searchsorted(commas, starts) + 1
+    return starts, ends, width
+
+
+def _as_numeric(values, with_text=False):
+    """
+    Float view of a parsed column; text converts once per distinct value.
+    with_text=True also returns the mask of present, non-numeric fields.
+    """
+    if values.dtype.kind in 'fiu':
+        numeric = values.astype(float)
+        return (numeric, np.zeros(len(values), dtype=bool)) if with_text else numeric
+    codes, uniques = pd.factorize(values)
+    converted = pd.to_numeric(pd.Series(uniques, dtype=object), errors='coerce').to_numpy(dtype=float)
+    # Code -1 (missing) picks the trailing NaN
+    numeric = pd.Series(np.append(converted, np.nan)[codes], index=values.index)
+    if not with_text:
+        return numeric
+    return numeric, np.append(np.isnan(converted), False)[codes]
+
+
+def parse_record(line, layouts=ROW_LAYOUTS):
+    """
+    Single-line counterpart of TelemetryReader for live feeds.
+    Returns a canonical dict (missing numbers NaN, missing text None) plus
+    the layout name, or (None, reason) for headers and malformed lines.
+    """
+    fields = line.rstrip('\r\n').split(',')
+    if any(tuple(fields) == tuple(spec['columns']) for spec in layouts.values()):
+        return None, 'header'
+    probes = _probe_positions(layouts)
+    for name, spec in layouts.items():
+        columns = spec['columns']
+        if len(columns) != len(fields):
+            continue
+        if any(_is_text(fields[i]) != (i in spec['text_fields']) for i in probes if i < len(fields)):
+            continue
+        record = {c: (np.nan if TELEMETRY_SCHEMA[c] in ('float', 'flag') else None)
+                  for c in CANONICAL_COLUMNS}
+        for c, value in zip(columns, fields):
+            if TELEMETRY_SCHEMA[c] in ('float', 'flag'):
+                try:
+                    record[c] = float(value) if value else np.nan
+                except ValueError:
+                    record[c] = np.nan
+            else:
+                record[c] = value or None
+        # Timestamps must parse as the batch reader parses them (else NaT, quarantined)
+        if (not record['timestamp_utc'] or np.isnan(record['chi_amplitude'])
+                or pd.isna(pd.to_datetime(record['timestamp_utc'], format='ISO8601', errors='coerce'))):
+            return None, 'missing timestamp_utc/chi_amplitude'
+        return record, name
+    return None, 'unknown layout'
+
+
+def read_telemetry(path, chunk_rows=INGEST_CHUNK_ROWS, quarantine_path=None):
+    """Whole file as one canonical DataFrame (plus the ingest report)."""
+    reader = TelemetryReader(path, chunk_rows, quarantine_path)
+    with METRICS.timer('ingest'):
+        chunks = list(reader)
+    if not chunks:
+        return pd.DataFrame({c: [] for c in CANONICAL_COLUMNS}), reader.report
+    return pd.concat(chunks, ignore_index=True), reader.report
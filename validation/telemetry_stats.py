@@ -0,0 +1,156 @@
+"""
+IMPERIAL TELEMETRY AGGREGATES
+-----------------------------
+Constant-memory running statistics for the Chi = 0.15 interrogation.
+Each chunk is reduced with NumPy and folded into the running totals
+(Chan/Welford update), so peak memory depends on the chunk size only.
+Aggregates of disjoint inputs merge exactly, so files can be reduced
+independently (e.g. in worker processes) and combined afterwards.
+"""
+
+import math
+import numpy as np
+
+CHI_LIMIT = 0.15
+MODE_6_CEILING = 0.917  # Jan 5 Mode 6 Harmonic Reset
+
+
+def classify_verdict(max_chi):
+    """Interrogation verdict for the largest chi observed."""
+    if math.isnan(max_chi):
+        raise ValueError("No chi observed: there is no verdict without data")
+    if max_chi <= CHI_LIMIT:
+        return "VERDICT: LOGIC CONFIRMED (Nominal)."
+    elif max_chi <= MODE_6_CEILING:
+        return "VERDICT: LOGIC CONFIRMED (Mode 6 Harmonic Event)."
+    else:
+        return "VERDICT: ANOMALY DETECTED (High-Energy Compression Event)."
+
+
+class TelemetryAggregate:
+    """
+    Running max, Pearson co-moments (chi_amplitude vs bt_nT) and
+    violation count/sum over an arbitrary number of chunks.
+    """
+
+    def __init__(self):
+        self.n_rows = 0
+        self.max_chi = math.nan
+
+        # Co-moments over rows where both chi and bt are present
+        self.n_pairs = 0
+        self.mean_chi = 0.0
+        self.mean_bt = 0.0
+        self.m2_chi = 0.0
+        self.m2_bt = 0.0
+        self.c_chi_bt = 0.0
+
+        # Rows above the limit
+        self.violation_count = 0
+        self.violation_sum = 0.0
+
+    def update(self, chi, bt=None):
+        """
+        Folds one chunk of chi_amplitude (and optionally bt_nT) values in.
+        """
+        chi = np.asarray(chi, dtype=float)
+        self.n_rows += len(chi)
+
+        # 1. RUNNING MAX (NaN-skipping, like pandas)
+        present = chi[~np.isnan(chi)]
+        if len(present):
+            chunk_max = float(present.max())
+            if math.isnan(self.max_chi) or chunk_max > self.max_chi:
+                self.max_chi = chunk_max
+
+        # 2. VIOLATIONS
+        over = present[present > CHI_LIMIT]
+        self.violation_count += len(over)
+        self.violation_sum += float(over.sum())
+
+        # 3. CO-MOMENTS (pairwise complete rows only)
+        if bt is None:
+            return
+        bt = np.asarray(bt, dtype=float)
+        paired = ~(np.isnan(chi) | np.isnan(bt))
+        x = chi[paired]
+        y = bt[paired]
+        n = len(x)
+        if n == 0:
+            return
+        mean_x = float(x.mean())
+        mean_y = float(y.mean())
+        dx = x - mean_x
+        dy = y - mean_y
+        self._merge_moments(n, mean_x, mean_y,
+                            float(dx @ dx), float(dy @ dy), float(dx @ dy))
+
+    def update_one(self, chi, bt=math.nan):
+        """O(1) per-record fold for live feeds (same result as update())."""
+        self.n_rows += 1
+        if math.isnan(chi):
+            return
+        if math.isnan(self.max_chi) or chi > self.max_chi:
+            self.max_chi = chi
+        if chi > CHI_LIMIT:
+            self.violation_count += 1
+            self.violation_sum += chi
+        if math.isnan(bt):
+            return
+        # Welford co-moment update
+        self.n_pairs += 1
+        dx = chi - self.mean_chi
+        dy = bt - self.mean_bt
+        self.mean_chi += dx / self.n_pairs
+        self.mean_bt += dy / self.n_pairs
+        self.m2_chi += dx * (chi - self.mean_chi)
+        self.m2_bt += dy * (bt - self.mean_bt)
+        self.c_chi_bt += dx * (bt - self.mean_bt)
+
+    def merge(self, other):
+        """Folds in the aggregate of another, disjoint, part of the data."""
+        self.n_rows += other.n_rows
+        if not math.isnan(other.max_chi) and (math.isnan(self.max_chi) or other.max_chi > self.max_chi):
+            self.max_chi = other.max_chi
+        self.violation_count += other.violation_count
+        self.violation_sum += other.violation_sum
+        if other.n_pairs:
+            self._merge_moments(other.n_pairs, other.mean_chi, other.mean_bt,
+                                other.m2_chi, other.m2_bt, other.c_chi_bt)
+        return self
+
+    def to_dict(self):
+        """Plain-number state, e.g. for a JSON checkpoint."""
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, state):
+        agg = cls()
+        agg.__dict__.update(state)
+        return agg
+
+    def _merge_moments(self, n_b, mean_x_b, mean_y_b, m2_x_b, m2_y_b, c_b):
+        """Parallel-axis combination of two sets of co-moments."""
+        n_a = self.n_pairs
+        n = n_a + n_b
+        delta_x = mean_x_b - self.mean_chi
+        delta_y = mean_y_b - self.mean_bt
+        weight = n_a * n_b / n
+
+        self.m2_chi += m2_x_b + delta_x * delta_x * weight
+        self.m2_bt += m2_y_b + delta_y * delta_y * weight
+        self.c_chi_bt += c_b + delta_x * delta_y * weight
+        self.mean_chi += delta_x * n_b / n
+        self.mean_bt += delta_y * n_b / n
+        self.n_pairs = n
+
+    def correlation(self):
+        """Pearson correlation of chi_amplitude vs bt_nT (NaN if undefined)."""
+        if self.n_pairs < 2 or self.m2_chi <= 0 or self.m2_bt <= 0:
+            return math.nan
+        return self.c_chi_bt / math.sqrt(self.m2_chi * self.m2_bt)
+
+    def violation_mean(self):
+        if self.violation_count == 0:
+            return math.nan
+        return self.violation_sum / self.violation_count
@@ -0,0 +1,360 @@
+"""
+IMPERIAL TELEMETRY STORE
+------------------------
+Columnar on-disk telemetry: one typed .npy file per normalized column
+plus a manifest. Columns open with np.load(mmap_mode='r'), so a reader
+only touches the pages of the columns it actually uses.
+A sorted epoch-ns time index is built once at ingestion so time windows
+are located with searchsorted instead of a scan. Reading needs only
+NumPy; pandas is imported when text is parsed (ingestion, string time
+bounds) or a DataFrame is returned.
+
+USAGE:
+    cline store data/telemetry.csv data/telemetry_store
+"""
+
+import os
+import sys
+import json
+import argparse
+import numpy as np
+from numpy.lib import format as npy_format
+
+# CONFIGURATION
+STORE_PATH = 'data/telemetry_store'
+MANIFEST_FILE = 'manifest.json'
+TIME_INDEX_FILE = 'time_index.npy'  # Sorted epoch-ns (only if rows are out of order)
+TIME_ORDER_FILE = 'time_order.npy'  # Row position of each time_index entry
+CONVERT_CHUNKSIZE = 250_000
+
+NAT = np.iinfo(np.int64).min  # Missing timestamp
+MISSING_CODE = -1              # Missing category / flag
+
+# Normalized columns and their on-disk kinds:
+#   time     -> int64 epoch-ns (UTC)
+#   float    -> float64 (NaN = missing)
+#   flag     -> int8 (-1 = missing)
+#   category -> int32 dictionary codes, labels kept in the manifest
+TELEMETRY_SCHEMA = {
+    'timestamp_utc': 'time',
+    'chi_amplitude': 'float',
+    'phase_radians': 'float',
+    'storm_phase': 'category',
+    'density_p_cm3': 'float',
+    'speed_km_s': 'float',
+    'bx_nT': 'float',
+    'by_nT': 'float',
+    'bz_nT': 'float',
+    'bt_nT': 'float',
+    'source': 'category',
+    'chi_at_boundary': 'flag',
+    'chi_violation': 'flag',
+    'chi_status': 'category',
+}
+
+KIND_DTYPES = {
+    'time': np.dtype('<i8'),
+    'float': np.dtype('<f8'),
+    'flag': np.dtype('i1'),
+    'category': np.dtype('<i4'),
+}
+
+
+class _ColumnWriter:
+    """
+    Appends chunks to a single .npy file.
+    The header is rewritten with the final length on close; numpy pads
+    v1.0 headers so the shape can grow in place.
+    """
+
+    def __init__(self, path, dtype):
+        self.dtype = dtype
+        self.rows = 0
+        self.f = open(path, 'wb')
+        self._write_header()
+
+    def _write_header(self):
+        npy_format.write_array_header_1_0(
+            self.f, {'descr': npy_format.dtype_to_descr(self.dtype),
+                     'fortran_order': False, 'shape': (self.rows,)})
+
+    def append(self, values):
+        values = np.ascontiguousarray(values, dtype=self.dtype)
+        self.f.write(values.tobytes())
+        self.rows += len(values)
+
+    def close(self):
+        self.f.seek(0)
+        self._write_header()
+        self.f.close()
+
+
+def _encode_column(kind, values, categories):
+    """Normalizes one raw chunk column to its on-disk representation."""
+    import pandas as pd
+
+    if kind == 'time':
+        values = np.asarray(values)
+        if values.dtype.kind == 'M':
+            return values.astype('datetime64[ns]').view(np.int64)
+        stamps = pd.to_datetime(pd.Series(values), format='ISO8601', errors='coerce')
+        return stamps.to_numpy(dtype='datetime64[ns]').view(np.int64)
+    if kind == 'float':
+        return pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=float)
+    if kind == 'flag':
+        flags = pd.to_numeric(pd.Series(values), errors='coerce').astype(float)
+        return flags.fillna(MISSING_CODE).to_numpy().astype(np.int8)
+    # category: grow the dictionary as new labels appear
+    codes = np.full(len(values), MISSING_CODE, dtype=np.int32)
+    for i, label in enumerate(values):
+        if isinstance(label, str) and label:
+            code = categories.get(label)
+            if code is None:
+                code = categories[label] = len(categories)
+            codes[i] = code
+    return codes
+
+
+class StoreWriter:
+    """
+    Streams normalized chunks (dict of column -> values) into a store.
+    Columns outside TELEMETRY_SCHEMA are not stored.
+    """
+
+    def __init__(self, store_dir, columns=None):
+        os.makedirs(store_dir, exist_ok=True)
+        self.store_dir = store_dir
+        self.columns = [c for c in (columns or TELEMETRY_SCHEMA) if c in TELEMETRY_SCHEMA]
+        self.writers = {
+            c: _ColumnWriter(os.path.join(store_dir, f"{c}.npy"), KIND_DTYPES[TELEMETRY_SCHEMA[c]])
+            for c in self.columns
+        }
+        self.categories = {c: {} for c in self.columns if TELEMETRY_SCHEMA[c] == 'category'}
+        self.rows = 0
+
+    def append(self, chunk):
+        n = None
+        for c in self.columns:
+            values = chunk.get(c)
+            if values is None:
+                continue
+            encoded = _encode_column(TELEMETRY_SCHEMA[c], values, self.categories.get(c))
+            self.writers[c].append(encoded)
+            n = len(encoded)
+        # Columns absent from this chunk are padded as missing
+        for c in self.columns:
+            if n is not None and self.writers[c].rows < self.rows + n:
+                self.writers[c].append(_missing(TELEMETRY_SCHEMA[c], self.rows + n - self.writers[c].rows))
+        if n is not None:
+            self.rows += n
+
+    def close(self, source=None, ingest=None):
+        for writer in self.writers.values():
+            writer.close()
+        manifest = {
+            'rows': self.rows,
+            'source': source,
+            'ingest': ingest,
+            'columns': {c: TELEMETRY_SCHEMA[c] for c in self.columns},
+            'categories': {c: list(labels) for c, labels in self.categories.items()},
+            'time_index': self._build_time_index(),
+        }
+        with open(os.path.join(self.store_dir, MANIFEST_FILE), 'w') as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
+
+
+    def _build_time_index(self):
+        """
+        Persists the sorted time index. Telemetry is normally appended in
+        time order, in which case timestamp_utc itself is the index.
+        """
+        if 'timestamp_utc' not in self.writers:
+            return None
+        stamps = np.load(os.path.join(self.store_dir, 'timestamp_utc.npy'), mmap_mode='r')
+        if self.rows < 2 or bool(np.all(stamps[1:] >= stamps[:-1])):
+            return {'sorted': True}
+        order = np.argsort(stamps, kind='stable')
+        np.save(os.path.join(self.store_dir, TIME_ORDER_FILE), order)
+        np.save(os.path.join(self.store_dir, TIME_INDEX_FILE), stamps[order])
+        return {'sorted': False}
+
+
+def _missing(kind, n):
+    if kind == 'float':
+        return np.full(n, np.nan)
+    if kind == 'time':
+        return np.full(n, NAT, dtype=np.int64)
+    return np.full(n, MISSING_CODE, dtype=KIND_DTYPES[kind])
+
+
+def convert_csv(csv_path, store_dir=STORE_PATH, chunksize=CONVERT_CHUNKSIZE, quarantine_path=None):
+    """
+    Converts a telemetry CSV into a columnar store in one chunked pass.
+    Rows go through the schema-detecting reader, so mixed layouts land in
+    the canonical columns and malformed lines are quarantined (to
+    quarantine_path, default next to the CSV).
+    """
+    from validation.telemetry_ingest import TelemetryReader
+
+    reader = TelemetryReader(csv_path, chunk_rows=chunksize, quarantine_path=quarantine_path)
+    writer = StoreWriter(store_dir)
+    for chunk in reader:
+        writer.append({c: chunk[c].to_numpy() for c in chunk.columns})
+    return writer.close(source=csv_path, ingest={'layouts': reader.report.layouts,
+                                                 'quarantined': reader.report.quarantined})
+
+
+class TelemetryStore:
+    """
+    Read side of the store. Columns are memory-mapped on first access
+    and cached; nothing is parsed or read until a column is requested.
+    """
+
+    def __init__(self, store_dir=STORE_PATH):
+        self.store_dir = store_dir
+        with open(os.path.join(store_dir, MANIFEST_FILE)) as f:
+            self.manifest = json.load(f)
+        self._columns = {}
+
+    def __len__(self):
+        return self.manifest['rows']
+
+    def __contains__(self, name):
+        return name in self.manifest['columns']
+
+    @property
+    def columns(self):
+        return list(self.manifest['columns'])
+
+    def __getitem__(self, name):
+        if name not in self._columns:
+            if name not in self:
+                raise KeyError(f"Column '{name}' not in telemetry store")
+            path = os.path.join(self.store_dir, f"{name}.npy")
+            self._columns[name] = np.load(path, mmap_mode='r')
+        return self._columns[name]
+
+    def categories(self, name):
+        return self.manifest['categories'].get(name, [])
+
+    def add_columns(self, kinds, chunks, metadata=None):
+        """
+        Writes derived columns (e.g. a recomputed chi) in one pass.
+        kinds:  {name: kind}
+        chunks: iterable of {name: values}, covering every row in order
+        Existing columns of the same names are replaced; the new files are
+        swapped in and registered in the manifest only once complete.
+        """
+        for name in kinds:
+            if name in TELEMETRY_SCHEMA:
+                raise ValueError(f"'{name}' is an ingested column and cannot be replaced")
+        paths = {name: os.path.join(self.store_dir, f"{name}.npy") for name in kinds}
+        writers = {name: _ColumnWriter(paths[name] + '.tmp', KIND_DTYPES[kind])
+                   for name, kind in kinds.items()}
+        try:
+            for chunk in chunks:
+                for name, writer in writers.items():
+                    writer.append(chunk[name])
+        finally:
+            for writer in writers.values():
+                writer.close()
+        short = [name for name, writer in writers.items() if writer.rows != len(self)]
+        if short:
+            for path in paths.values():
+                os.remove(path + '.tmp')
+            raise ValueError(f"Columns {short} do not cover the store's {len(self)} rows")
+
+        for name, kind in kinds.items():
+            self._columns.pop(name, None)
+            os.replace(paths[name] + '.tmp', paths[name])
+            self.manifest['columns'][name] = kind
+            self.manifest.setdefault('derived', {})[name] = metadata or {}
+        manifest_path = os.path.join(self.store_dir, MANIFEST_FILE)
+        with open(manifest_path + '.tmp', 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(manifest_path + '.tmp', manifest_path)
+
+    def decode(self, name):
+        """Returns a category column as labels (None = missing)."""
+        labels = np.array(self.categories(name) + [None], dtype=object)
+        return labels[np.asarray(self[name])]
+
+    def timestamps(self):
+        """timestamp_utc as datetime64[ns] (NaT = missing)."""
+        return np.asarray(self['timestamp_utc']).view('datetime64[ns]')
+
+    def _time_index(self):
+        """(sorted epoch-ns, row order or None when rows are already sorted)."""
+        if 'time_index' not in self._columns:
+            info = self.manifest.get('time_index')
+            if info is None:
+                raise KeyError("Telemetry store has no time index")
+            if info['sorted']:
+                self._columns['time_index'] = (self['timestamp_utc'], None)
+            else:
+                self._columns['time_index'] = (
+                    np.load(os.path.join(self.store_dir, TIME_INDEX_FILE), mmap_mode='r'),
+                    np.load(os.path.join(self.store_dir, TIME_ORDER_FILE), mmap_mode='r'))
+        return self._columns['time_index']
+
+    def window_rows(self, start=None, end=None):
+        """
+        Rows with start <= timestamp_utc < end, in time order.
+        A slice when the store is time-ordered, else an index array.
+        Bounds accept anything pd.Timestamp does (None = open).
+        """
+        index, order = self._time_index()
+        lo = 0 if start is None else int(np.searchsorted(index, _epoch_ns(start), side='left'))
+        hi = len(index) if end is None else int(np.searchsorted(index, _epoch_ns(end), side='left'))
+        hi = max(lo, hi)
+        if order is None:
+            return slice(lo, hi)
+        return np.asarray(order[lo:hi])
+
+    def load_window(self, start=None, end=None, columns=None):
+        """
+        Returns just the requested time span as a DataFrame.
+        Only the index pages and the window's pages of each column are read.
+        """
+        import pandas as pd
+
+        rows = self.window_rows(start, end)
+        out = {}
+        for name in columns or self.columns:
+            values = np.asarray(self[name][rows])
+            kind = self.manifest['columns'][name]
+            if kind == 'time':
+                values = values.view('datetime64[ns]')
+            elif kind == 'category':
+                values = np.array(self.categories(name) + [None], dtype=object)[values]
+            out[name] = values
+        return pd.DataFrame(out)
+
+
+def _epoch_ns(when):
+    if isinstance(when, (int, np.integer)):
+        return int(when)
+    import pandas as pd
+    return pd.Timestamp(when).as_unit('ns').value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert telemetry CSV to a columnar store")
+    parser.add_argument("csv_path", nargs='?', default='data/telemetry.csv')
+    parser.add_argument("store_dir", nargs='?', default=STORE_PATH)
+    parser.add_argument("--chunksize", type=int, default=CONVERT_CHUNKSIZE)
+    parser.add_argument("--quarantine", type=str, default=None, metavar="PATH",
+                        help="Quarantine file for malformed lines (default: next to the CSV)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.csv_path):
+        print(f"⛔ FATAL ERROR: Real data file missing at '{args.csv_path}'")
+        sys.exit(1)
+    manifest = convert_csv(args.csv_path, args.store_dir, args.chunksize, args.quarantine)
+    print(f"✓ TELEMETRY STORE WRITTEN: {manifest['rows']} rows, "
+          f"{len(manifest['columns'])} columns -> {args.store_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from validation.x_boundary_validation import ImperialLatticeValidator
+from validation.telemetry_store import TelemetryStore, convert_csv
+from validation.chi_recompute import recompute_chi, heliocentric_distance
+
+# One full vector row, one magnitude-only row, one row without field data
+CSV_TEXT = """timestamp_utc,chi_amplitude,phase_radians,storm_phase,density_p_cm3,speed_km_s,bz_nT,bt_nT,source,chi_at_boundary,chi_violation,chi_status
+2026-01-03 00:00:00,0.10,0,pre,1,400,-1.0,5.5,ACE/DSCOVR,0,0,BELOW
+2026-01-30 16:24:00,1.75,-2.67,1.37,4.20,23.17,3.47,1.29,526.2,1,0,AT_BOUNDARY
+2026-07-04 12:00:00,0.12,0,pre,1,400,,,ACE/DSCOVR,0,0,BELOW
+"""
+
+class TestChiRecompute(unittest.TestCase):
+    """
+    OPTION C RECOMPUTATION CERTIFICATION
+    ------------------------------------
+    Verifies that the derived chi column matches the scalar
+    calculate_chi_3d() audit row for row.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        csv_path = os.path.join(self.tmp.name, 'telemetry.csv')
+        with open(csv_path, 'w') as f:
+            f.write(CSV_TEXT)
+        self.store_dir = os.path.join(self.tmp.name, 'store')
+        convert_csv(csv_path, self.store_dir)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_ephemeris_distance(self):
+        # Perihelion in early January, aphelion in early July
+        r = heliocentric_distance(np.array(['2026-01-03', '2026-07-04', 'NaT'],
+                                           dtype='datetime64[ns]').view('int64'))
+        self.assertAlmostEqual(r[0], 0.9733, places=3)
+        self.assertAlmostEqual(r[1], 1.0067, places=3)
+        self.assertTrue(np.isnan(r[2]))
+
+    def test_matches_scalar_audit(self):
+        # Chunks of one row exercise the chunked writer
+        agg, stress, settings = recompute_chi(self.store_dir, b_tension_1au=5.0, chi_limit=0.1, chunksize=1)
+        store = TelemetryStore(self.store_dir)
+        r = heliocentric_distance(store['timestamp_utc'])
+        validator = ImperialLatticeValidator()
+
+        expected = [validator.calculate_chi_3d(5.5, r[0]),
+                    validator.calculate_chi_3d([-2.67, 1.37, 3.47], r[1])]
+        np.testing.assert_allclose(store['chi_option_c'][:2], expected, rtol=1e-12)
+        self.assertTrue(np.isnan(store['chi_option_c'][2]))
+        self.assertEqual(list(store['chi_option_c_status']), [0, 1, -1])
+        self.assertEqual(stress, 1)
+        self.assertEqual(store.manifest['derived']['chi_option_c']['distance'], 'ephemeris')
+
+        # Re-audit under a new calibration replaces the column in place
+        recompute_chi(self.store_dir, b_tension_1au=5.5, r_au=1.0)
+        store = TelemetryStore(self.store_dir)
+        self.assertEqual(store['chi_option_c'][0], 0.0)
+        self.assertEqual(store.manifest['derived']['chi_option_c']['b_tension_1au'], 5.5)
+        with self.assertRaises(ValueError):
+            recompute_chi(self.store_dir, column='chi_amplitude')
+
+    def test_ephemeris_table(self):
+        # Distances from a spacecraft table; rows outside it have no chi
+        table_path = os.path.join(self.tmp.name, 'probe.csv')
+        with open(table_path, 'w') as f:
+            f.write("timestamp_utc,r_au\n2026-01-01,2.0\n2026-02-01,3.0\n")
+        _, _, settings = recompute_chi(self.store_dir, b_tension_1au=5.0, ephemeris=table_path)
+        store = TelemetryStore(self.store_dir)
+        self.assertEqual(settings['distance'], 'table:probe')
+        expected = ImperialLatticeValidator().calculate_chi_3d(5.5, 2.0 + 2.0 / 31)
+        self.assertAlmostEqual(store['chi_option_c'][0], expected, places=12)
+        self.assertTrue(np.isnan(store['chi_option_c'][2]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from validation.ephemeris import EphemerisTable, load_ephemeris
+from validation.telemetry_store import NAT
+
+# Out of order, with a repeated timestamp, a bad distance and a bad time
+TABLE_TEXT = """timestamp_utc,r_au
+2026-01-03 00:00:00,160.0
+2026-01-01 00:00:00,150.0
+2026-01-02 00:00:00,-1.0
+2026-01-02 00:00:00,155.0
+not-a-time,157.0
+"""
+
+class TestEphemeris(unittest.TestCase):
+    """
+    EPHEMERIS TABLE CERTIFICATION
+    -----------------------------
+    Verifies the piecewise-linear r_au lookup and the compiled table
+    cache shared across runs.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'voyager1.csv')
+        with open(self.path, 'w') as f:
+            f.write(TABLE_TEXT)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_interpolation(self):
+        table = EphemerisTable.from_csv(self.path)
+        self.assertEqual(table.name, 'voyager1')
+        self.assertEqual(list(table.r_au_knots), [150.0, 155.0, 160.0])
+
+        when = np.array(['2026-01-01T12:00', '2026-01-03', '2025-12-31', '2026-01-04', 'NaT'],
+                        dtype='datetime64[ns]')
+        r = table.r_au(when)
+        np.testing.assert_array_equal(r[:2], [152.5, 160.0])
+        self.assertTrue(np.isnan(r[2:]).all())
+        self.assertEqual(table.inverse_square(when[:1])[0], 1.0 / 152.5 ** 2)
+
+        # Epoch-ns input (store columns) matches datetime64 input
+        epoch_ns = when.view(np.int64)
+        np.testing.assert_array_equal(table.r_au(epoch_ns), r)
+        self.assertTrue(np.isnan(table.r_au(np.array([NAT]))[0]))
+
+        # Scalar timestamps give scalar distances
+        self.assertEqual(table.r_au(np.datetime64('2026-01-01T12:00')), 152.5)
+        self.assertEqual(table.r_au(epoch_ns[0]), 152.5)
+        self.assertEqual(np.ndim(table.r_au(epoch_ns[0])), 0)
+        self.assertTrue(np.isnan(table.r_au(np.datetime64('NaT'))))
+        self.assertEqual(table.inverse_square(np.datetime64('2026-01-01T12:00')), 1.0 / 152.5 ** 2)
+
+    def test_compiled_cache(self):
+        table = load_ephemeris(self.path)
+        cache_path = os.path.join(self.tmp.name, 'voyager1.npz')
+        self.assertTrue(os.path.exists(cache_path))
+        self.assertIs(load_ephemeris('voyager1', directory=self.tmp.name), table)
+
+        # Editing the table invalidates the compiled copy
+        with open(self.path, 'a') as f:
+            f.write("2026-01-05 00:00:00,170.0\n")
+        os.utime(self.path, ns=(os.stat(cache_path).st_mtime_ns + 10**9,) * 2)
+        updated = load_ephemeris(self.path)
+        self.assertEqual(len(updated), 4)
+        np.testing.assert_array_equal(updated.r_au(np.array(['2026-01-04'], dtype='datetime64[ns]')), [165.0])
+
+if __name__ == '__main__':
+    unittest.main()
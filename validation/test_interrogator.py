@@ -0,0 +1,115 @@
+import os
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from validation.interrogator import perform_interrogation, perform_live_interrogation, OUTPUT_FILE
+from validation.telemetry_store import convert_csv
+
+ROW = "2026-01-05 12:00:00,0.12,0,pre,1,400,-1,255,ACE/DSCOVR,0,0,BELOW\n"
+HEADER = "timestamp_utc,chi_amplitude,bt_nT\n"
+
+class TestInterrogatorInputs(unittest.TestCase):
+    """
+    INPUT RESOLUTION CERTIFICATION
+    ------------------------------
+    A directory or glob that matches nothing is missing data, and
+    incremental runs refuse several files instead of ignoring the flag.
+    A quarantine path sends malformed lines there, away from the input.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)  # The report is written to the working directory
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_empty_directory_is_missing_data(self):
+        os.mkdir('empty')
+        for data in ('empty', os.path.join('empty', '*.csv')):
+            out = io.StringIO()
+            with redirect_stdout(out), self.assertRaises(SystemExit) as exit_code:
+                perform_interrogation(data=data)
+            self.assertEqual(exit_code.exception.code, 1)
+            self.assertIn("FATAL ERROR", out.getvalue())
+            with open(OUTPUT_FILE) as f:
+                self.assertIn("FATAL ERROR", f.read())
+
+    def test_incremental_needs_one_file(self):
+        os.mkdir('feeds')
+        for name in ('a.csv', 'b.csv'):
+            with open(os.path.join('feeds', name), 'w') as f:
+                f.write(ROW)
+        with redirect_stdout(io.StringIO()), self.assertRaises(ValueError):
+            perform_interrogation(data='feeds', incremental=True)
+
+    def test_quarantine_path(self):
+        os.mkdir('feeds')
+        path = os.path.join('feeds', 'a.csv')
+        with open(path, 'w') as f:
+            f.write(HEADER + "2026-01-05 12:00:00,0.12,255\n2026-01-05 12:01:00,0.16,262\ntruncated\n")
+        for mode in ({}, {'stream': True}, {'incremental': True, 'checkpoint': 'checkpoint.json'}):
+            with redirect_stdout(io.StringIO()):
+                perform_interrogation(data=path, quarantine='rejects.csv', **mode)
+            with open('rejects.csv') as f:
+                self.assertIn('truncated', f.read())
+            os.remove('rejects.csv')
+        self.assertEqual(os.listdir('feeds'), ['a.csv'])
+
+        with open(os.path.join('feeds', 'b.csv'), 'w') as f:
+            f.write(ROW)
+        with redirect_stdout(io.StringIO()), self.assertRaises(ValueError):
+            perform_interrogation(data='feeds', quarantine='rejects.csv')
+
+class TestInterrogatorNoRows(unittest.TestCase):
+    """
+    EMPTY DATA CERTIFICATION
+    ------------------------
+    When no row survives ingestion there is no max chi, so every mode
+    must fail with a FATAL error instead of reporting a verdict.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp.name)
+        os.mkdir('feeds')
+        for name in ('a.csv', 'b.csv'):
+            with open(os.path.join('feeds', name), 'w') as f:
+                f.write(HEADER + "not-a-time,0.2,250\n,0.3,251\n")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def assert_fatal(self, run):
+        out = io.StringIO()
+        with redirect_stdout(out), self.assertRaises(SystemExit) as exit_code:
+            run()
+        self.assertEqual(exit_code.exception.code, 1)
+        self.assertIn("No valid telemetry rows", out.getvalue())
+        self.assertNotIn("VERDICT", out.getvalue())
+        with open(OUTPUT_FILE) as f:
+            self.assertIn("FATAL ERROR", f.read())
+
+    def test_every_mode(self):
+        path = os.path.join('feeds', 'a.csv')
+        self.assert_fatal(lambda: perform_interrogation(data=path))
+        self.assert_fatal(lambda: perform_interrogation(data=path, stream=True))
+        self.assert_fatal(lambda: perform_interrogation(data=path, incremental=True,
+                                                        checkpoint='checkpoint.json'))
+        self.assert_fatal(lambda: perform_interrogation(data='feeds', workers=1))
+        self.assert_fatal(lambda: perform_live_interrogation(path, idle_timeout=0.1))
+
+        # A store whose time window holds no rows
+        with open('good.csv', 'w') as f:
+            f.write(HEADER + "2026-01-05 12:00:00,0.12,255\n")
+        with redirect_stdout(io.StringIO()):
+            convert_csv('good.csv', 'store')
+        self.assert_fatal(lambda: perform_interrogation(store='store', start='2027-01-01'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import numpy as np
+import pandas as pd
+from validation.rolling_stats import RollingChiStats, rolling_chi_stats
+
+class TestRollingStats(unittest.TestCase):
+    """
+    ROLLING STATISTICS CERTIFICATION
+    --------------------------------
+    Verifies the deque / running-sum engine against pandas time-based
+    rolling windows, in batch and in streaming mode.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(150)
+        n = 3000
+        # Irregular cadence with a few multi-hour gaps
+        steps = rng.integers(20, 120, size=n)
+        steps[::700] = 5 * 3600
+        self.t = np.datetime64('2026-01-01') + np.cumsum(steps).astype('timedelta64[s]')
+        self.chi = rng.gamma(2.0, 0.08, size=n)
+        self.chi[::41] = np.nan
+        self.windows = ('30min', '1h', '6h')
+
+    def test_batch_matches_pandas(self):
+        stats = rolling_chi_stats(self.t, self.chi, self.windows)
+        series = pd.Series(self.chi, index=pd.DatetimeIndex(self.t))
+        for window in self.windows:
+            rolling = series.rolling(window)
+            np.testing.assert_array_equal(stats[f'max_{window}'], rolling.max())
+            np.testing.assert_allclose(stats[f'mean_{window}'], rolling.mean(), rtol=1e-9)
+            over = (series > 0.15).astype(float).where(series.notna())
+            np.testing.assert_allclose(stats[f'frac_{window}'], over.rolling(window).mean(), rtol=1e-9)
+
+    def test_streaming_matches_batch(self):
+        batch = rolling_chi_stats(self.t, self.chi, self.windows)
+        live = RollingChiStats(self.windows)
+        streamed = {window: [] for window in self.windows}
+        for t, chi in zip(self.t.astype('datetime64[ns]').view('int64'), self.chi):
+            for window, result in live.push(int(t), float(chi)).items():
+                streamed[window].append(result)
+        for window in self.windows:
+            peak, mean, frac = np.array(streamed[window]).T
+            np.testing.assert_array_equal(peak, batch[f'max_{window}'])
+            np.testing.assert_allclose(mean, batch[f'mean_{window}'], rtol=1e-9)
+            np.testing.assert_allclose(frac, batch[f'frac_{window}'], rtol=1e-12)
+
+    def test_unordered_rejected(self):
+        with self.assertRaises(ValueError):
+            rolling_chi_stats(self.t[::-1], self.chi)
+
+if __name__ == '__main__':
+    unittest.main()
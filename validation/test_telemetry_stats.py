@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from validation.telemetry_stats import TelemetryAggregate, classify_verdict
+from validation.telemetry_checkpoint import InterrogationCheckpoint
+
+class TestTelemetryAggregate(unittest.TestCase):
+    """
+    STREAMING INTERROGATION CERTIFICATION
+    -------------------------------------
+    Verifies that chunked running aggregates reproduce the
+    in-memory pandas statistics regardless of chunk size.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(130)
+        chi = rng.gamma(2.0, 0.08, size=1000)
+        bt = 300.0 - 40.0 * chi + rng.normal(0.0, 5.0, size=1000)
+        chi[::37] = np.nan
+        bt[::53] = np.nan
+        self.df = pd.DataFrame({'chi_amplitude': chi, 'bt_nT': bt})
+
+    def fold(self, chunksize):
+        agg = TelemetryAggregate()
+        for start in range(0, len(self.df), chunksize):
+            chunk = self.df.iloc[start:start + chunksize]
+            agg.update(chunk['chi_amplitude'].to_numpy(), chunk['bt_nT'].to_numpy())
+        return agg
+
+    def test_chunked_matches_in_memory(self):
+        chi = self.df['chi_amplitude']
+        violations = chi[chi > 0.15]
+        for chunksize in (1, 7, 250, 5000):
+            agg = self.fold(chunksize)
+            self.assertEqual(agg.n_rows, len(self.df))
+            self.assertEqual(agg.max_chi, chi.max())
+            self.assertEqual(agg.violation_count, len(violations))
+            self.assertAlmostEqual(agg.violation_mean(), violations.mean(), places=12)
+            self.assertAlmostEqual(agg.correlation(), chi.corr(self.df['bt_nT']), places=12)
+
+    def test_merge_matches_single_pass(self):
+        # Partial aggregates of disjoint parts (e.g. one per file) merge exactly
+        whole = self.fold(100)
+        merged = TelemetryAggregate()
+        for start, stop in ((0, 130), (130, 131), (131, 131), (131, 1000)):
+            part = TelemetryAggregate()
+            chunk = self.df.iloc[start:stop]
+            part.update(chunk['chi_amplitude'].to_numpy(), chunk['bt_nT'].to_numpy())
+            merged.merge(part)
+        self.assertEqual(merged.n_rows, whole.n_rows)
+        self.assertEqual(merged.max_chi, whole.max_chi)
+        self.assertEqual(merged.violation_count, whole.violation_count)
+        self.assertAlmostEqual(merged.violation_sum, whole.violation_sum, places=10)
+        self.assertAlmostEqual(merged.correlation(), whole.correlation(), places=12)
+
+    def test_empty_stream(self):
+        agg = TelemetryAggregate()
+        agg.update(np.array([]), np.array([]))
+        self.assertTrue(np.isnan(agg.max_chi))
+        self.assertTrue(np.isnan(agg.correlation()))
+        self.assertEqual(agg.violation_count, 0)
+        with self.assertRaises(ValueError):
+            classify_verdict(agg.max_chi)
+
+    def test_checkpoint_resumes_appended_rows(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            data_path = os.path.join(tmp, 'telemetry.csv')
+            checkpoint_path = os.path.join(tmp, 'checkpoint.json')
+            lines = ["timestamp_utc,chi_amplitude,phase_radians,storm_phase,density_p_cm3,speed_km_s,"
+                     "bz_nT,bt_nT,source,chi_at_boundary,chi_violation,chi_status"]
+            for i, (chi, bt) in enumerate(self.df.head(40).itertuples(index=False)):
+                lines.append(f"2026-01-05 {i // 60:02d}:{i % 60:02d}:00,{chi},0,pre,1,400,-1,{bt},ACE/DSCOVR,0,0,BELOW")
+            text = '\n'.join(lines) + '\n'
+
+            # First run sees a half-written last line, which must be deferred
+            with open(data_path, 'w') as f:
+                f.write(text[:len(text) // 2])
+            first = InterrogationCheckpoint.load(checkpoint_path, data_path)
+            first.advance(chunksize=8)
+            first.save(checkpoint_path)
+
+            with open(data_path, 'w') as f:
+                f.write(text)
+            resumed = InterrogationCheckpoint.load(checkpoint_path, data_path)
+            self.assertEqual(resumed.offset, first.offset)
+            added, _ = resumed.advance(chunksize=8)
+
+            full = InterrogationCheckpoint(data_path)
+            full.advance(chunksize=1000)
+            self.assertEqual(added + first.aggregate.n_rows, full.aggregate.n_rows)
+            self.assertEqual(resumed.aggregate.n_rows, full.aggregate.n_rows)
+            self.assertEqual(resumed.aggregate.max_chi, full.aggregate.max_chi)
+            self.assertAlmostEqual(resumed.aggregate.correlation(), full.aggregate.correlation(), places=12)
+
+            # A rewritten file invalidates the checkpoint
+            with open(data_path, 'w') as f:
+                f.write(text.replace('2026-01-05', '2026-01-06'))
+            self.assertEqual(InterrogationCheckpoint.load(checkpoint_path, data_path).offset, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from validation.telemetry_store import TelemetryStore, convert_csv
+from validation.telemetry_ingest import read_telemetry, parse_record, ROW_LAYOUTS
+
+# Two row layouts plus two lines that must be quarantined
+CSV_TEXT = """timestamp_utc,chi_amplitude,phase_radians,storm_phase,density_p_cm3,speed_km_s,bz_nT,bt_nT,source,chi_at_boundary,chi_violation,chi_status
+2026-01-01 00:44:00.000,0.1415,1.9199,pre,2.19,487.5,-1.73,257.84,ACE/DSCOVR,1,0,AT_BOUNDARY
+2026-01-01 02:55:00.000,0.15,1.3526,main,,,0.89,276.64,ACE/DSCOVR,1,0,AT_BOUNDARY
+,0.1327,4.7124,main,2.49,466.5,-2.22,280.94,,0,0,BELOW
+2026-01-30 16:24:00,1.75,-2.67,1.37,303.30,23.17,3.47,1.29,526.2,1,0,AT_BOUNDARY
+truncated,line
+"""
+
+class TestTelemetryStore(unittest.TestCase):
+    """
+    COLUMNAR STORE CERTIFICATION
+    ----------------------------
+    Verifies that CSV telemetry round-trips through the typed,
+    memory-mapped column files without loss.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.tmp.name, 'telemetry.csv')
+        with open(self.csv_path, 'w') as f:
+            f.write(CSV_TEXT)
+        self.store_dir = os.path.join(self.tmp.name, 'store')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_layout_detection(self):
+        df, report = read_telemetry(self.csv_path, chunk_rows=2)
+
+        self.assertEqual(report.layouts, {'ace_dscovr': 2, 'mag_first': 1})
+        self.assertEqual(report.quarantined, 2)
+        with open(report.quarantine_path) as f:
+            quarantined = [line.split(',')[0] for line in f.read().splitlines()[1:]]
+        self.assertEqual(quarantined, ['4', '6'])
+
+        # The magnetometer-first row lands in the canonical columns
+        jan30 = df.iloc[2]
+        self.assertEqual(jan30['bt_nT'], 303.30)
+        self.assertEqual(jan30['speed_km_s'], 526.2)
+        self.assertEqual(jan30['bx_nT'], -2.67)
+        self.assertIsNone(jan30['source'])
+        self.assertEqual(df.iloc[0]['bt_nT'], 257.84)
+        self.assertTrue(np.isnan(df.iloc[0]['bx_nT']))
+
+    def test_mixed_file_matches_records(self):
+        # CRLF endings, a second header mid-file, blanks, an over-wide line,
+        # a bad timestamp, no final newline: the reader agrees with the
+        # line-by-line parser
+        mag_header = ','.join(ROW_LAYOUTS['mag_first']['columns'])
+        lines = CSV_TEXT.splitlines()
+        lines[4:4] = ['', mag_header, 'a,b,c,d,e,f,g,h,i,j,k,l,m,n,o']
+        lines.append('2026-13-45 99:00:00,0.2,1.0,pre,2.0,400,-1,250,ACE/DSCOVR,1,0,AT_BOUNDARY')
+        with open(self.csv_path, 'w', newline='') as f:
+            f.write('\r\n'.join(lines))
+
+        for chunk_rows in (1, 3, 100):
+            df, report = read_telemetry(self.csv_path, chunk_rows=chunk_rows)
+            records = [parse_record(line) for line in lines if line]
+            expected = [record for record, _ in records if record]
+            rejected = [reason for record, reason in records if not record and reason != 'header']
+            self.assertEqual(list(df['chi_amplitude']), [r['chi_amplitude'] for r in expected])
+            self.assertEqual(list(df['source']), [r['source'] for r in expected])
+            self.assertEqual(report.quarantined, len(rejected))
+            self.assertEqual(report.lines, len(lines))
+        with open(report.quarantine_path) as f:
+            quarantined = [line.split(',')[0] for line in f.read().splitlines()[1:]]
+        self.assertEqual(sorted(quarantined, key=int), ['4', '7', '9', '10'])
+
+    def test_file_header_maps_by_name(self):
+        # A short header of its own: every row is read through it
+        with open(self.csv_path, 'w') as f:
+            f.write("timestamp_utc,chi_amplitude,bt_nT\n"
+                    "2026-01-05 00:00:00,0.1,250.0\n"
+                    "2026-01-05 00:01:00,0.3,255.5\n"
+                    "2026-01-05 00:02:00,oops,260.0\n")
+        df, report = read_telemetry(self.csv_path)
+        self.assertEqual(list(df['chi_amplitude']), [0.1, 0.3])
+        self.assertEqual(list(df['bt_nT']), [250.0, 255.5])
+        self.assertEqual(report.layouts['header'], 3)
+        self.assertEqual(report.quarantined, 1)
+
+        # A reordered 12-column header with text at positions 3 and 8 must
+        # not be read as ace_dscovr: columns follow the header's names
+        columns = ['timestamp_utc', 'bt_nT', 'phase_radians', 'source', 'density_p_cm3', 'speed_km_s',
+                   'bz_nT', 'chi_amplitude', 'storm_phase', 'chi_at_boundary', 'chi_violation', 'chi_status']
+        mag_row = CSV_TEXT.splitlines()[4]
+        with open(self.csv_path, 'w') as f:
+            f.write(','.join(columns) + "\n"
+                    "2026-01-05 00:00:00,250.0,1.2,ACE/DSCOVR,2.0,400,-1.0,0.12,pre,0,0,BELOW\n"
+                    + mag_row + "\n")
+        df, report = read_telemetry(self.csv_path)
+        self.assertEqual(report.layouts['header'], 1)
+        self.assertEqual((df.iloc[0]['chi_amplitude'], df.iloc[0]['bt_nT']), (0.12, 250.0))
+        self.assertEqual((df.iloc[0]['source'], df.iloc[0]['storm_phase']), ('ACE/DSCOVR', 'pre'))
+        # Rows that do not fit the header still fall back to the known layouts
+        self.assertEqual(report.layouts['mag_first'], 1)
+        self.assertEqual(df.iloc[1]['bt_nT'], 303.30)
+
+    def test_record_headers(self):
+        for spec in ROW_LAYOUTS.values():
+            self.assertEqual(parse_record(','.join(spec['columns']) + '\n'), (None, 'header'))
+
+    def test_round_trip(self):
+        # Tiny chunks exercise the appending column writers
+        convert_csv(self.csv_path, self.store_dir, chunksize=2)
+        store = TelemetryStore(self.store_dir)
+        df, _ = read_telemetry(self.csv_path)
+
+        self.assertEqual(len(store), 3)
+        self.assertIsInstance(store['chi_amplitude'], np.memmap)
+        np.testing.assert_array_equal(store['chi_amplitude'], df['chi_amplitude'])
+        np.testing.assert_array_equal(store['speed_km_s'], df['speed_km_s'])
+        self.assertEqual(list(store.decode('storm_phase')), ['pre', 'main', None])
+        self.assertEqual(list(store.decode('source')), ['ACE/DSCOVR', 'ACE/DSCOVR', None])
+        self.assertEqual(list(store['chi_at_boundary']), [1, 1, 1])
+        self.assertEqual(store.timestamps()[1], np.datetime64('2026-01-01T02:55:00'))
+
+    def test_time_window(self):
+        header = CSV_TEXT.splitlines()[0]
+        for minutes, expect_sorted in (([0, 1, 2, 3, 4], True), ([3, 0, 4, 1, 2], False)):
+            with open(self.csv_path, 'w') as f:
+                f.write(header + '\n')
+                for m in minutes:
+                    f.write(f"2026-01-05 12:0{m}:00,0.{m + 1},0,pre,1,400,-1,200,ACE/DSCOVR,0,0,BELOW\n")
+            convert_csv(self.csv_path, self.store_dir)
+            store = TelemetryStore(self.store_dir)
+            self.assertEqual(store.manifest['time_index']['sorted'], expect_sorted)
+
+            window = store.load_window('2026-01-05 12:01', '2026-01-05 12:04',
+                                       ['timestamp_utc', 'chi_amplitude'])
+            self.assertEqual(list(window['chi_amplitude']), [0.2, 0.3, 0.4])
+            self.assertEqual(window['timestamp_utc'].iloc[0], np.datetime64('2026-01-05T12:01'))
+            self.assertEqual(len(store.load_window(end='2026-01-05 12:00')), 0)
+            self.assertEqual(len(store.load_window(start='2026-01-05 12:03')), 2)
+
+if __name__ == '__main__':
+    unittest.main()
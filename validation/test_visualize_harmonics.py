@@ -0,0 +1,89 @@
+import unittest
+import numpy as np
+import pandas as pd
+from validation.visualize_harmonics import envelope, transition_labels, curated_series, MAX_ANNOTATIONS
+from validation.harmonic_modes import mode_segments
+
+class TestEnvelope(unittest.TestCase):
+    """
+    CHART DOWNSAMPLING CERTIFICATION
+    --------------------------------
+    The min/max envelope must keep every bucket's extremes (so no spike
+    disappears from the evidence chart) and cap the points drawn.
+    """
+
+    def setUp(self):
+        rng = np.random.default_rng(2026)
+        n = 50_000
+        # Irregular sampling with a gap, background noise, isolated spikes and dropouts
+        steps = rng.integers(30, 90, n).astype('timedelta64[s]')
+        steps[20_000] = np.timedelta64(2, 'D')
+        self.timestamps = np.datetime64('2026-01-01T00:00', 'ns') + np.cumsum(steps)
+        self.chi = rng.gamma(2.0, 0.05, n)
+        self.chi[rng.choice(n, 25, replace=False)] = rng.uniform(1.0, 3.0, 25)
+        self.chi[rng.choice(n, 100, replace=False)] = np.nan
+
+    def test_keeps_bucket_extremes(self):
+        width = 300
+        plot_t, plot_chi = envelope(self.timestamps, self.chi, width)
+        self.assertLessEqual(len(plot_t), 2 * width)
+        self.assertTrue(np.all(np.diff(plot_t.view('int64')) >= 0))
+        self.assertFalse(np.isnan(plot_chi).any())
+
+        # Every bucket's min and max survive, at their own timestamps
+        present = ~np.isnan(self.chi)
+        t = self.timestamps[present].view('int64')
+        bins = ((t - t[0]) * (width / (t[-1] - t[0]))).astype(np.int64).clip(0, width - 1)
+        kept = set(zip(plot_t.view('int64').tolist(), plot_chi.tolist()))
+        samples = pd.DataFrame({'t': t, 'chi': self.chi[present], 'bin': bins})
+        for _, bucket in samples.groupby('bin'):
+            for row in (bucket['chi'].idxmin(), bucket['chi'].idxmax()):
+                self.assertIn((int(samples.at[row, 't']), samples.at[row, 'chi']), kept)
+        self.assertEqual(plot_chi.max(), np.nanmax(self.chi))
+        self.assertEqual(plot_chi.min(), np.nanmin(self.chi))
+
+    def test_small_series_unchanged(self):
+        timestamps, chi = curated_series()
+        plot_t, plot_chi = envelope(timestamps, chi, 100)
+        np.testing.assert_array_equal(plot_t, timestamps)
+        np.testing.assert_array_equal(plot_chi, chi)
+
+class TestTransitionLabels(unittest.TestCase):
+    """Mode labels: every step of a short ladder, at most MAX_ANNOTATIONS of a noisy one."""
+
+    def test_short_ladder_fully_labelled(self):
+        ladder = mode_segments(*curated_series())
+        labels = transition_labels(ladder)
+        pd.testing.assert_frame_equal(labels, ladder)
+        modes = labels['harmonic_mode'].to_numpy()
+        self.assertTrue(np.all(modes[1:] != modes[:-1]))  # One label per transition
+
+    def test_noisy_ladder_capped(self):
+        rng = np.random.default_rng(7)
+        n = 20_000
+        timestamps = np.datetime64('2026-01-01T00:00', 'ns') + np.arange(n) * np.timedelta64(1, 'm')
+        # A slow swell through several rungs, noisy enough to flip modes at every crossing
+        swell = 0.5 + 0.45 * np.sin(np.linspace(0.0, 6 * np.pi, n))
+        chi = np.clip(swell + rng.normal(0.0, 0.05, n), 0.0, None)
+        ladder = mode_segments(timestamps, chi)
+        self.assertGreater(len(ladder), MAX_ANNOTATIONS)
+
+        labels = transition_labels(ladder)
+        self.assertLessEqual(len(labels), MAX_ANNOTATIONS)
+        self.assertGreater(len(labels), 1)
+        modes = labels['harmonic_mode'].to_numpy()
+        self.assertTrue(np.all(modes[1:] != modes[:-1]))
+        self.assertTrue(np.all(np.diff(labels['timestamp'].to_numpy().view('int64')) > 0))
+        # Each label is a real ladder step: the tallest of its time bin
+        self.assertTrue(set(labels.index) <= set(ladder.index))
+        t = ladder['timestamp'].to_numpy().view('int64')
+        bins = ((t - t[0]) * (MAX_ANNOTATIONS / (t[-1] - t[0]))).astype(np.int64).clip(0, MAX_ANNOTATIONS - 1)
+        bin_peaks = ladder.groupby(bins)['max_chi'].max()
+        for row in labels.index:
+            self.assertEqual(ladder.at[row, 'max_chi'], bin_peaks[bins[ladder.index.get_loc(row)]])
+        self.assertEqual(labels['harmonic_mode'].max(), ladder['harmonic_mode'].max())
+
+        self.assertLessEqual(len(transition_labels(ladder, limit=5)), 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 import numpy as np
-from x_boundary_validation import ImperialLatticeValidator
+from validation.x_boundary_validation import ImperialLatticeValidator
 
 class TestImperialGeometry(unittest.TestCase):
     """
@@ -70,6 +70,41 @@ class TestImperialGeometry(unittest.TestCase):
         self.assertTrue(result['chi'] > 0.15)
         self.assertEqual(result['status'], "LATTICE_STRESS")
 
+    def test_batch_matches_scalar(self):
+        """
+        CASE 5: BATCH AUDIT
+        The vectorized path must reproduce the scalar path bit for bit.
+        """
+        rng = np.random.default_rng(2026)
+        b_xyz = rng.normal(0.0, 4.0, size=(500, 3))
+        r_au = rng.uniform(0.5, 45.0, size=500)
+        r_au[:3] = (0.0, -1.0, 1.0)  # Non-physical r falls back to 1 AU
+
+        batch = self.validator.validate_batch(b_xyz, r_au)
+
+        for i in range(len(b_xyz)):
+            b_vector = tuple(b_xyz[i])
+            chi = self.validator.calculate_chi_3d(b_vector, r_au[i])
+            point = self.validator.validate_data_point(b_vector, r_au[i])
+            self.assertEqual(batch['chi'][i], chi)
+            self.assertEqual(batch['tension_baseline'][i],
+                             self.validator.calculate_geometric_tension(r_au[i]))
+            self.assertEqual(self.validator.STATUS_LABELS[batch['status'][i]], point['status'])
+
+        # Scalar r and pre-computed magnitudes are accepted too
+        mags = self.validator.validate_batch(np.array([5.5, 6.5]), 1.0)
+        print(f"[TEST] Batch Check: Chi={mags['chi']} -> {mags['status']}")
+        self.assertEqual(list(mags['status']), [self.validator.STATUS_STABLE,
+                                                self.validator.STATUS_LATTICE_STRESS])
+
+        # Missing r means 1 AU on both paths
+        b_vector = (3.0, 4.0, 1.0)
+        for r_au in (None, [None, 2.0]):
+            batch = self.validator.validate_batch(np.array([b_vector, b_vector]), r_au)
+            expected = [self.validator.calculate_chi_3d(b_vector, r)
+                        for r in (r_au if isinstance(r_au, list) else [r_au, r_au])]
+            self.assertEqual(list(batch['chi']), expected)
+
 if __name__ == '__main__':
     print("--- INITIATING IMPERIAL GEOMETRY AUDIT ---")
     unittest.main()
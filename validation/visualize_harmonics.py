@@ -0,0 +1,197 @@
+"""
+IMPERIAL PHYSICS: VISUAL AFFIDAVIT GENERATOR
+Subject: Harmonic Mode Stepping (The "Ladder" Effect)
+
+Plots are downsampled to the figure's pixel width with a min/max
+envelope (every spike survives, at most two points per pixel column)
+and only mode transitions are annotated, so a month of minute data
+renders as fast as the curated sample. Per-day panels of a telemetry
+store render in parallel processes, each mapping only its own day.
+"""
+
+import os
+import sys
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+
+from validation.telemetry_stats import CHI_LIMIT
+from validation.telemetry_store import TelemetryStore, STORE_PATH, MANIFEST_FILE
+from validation.harmonic_modes import mode_segments
+
+# CONFIGURATION
+FIGSIZE = (12, 7)
+DPI = 300
+OUTPUT_FILE = "harmonic_lock_evidence.png"
+PANEL_DIR = "harmonic_panels"
+MAX_ANNOTATIONS = 40  # Mode labels per chart
+
+# 1. THE RAW DATA (Jan 22-30, 2026)
+# This is the "Fuel" from the logs you provided.
+data_stream = """
+{"timestamp": "2026-01-22T06:45:15.281094", "max_chi": 0.279, "harmonic_mode": 2}
+{"timestamp": "2026-01-23T06:03:59.414873", "max_chi": 0.442, "harmonic_mode": 4}
+{"timestamp": "2026-01-23T09:06:46.279857", "max_chi": 0.822, "harmonic_mode": 8}
+{"timestamp": "2026-01-23T12:04:43.195136", "max_chi": 0.484, "harmonic_mode": 4}
+{"timestamp": "2026-01-24T05:04:25.058715", "max_chi": 0.548, "harmonic_mode": 4}
+{"timestamp": "2026-01-25T23:03:37.435194", "max_chi": 0.506, "harmonic_mode": 4}
+{"timestamp": "2026-01-29T04:31:03.609866", "max_chi": 0.714, "harmonic_mode": 4}
+{"timestamp": "2026-01-30T06:23:33.719458", "max_chi": 0.604, "harmonic_mode": 4}
+{"timestamp": "2026-01-30T23:11:43.975361", "max_chi": 0.353, "harmonic_mode": 2}
+"""
+
+def curated_series():
+    records = [json.loads(line) for line in data_stream.strip().split('\n')]
+    df = pd.DataFrame(records)
+    df['timestamp'] = pd.to_datetime(df['timestamp']).astype('datetime64[ns]')
+    df = df.sort_values('timestamp')
+    return df['timestamp'].to_numpy(), df['max_chi'].to_numpy(dtype=float)
+
+def envelope(timestamps, chi, width):
+    """
+    Min/max envelope downsampling: the samples are split into `width`
+    equal time bins and only each bin's minimum and maximum are kept, in
+    time order. Returns (timestamps, chi) with at most 2 * width points.
+    """
+    timestamps = np.asarray(timestamps, dtype='datetime64[ns]')
+    chi = np.asarray(chi, dtype=float)
+    present = np.flatnonzero(~np.isnan(chi))
+    if len(present) <= 2 * width:
+        return timestamps[present], chi[present]
+
+    t = timestamps[present].view('int64')
+    span = max(int(t[-1] - t[0]), 1)
+    bins = ((t - t[0]) * (width / span)).astype(np.int64).clip(0, width - 1)
+
+    # Sorting by (bin, chi) puts each bin's min first and its max last
+    order = np.lexsort((chi[present], bins))
+    first = np.flatnonzero(np.diff(bins[order], prepend=-1))
+    last = np.append(first[1:] - 1, len(order) - 1)
+    keep = present[np.unique(np.concatenate((order[first], order[last])))]
+    return timestamps[keep], chi[keep]
+
+def transition_labels(ladder, limit=MAX_ANNOTATIONS):
+    """
+    Ladder steps worth a label. Noisy data can flip modes thousands of
+    times; beyond `limit` steps only the highest peak of each of `limit`
+    equal time bins is kept, and repeats of the same mode are dropped.
+    """
+    if len(ladder) <= limit:
+        return ladder
+    t = ladder['timestamp'].to_numpy().view('int64')
+    span = max(int(t[-1] - t[0]), 1)
+    bins = ((t - t[0]) * (limit / span)).astype(np.int64).clip(0, limit - 1)
+    order = np.lexsort((ladder['max_chi'].to_numpy(), bins))
+    last = np.append(np.flatnonzero(np.diff(bins[order])), len(order) - 1)
+    peaks = ladder.iloc[order[last]]
+    modes = peaks['harmonic_mode'].to_numpy()
+    return peaks[np.append(True, modes[1:] != modes[:-1])]
+
+def render_panel(timestamps, chi, filename, title, date_format='%b %d', figsize=FIGSIZE, dpi=DPI):
+    """Renders one chart: envelope-downsampled chi plus its mode transitions."""
+    ladder = transition_labels(mode_segments(timestamps, chi))
+    plot_t, plot_chi = envelope(timestamps, chi, int(figsize[0] * dpi))
+
+    # Setup Imperial Dark Theme
+    plt.style.use('dark_background')
+    fig, ax = plt.subplots(figsize=figsize)
+
+    # Plot The Stress (Max Chi)
+    marker = 'o' if len(plot_t) <= 200 else None
+    ax.plot(plot_t, plot_chi, color='#00ff9d', linewidth=2.5 if marker else 1.0,
+            marker=marker, label='Measured Vacuum Tension (Chi)')
+
+    # Plot The Governor (Limit)
+    ax.axhline(y=CHI_LIMIT, color='#ff0055', linestyle='--', linewidth=2, label='Geometric Limit (0.15)')
+
+    # Annotate Mode Transitions (at each step's peak)
+    for when, peak, mode in zip(ladder['timestamp'], ladder['max_chi'], ladder['harmonic_mode']):
+        ax.text(when, peak + 0.02, f"MODE {mode}", color='white', fontsize=9, ha='center')
+
+    # Formatting
+    ax.set_title(title, fontsize=16, color='white', pad=20)
+    ax.set_ylabel('Vacuum Tension ($\\chi$)', fontsize=12)
+    ax.grid(True, linestyle=':', alpha=0.4)
+    ax.legend()
+
+    # Format Date Axis
+    ax.xaxis.set_major_formatter(mdates.DateFormatter(date_format))
+    plt.setp(ax.get_xticklabels(), rotation=45)
+
+    # Save
+    fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return filename
+
+def _render_day(store_dir, day, out_dir, dpi):
+    """Worker: maps one day of the store and renders its panel."""
+    store = TelemetryStore(store_dir)
+    rows = store.window_rows(day, day + pd.Timedelta(days=1))
+    timestamps = np.asarray(store['timestamp_utc'][rows]).view('datetime64[ns]')
+    chi = np.asarray(store['chi_amplitude'][rows])
+    if len(chi) == 0:
+        return None
+    filename = os.path.join(out_dir, f"harmonics_{day:%Y-%m-%d}.png")
+    return render_panel(timestamps, chi, filename,
+                        f'QUANTIZED VACUUM RESISTANCE: {day:%b %d, %Y}', '%H:%M', dpi=dpi)
+
+def render_daily_panels(store_dir=STORE_PATH, out_dir=PANEL_DIR, workers=None, dpi=DPI):
+    """One panel per UTC day of the store, rendered in parallel processes."""
+    store = TelemetryStore(store_dir)
+    timestamps = store.timestamps()
+    timestamps = timestamps[~np.isnat(timestamps)]
+    if len(timestamps) == 0:
+        return []
+    days = pd.date_range(pd.Timestamp(timestamps.min()).floor('D'),
+                         pd.Timestamp(timestamps.max()).floor('D'), freq='D')
+
+    os.makedirs(out_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        panels = pool.map(_render_day, [store_dir] * len(days), days,
+                          [out_dir] * len(days), [dpi] * len(days))
+        return [p for p in panels if p]
+
+def generate_visual_affidavit(store_dir=None, filename=OUTPUT_FILE, dpi=DPI):
+    """The full-range ladder chart, from a telemetry store or the curated logs."""
+    if store_dir:
+        store = TelemetryStore(store_dir)
+        rows = store.window_rows()
+        timestamps = np.asarray(store['timestamp_utc'][rows]).view('datetime64[ns]')
+        chi = np.asarray(store['chi_amplitude'][rows])
+    else:
+        timestamps, chi = curated_series()
+    render_panel(timestamps, chi, filename,
+                 'THE CLINE CONVERGENCE: QUANTIZED VACUUM RESISTANCE', dpi=dpi)
+    print(f"✓ VISUAL AFFIDAVIT GENERATED: {filename}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Harmonic mode ladder charts")
+    parser.add_argument("--store", type=str, default=None,
+                        help=f"Chart a telemetry store (e.g. {STORE_PATH}) instead of the curated logs")
+    parser.add_argument("--daily", action="store_true",
+                        help="Also render one panel per day of the store")
+    parser.add_argument("--out-dir", type=str, default=PANEL_DIR)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--dpi", type=int, default=DPI)
+    args = parser.parse_args(argv)
+
+    if args.store and not os.path.exists(os.path.join(args.store, MANIFEST_FILE)):
+        print(f"⛔ FATAL ERROR: Telemetry store missing at '{args.store}'")
+        sys.exit(1)
+    if args.daily and not args.store:
+        parser.error("--daily requires --store")
+
+    generate_visual_affidavit(args.store, dpi=args.dpi)
+    if args.daily:
+        panels = render_daily_panels(args.store, args.out_dir, args.workers, args.dpi)
+        print(f"✓ {len(panels)} DAILY PANELS GENERATED IN: {args.out_dir}")
+
+if __name__ == "__main__":
+    main()